@@ -1,32 +1,163 @@
 import sys
 import os
 import json
+import hashlib
+import stat
+from collections import OrderedDict
 from datetime import datetime
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy,
-    QPushButton, QScrollArea, QGridLayout, QMessageBox, QLineEdit
+    QPushButton, QMessageBox, QLineEdit, QListView, QStyledItemDelegate, QStyle,
+    QStackedWidget, QComboBox
+)
+from PySide6.QtGui import (
+    QIcon, QPixmap, QImage, QPainter, QPainterPath, QColor, QCursor, QFontDatabase, QFont
+)
+from PySide6.QtCore import (
+    Qt, QSize, QRect, QRectF, QPropertyAnimation, QEasingCurve, QObject, QThread, QThreadPool, Signal,
+    QStandardPaths, QAbstractListModel, QModelIndex, QSortFilterProxyModel
 )
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor, QCursor, QFontDatabase, QFont
-from PySide6.QtCore import Qt, QSize, QPropertyAnimation, QEasingCurve
-
 
-def colorize_icon(path, color=QColor("#A259F7")):
-    pixmap = QPixmap(path)
-    if pixmap.isNull():
-        print(f"Failed to load icon: {path}")
-        return QIcon()
 
-    tinted = QPixmap(pixmap.size())
+def tint_image(image, color):
+    tinted = QImage(image.size(), QImage.Format_ARGB32_Premultiplied)
     tinted.fill(Qt.transparent)
 
     painter = QPainter(tinted)
     painter.setCompositionMode(QPainter.CompositionMode_Source)
-    painter.drawPixmap(0, 0, pixmap)
+    painter.drawImage(0, 0, image)
     painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
     painter.fillRect(tinted.rect(), color)
     painter.end()
 
-    return QIcon(tinted)
+    return tinted
+
+
+def render_image(path, tint=None, size=None, cache_dir=None):
+    """Loads `path` scaled to fit `size` and tinted with `tint`, through the disk cache in `cache_dir`.
+
+    Disk entries are keyed by the source's mtime and size as well, so edited
+    images are rendered again. Only uses QImage, so it can run on any thread.
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return QImage()
+
+    cache_path = None
+    if cache_dir:
+        key = f"{path}|{info.st_mtime_ns}|{info.st_size}|{tint}|{size}"
+        cache_path = os.path.join(cache_dir, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".png")
+        if os.path.exists(cache_path):
+            image = QImage(cache_path)
+            if not image.isNull():
+                return image
+
+    image = QImage(path)
+    if image.isNull():
+        return image
+    if size is not None:
+        image = image.scaled(size[0], size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    if tint is not None:
+        image = tint_image(image, QColor(tint))
+
+    if cache_path:
+        temp_path = f"{cache_path}.{os.getpid()}.{id(image)}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            if image.save(temp_path, "PNG"):
+                os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"Failed to cache image {path}: {e}")
+    return image
+
+
+class PixmapCache(QObject):
+    """Rendered images by (path, tint, size), kept with LRU eviction and on disk.
+
+    `get` renders on the calling thread; `request` renders on a worker thread,
+    returns None meanwhile and emits `pixmap_ready` with the path when done.
+    """
+    pixmap_ready = Signal(str)
+    _rendered = Signal(object, object, object)
+
+    def __init__(self, max_items=256, cache_dir=None):
+        super().__init__()
+        self.max_items = max_items
+        self.pixmaps = OrderedDict()
+        self.pending = {}           # key -> token of the render in flight
+        self._cache_dir = cache_dir
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(2)
+        self._rendered.connect(self._on_rendered)
+
+    @property
+    def cache_dir(self):
+        # Resolved on first use, once the application name is set
+        if self._cache_dir is None:
+            self._cache_dir = os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "pixmaps")
+        return self._cache_dir
+
+    def get(self, path, tint=None, size=None):
+        key = (path, tint, size)
+        pixmap = self._lookup(key)
+        if pixmap is None:
+            pixmap = QPixmap.fromImage(render_image(path, tint, size, self.cache_dir))
+            self._insert(key, pixmap)
+        return pixmap
+
+    def request(self, path, tint=None, size=None):
+        key = (path, tint, size)
+        pixmap = self._lookup(key)
+        if pixmap is None and key not in self.pending:
+            token = self.pending[key] = object()
+            cache_dir = self.cache_dir
+            self.pool.start(lambda: self._rendered.emit(key, token, render_image(path, tint, size, cache_dir)))
+        return pixmap
+
+    def invalidate(self, path):
+        for key in [key for key in self.pixmaps if key[0] == path]:
+            del self.pixmaps[key]
+        # Renders already in flight are of the old image; forgetting them lets
+        # the next request start a fresh one
+        for key in [key for key in self.pending if key[0] == path]:
+            del self.pending[key]
+
+    def stop(self):
+        self.pool.clear()
+        self.pool.waitForDone()
+
+    def _lookup(self, key):
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+        return pixmap
+
+    def _insert(self, key, pixmap):
+        self.pixmaps[key] = pixmap
+        self.pixmaps.move_to_end(key)
+        while len(self.pixmaps) > self.max_items:
+            self.pixmaps.popitem(last=False)
+
+    def _on_rendered(self, key, token, image):
+        if self.pending.get(key) is not token:
+            return  # invalidated while rendering
+        del self.pending[key]
+        # QPixmaps may only be created on the GUI thread
+        self._insert(key, QPixmap.fromImage(image))
+        self.pixmap_ready.emit(key[0])
+
+
+pixmap_cache = PixmapCache()
+
+
+def colorize_icon(path, color=QColor("#A259F7")):
+    pixmap = pixmap_cache.get(path, tint=color.name(QColor.HexArgb))
+    if pixmap.isNull():
+        print(f"Failed to load icon: {path}")
+        return QIcon()
+
+    return QIcon(pixmap)
 
 
 class HoverButton(QPushButton):
@@ -99,54 +230,139 @@ class HoverButton(QPushButton):
         self.click_anim.start()
 
 
-class ProjectCard(QWidget):
-    def __init__(self, project_data: dict, click_callback=None):
-        super().__init__()
-        self.project_data = project_data
-        self.click_callback = click_callback
-        self.setFixedSize(260, 140)
-        self.setCursor(Qt.PointingHandCursor)
+PROJECT_DATA_ROLE = Qt.UserRole + 1
+PROJECT_UPDATED_ROLE = Qt.UserRole + 2
+PROJECT_PREVIEW_ROLE = Qt.UserRole + 3
 
-        self.setStyleSheet("""
-            background-color: #2D033B;
-            border-radius: 12px;
-            color: #fff;
-        """)
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(0)
+def project_info_rows(project_data: dict):
+    # (background, icon, text) of the Created, Updated and Engine rows of a card
+    engine = project_data.get("engine", {})
+    return [
+        ("#A259F7", "\U0001F4C5", f"Created: {project_data.get('created', '')[:19]}"),
+        ("#A259F7", "\U0001F6E0", f"Updated: {project_data.get('updated', '')[:19]}"),
+        ("#F75990", "\U0001F9E0", f"Engine: {engine.get('type', '2D')} {engine.get('version', '0.0.0-0')}"),
+    ]
+
+
+class ProjectListModel(QAbstractListModel):
+    """Projects keyed by metadata path, updated one row at a time."""
+
+    def __init__(self, projects=None):
+        super().__init__()
+        self.paths = []
+        self.projects = {}
+        self.set_projects(projects or {})
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.paths)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self.paths[index.row()]
+        project_data = self.projects[path]
+        if role == Qt.DisplayRole:
+            return project_data.get("name", "Unnamed Project")
+        if role == Qt.ToolTipRole:
+            return os.path.dirname(path)
+        if role == PROJECT_DATA_ROLE:
+            return project_data
+        if role == PROJECT_UPDATED_ROLE:
+            return project_data.get("updated", "")
+        if role == PROJECT_PREVIEW_ROLE:
+            return project_preview_path(path)
+        return None
+
+    def set_projects(self, projects):
+        self.beginResetModel()
+        self.paths = list(projects)
+        self.projects = dict(projects)
+        self.endResetModel()
+
+    def update_project(self, path, project_data):
+        if path in self.projects:
+            self.projects[path] = project_data
+            index = self.index(self.paths.index(path))
+            self.dataChanged.emit(index, index)
+            return
+        row = len(self.paths)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.paths.append(path)
+        self.projects[path] = project_data
+        self.endInsertRows()
+
+    def preview_changed(self, preview_path):
+        path = os.path.join(os.path.dirname(preview_path), PROJECT_FILE)
+        if path in self.projects:
+            index = self.index(self.paths.index(path))
+            self.dataChanged.emit(index, index)
+
+    def remove_project(self, path):
+        if path not in self.projects:
+            return
+        row = self.paths.index(path)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.paths[row]
+        del self.projects[path]
+        self.endRemoveRows()
+
+
+class ProjectCardDelegate(QStyledItemDelegate):
+    """Paints project cards, so the grid creates no widgets per project."""
+    CARD_SIZE = QSize(260, 140)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.name_font = QFont()
+        self.name_font.setPixelSize(18)
+        self.name_font.setBold(True)
+        self.info_font = QFont()
+        self.info_font.setPixelSize(14)
+
+    def sizeHint(self, option, index):
+        return self.CARD_SIZE
+
+    def paint(self, painter, option, index):
+        project_data = index.data(PROJECT_DATA_ROLE) or {}
+        rect = QRect(option.rect.topLeft(), self.CARD_SIZE)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        # Rounded card, the info rows are clipped to its bottom corners
+        outline = QPainterPath()
+        outline.addRoundedRect(QRectF(rect), 12, 12)
+        painter.setClipPath(outline)
+        painter.fillRect(rect, QColor("#2D033B"))
+
+        # Preview thumbnail at the top right, painted once rendered in the background
+        name_rect = QRect(rect.left() + 16, rect.top() + 12, rect.width() - 32, 26)
+        thumbnail = pixmap_cache.request(index.data(PROJECT_PREVIEW_ROLE), size=THUMBNAIL_SIZE)
+        if thumbnail is not None and not thumbnail.isNull():
+            painter.drawPixmap(rect.right() - 8 - thumbnail.width(), rect.top() + 4, thumbnail)
+            name_rect.setRight(rect.right() - 16 - thumbnail.width())
 
         # Project name at the top
-        name_label = QLabel(project_data.get("name", "Unnamed Project"))
-        name_label.setStyleSheet("color: #A259F7; font-size: 18px; font-weight: bold; padding: 12px 16px 6px 16px;")
-        layout.addWidget(name_label)
+        painter.setFont(self.name_font)
+        painter.setPen(QColor("#A259F7"))
+        name = painter.fontMetrics().elidedText(index.data(Qt.DisplayRole), Qt.ElideRight, name_rect.width())
+        painter.drawText(name_rect, Qt.AlignLeft | Qt.AlignVCenter, name)
 
         # Info rows (Created, Updated, Engine)
-        info_rows = [
-            ("#A259F7", "\U0001F4C5", f"Created: {project_data.get('created', '')[:19]}"),
-            ("#A259F7", "\U0001F6E0", f"Updated: {project_data.get('updated', '')[:19]}"),
-            ("#F75990", "\U0001F9E0", f"Engine: {project_data.get('engine', {}).get('type', '2D')} {project_data.get('engine', {}).get('version', '0.0.0-0')}")
-        ]
-        for i, (bg_color, icon, text) in enumerate(info_rows):
-            info_widget = QWidget()
-            info_layout = QHBoxLayout(info_widget)
-            info_layout.setContentsMargins(16, 0 if i > 0 else 6, 16, 0)
-            info_layout.setSpacing(8)
-            info_widget.setStyleSheet(f"background: {bg_color}; border-radius: 0px;" + ("border-bottom-left-radius: 12px; border-bottom-right-radius: 12px;" if i == len(info_rows)-1 else ""))
-            icon_label = QLabel(icon)
-            icon_label.setStyleSheet("font-size: 15px; color: #fff;")
-            info_layout.addWidget(icon_label)
-            text_label = QLabel(text)
-            text_label.setStyleSheet("color: #fff; font-size: 14px;")
-            info_layout.addWidget(text_label)
-            info_layout.addStretch(1)
-            layout.addWidget(info_widget)
-
-    def mousePressEvent(self, event):
-        if self.click_callback:
-            self.click_callback(self.project_data.get("name", "Unknown"))
-        super().mousePressEvent(event)
+        top = name_rect.bottom() + 7
+        row_height = (rect.bottom() + 1 - top) // 3
+        painter.setFont(self.info_font)
+        painter.setPen(QColor("#fff"))
+        for i, (bg_color, icon, text) in enumerate(project_info_rows(project_data)):
+            row_rect = QRect(rect.left(), top + i * row_height, rect.width(), row_height)
+            if i == 2:
+                row_rect.setBottom(rect.bottom())
+            painter.fillRect(row_rect, QColor(bg_color))
+            painter.drawText(row_rect.adjusted(16, 0, -16, 0), Qt.AlignLeft | Qt.AlignVCenter, f"{icon}  {text}")
+
+        if option.state & QStyle.State_MouseOver:
+            painter.fillRect(rect, QColor(255, 255, 255, 20))
+        painter.restore()
 
 
 class Sidebar(QWidget):
@@ -190,6 +406,156 @@ class Sidebar(QWidget):
         layout.addStretch(1)
 
 
+PROJECT_FILE = ".vortexproject"
+# Optional image in a project folder, shown as a thumbnail on its card
+PROJECT_PREVIEW = "preview.png"
+THUMBNAIL_SIZE = (64, 36)
+PROJECT_INDEX_VERSION = 1
+# (label, role, order) of the project grid sort options
+PROJECT_SORTS = [
+    ("Name", Qt.DisplayRole, Qt.AscendingOrder),
+    ("Recently updated", PROJECT_UPDATED_ROLE, Qt.DescendingOrder),
+]
+
+
+def project_preview_path(metadata_path):
+    return os.path.join(os.path.dirname(metadata_path), PROJECT_PREVIEW)
+
+
+class ProjectScanner(QThread):
+    """Rescans the projects folder off the GUI thread.
+
+    A project's metadata is only read again when its mtime or size differs
+    from the cached entry; results are emitted as they are found.
+    """
+    project_found = Signal(str, object)
+    project_removed = Signal(str)
+    scanned = Signal(object)
+
+    def __init__(self, projects_dir, entries):
+        super().__init__()
+        self.projects_dir = projects_dir
+        self.entries = dict(entries)
+
+    def run(self):
+        try:
+            folders = sorted(os.listdir(self.projects_dir))
+        except OSError as e:
+            # Keep the cached projects while the folder is unreachable
+            print(f"Projects folder not available at {self.projects_dir}: {e}")
+            return
+
+        entries = {}
+        for folder in folders:
+            if self.isInterruptionRequested():
+                return
+            metadata_path = os.path.join(self.projects_dir, folder, PROJECT_FILE)
+            try:
+                info = os.stat(metadata_path)
+            except OSError:
+                continue
+            if not stat.S_ISREG(info.st_mode):
+                continue
+
+            cached = self.entries.get(metadata_path)
+            if cached and cached["mtime_ns"] == info.st_mtime_ns and cached["size"] == info.st_size:
+                entries[metadata_path] = cached
+                continue
+            try:
+                with open(metadata_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"Failed to load project {folder}: {e}")
+                continue
+            entries[metadata_path] = {"mtime_ns": info.st_mtime_ns, "size": info.st_size, "data": data}
+            self.project_found.emit(metadata_path, entries[metadata_path])
+
+        for metadata_path in sorted(self.entries.keys() - entries.keys()):
+            self.project_removed.emit(metadata_path)
+        self.scanned.emit(entries)
+
+
+class ProjectIndex(QObject):
+    """Projects of a folder, cached on disk and revalidated by a ProjectScanner.
+
+    `projects` maps each project's metadata path to its data and is usable as
+    soon as the index is created; `refresh()` starts a background rescan.
+    """
+    project_updated = Signal(str, object)
+    project_removed = Signal(str)
+    scan_finished = Signal()
+
+    def __init__(self, projects_dir, cache_dir=None):
+        super().__init__()
+        self.projects_dir = projects_dir
+        cache_dir = cache_dir or QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        key = hashlib.sha1(projects_dir.encode("utf-8")).hexdigest()[:16]
+        self.cache_path = os.path.join(cache_dir, f"projects-{key}.json")
+        self.entries = self._load_cache()
+        self.scanner = None
+
+    @property
+    def projects(self):
+        return {path: entry["data"] for path, entry in sorted(self.entries.items())}
+
+    @property
+    def scanning(self):
+        return self.scanner is not None
+
+    def refresh(self):
+        if self.scanner is not None:
+            return
+        self.scanner = ProjectScanner(self.projects_dir, self.entries)
+        self.scanner.project_found.connect(self._on_project_found)
+        self.scanner.project_removed.connect(self._on_project_removed)
+        self.scanner.scanned.connect(self._on_scanned)
+        self.scanner.finished.connect(self._on_scanner_finished)
+        self.scanner.start()
+
+    def stop(self):
+        if self.scanner is not None:
+            self.scanner.requestInterruption()
+            self.scanner.wait()
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if cache.get("version") != PROJECT_INDEX_VERSION or cache.get("projects_dir") != self.projects_dir:
+            return {}
+        return cache.get("projects", {})
+
+    def _save_cache(self):
+        cache = {"version": PROJECT_INDEX_VERSION, "projects_dir": self.projects_dir, "projects": self.entries}
+        temp_path = self.cache_path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError as e:
+            print(f"Failed to save project index: {e}")
+
+    def _on_project_found(self, metadata_path, entry):
+        self.entries[metadata_path] = entry
+        self.project_updated.emit(metadata_path, entry["data"])
+
+    def _on_project_removed(self, metadata_path):
+        self.entries.pop(metadata_path, None)
+        self.project_removed.emit(metadata_path)
+
+    def _on_scanned(self, entries):
+        self.entries = entries
+        self._save_cache()
+
+    def _on_scanner_finished(self):
+        self.scanner.deleteLater()
+        self.scanner = None
+        self.scan_finished.emit()
+
+
 class MainWindow(QWidget):
     def __init__(self):
         super().__init__()
@@ -236,16 +602,47 @@ class MainWindow(QWidget):
         main_layout.addWidget(sidebar)
 
         self.content_widget = None
+        self.projects_stack = None
         self.logo_path = logo_path
         self.projects_dir = os.path.abspath("projects")
 
+        # Shown from the cache right away, updated as the background scan reports changes
+        self.project_index = ProjectIndex(self.projects_dir)
+        self.project_model = ProjectListModel(self.project_index.projects)
+        self.project_index.project_updated.connect(self.project_model.update_project)
+        self.project_index.project_removed.connect(self.project_model.remove_project)
+        self.project_index.scan_finished.connect(self.update_projects_page)
+        self.project_model.rowsInserted.connect(self.update_projects_page)
+        self.project_model.rowsRemoved.connect(self.update_projects_page)
+        self.project_model.modelReset.connect(self.update_projects_page)
+        # A changed project may come with a new preview
+        self.project_index.project_updated.connect(
+            lambda path, project_data: pixmap_cache.invalidate(project_preview_path(path))
+        )
+        pixmap_cache.pixmap_ready.connect(self.project_model.preview_changed)
+
+        # Filtering and sorting happen in the proxy, the model is never rebuilt
+        self.project_proxy = QSortFilterProxyModel(self)
+        self.project_proxy.setSourceModel(self.project_model)
+        self.project_proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+        self.project_proxy.setSortCaseSensitivity(Qt.CaseInsensitive)
+        self.project_proxy.setDynamicSortFilter(True)
+        self.project_sort = 0
+        self.sort_projects(self.project_sort)
+
         self.show_welcome()
 
+    def closeEvent(self, event):
+        self.project_index.stop()
+        pixmap_cache.stop()
+        super().closeEvent(event)
+
     def clear_content(self):
         if self.content_widget is not None:
             self.main_layout.removeWidget(self.content_widget)
             self.content_widget.deleteLater()
             self.content_widget = None
+            self.projects_stack = None
 
     def open_project(self, project_name):
         QMessageBox.information(self, "Project Clicked", f"You clicked project:\n{project_name}")
@@ -269,8 +666,7 @@ class MainWindow(QWidget):
         welcome_layout.setContentsMargins(0, 0, 0, 0)
         welcome_layout.setSpacing(20)
 
-        pixmap = QPixmap(self.logo_path)
-        pixmap = pixmap.scaled(96, 96, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        pixmap = pixmap_cache.get(self.logo_path, size=(96, 96))
         pic_label = QLabel()
         pic_label.setPixmap(pixmap)
         pic_label.setAlignment(Qt.AlignCenter)
@@ -299,105 +695,131 @@ class MainWindow(QWidget):
         projects_header_layout.addStretch()
         vbox.addWidget(projects_header)
 
-        # Scroll area for projects
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("background: transparent; border: none;")
-
-        projects_container = QWidget()
-        projects_layout = QGridLayout(projects_container)
-        projects_layout.setContentsMargins(0, 0, 0, 0)
-        projects_layout.setSpacing(24)
-
-        # Load projects from folder
-        # Load project data from .vortexproject file
-        projects = []
-        if os.path.exists(self.projects_dir):
-            for folder in sorted(os.listdir(self.projects_dir)):
-                project_path = os.path.join(self.projects_dir, folder)
-                metadata_path = os.path.join(project_path, ".vortexproject")
-                if os.path.isdir(project_path) and os.path.isfile(metadata_path):
-                    try:
-                        with open(metadata_path, "r", encoding="utf-8") as f:
-                            data = json.load(f)
-                            projects.append(data)
-                    except Exception as e:
-                        print(f"Failed to load project {folder}: {e}")
-        else:
-            print(f"Projects folder not found at {self.projects_dir}")
-
-        if not projects:
-            # Improved empty state
-            empty_widget = QWidget()
-            empty_layout = QVBoxLayout(empty_widget)
-            empty_layout.setAlignment(Qt.AlignCenter)
-            empty_icon = QLabel()
-            empty_icon.setPixmap(QPixmap(os.path.join("Resources", "Icons", "plus-solid.png")).scaled(64, 64, Qt.KeepAspectRatio, Qt.SmoothTransformation))
-            empty_icon.setAlignment(Qt.AlignCenter)
-            empty_layout.addWidget(empty_icon)
-            no_proj_label = QLabel("No projects found. Start by creating a new project!")
-            no_proj_label.setStyleSheet("color: #A259F7; font-size: 20px; font-style: italic;")
-            no_proj_label.setAlignment(Qt.AlignCenter)
-            empty_layout.addWidget(no_proj_label)
-            create_btn = HoverButton("Create New Project")
-            create_btn.setFixedWidth(200)
-            create_btn.setStyleSheet("""
-                QPushButton {
-                    background: #A259F7;
-                    border: none;
-                    border-radius: 10px;
-                    color: white;
-                    font-size: 18px;
-                    font-weight: bold;
-                    padding: 10px 0;
-                }
-                QPushButton:hover {
-                    background: #8e44ad;
-                }
-            """)
-            create_btn.clicked.connect(self.show_create_project)
-            empty_layout.addWidget(create_btn)
-            vbox.addWidget(empty_widget)
-        else:
-            columns = 2
-            row = 0
-            col = 0
-            # Add a 'New Project' card at the start
-            new_proj_card = HoverButton()
-            new_proj_card.setFixedSize(260, 160)
-            new_proj_card.setStyleSheet("""
-                QPushButton {
-                    background: #232136;
-                    border: 2px dashed #A259F7;
-                    border-radius: 12px;
-                    color: #A259F7;
-                    font-size: 18px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background: #2D033B;
-                }
-            """)
-            new_proj_card.setText("+ New Project")
-            new_proj_card.clicked.connect(self.show_create_project)
-            projects_layout.addWidget(new_proj_card, row, col)
-            col += 1
-            for project_data in projects:
-                card = ProjectCard(project_data, click_callback=self.open_project)
-                projects_layout.addWidget(card, row, col)
-                col += 1
-                if col >= columns:
-                    col = 0
-                    row += 1
-
-            scroll.setWidget(projects_container)
-            scroll.setFixedHeight(400)
-            vbox.addWidget(scroll)
+        # Loading, empty state and project grid pages
+        self.projects_stack = QStackedWidget()
+
+        loading_label = QLabel("Looking for projects...")
+        loading_label.setStyleSheet("color: #CCCCCC; font-size: 16px;")
+        loading_label.setAlignment(Qt.AlignCenter)
+        self.projects_stack.addWidget(loading_label)
+
+        # Improved empty state
+        empty_widget = QWidget()
+        empty_layout = QVBoxLayout(empty_widget)
+        empty_layout.setAlignment(Qt.AlignCenter)
+        empty_icon = QLabel()
+        empty_icon.setPixmap(pixmap_cache.get(os.path.abspath(os.path.join("Resources", "Icons", "plus-solid.png")), size=(64, 64)))
+        empty_icon.setAlignment(Qt.AlignCenter)
+        empty_layout.addWidget(empty_icon)
+        no_proj_label = QLabel("No projects found. Start by creating a new project!")
+        no_proj_label.setStyleSheet("color: #A259F7; font-size: 20px; font-style: italic;")
+        no_proj_label.setAlignment(Qt.AlignCenter)
+        empty_layout.addWidget(no_proj_label)
+        create_btn = HoverButton("Create New Project")
+        create_btn.setFixedWidth(200)
+        create_btn.setStyleSheet("""
+            QPushButton {
+                background: #A259F7;
+                border: none;
+                border-radius: 10px;
+                color: white;
+                font-size: 18px;
+                font-weight: bold;
+                padding: 10px 0;
+            }
+            QPushButton:hover {
+                background: #8e44ad;
+            }
+        """)
+        create_btn.clicked.connect(self.show_create_project)
+        empty_layout.addWidget(create_btn)
+        self.projects_stack.addWidget(empty_widget)
 
+        self.projects_stack.addWidget(self.create_projects_grid())
+        vbox.addWidget(self.projects_stack, 1)
 
         self.content_widget = container
         self.main_layout.addWidget(self.content_widget, 1)
 
+        self.update_projects_page()
+        self.project_index.refresh()
+
+    def create_projects_grid(self):
+        grid_page = QWidget()
+        grid_layout = QVBoxLayout(grid_page)
+        grid_layout.setContentsMargins(0, 0, 0, 0)
+        grid_layout.setSpacing(16)
+
+        toolbar = QHBoxLayout()
+        toolbar.setSpacing(12)
+        new_proj_button = HoverButton("+ New Project")
+        new_proj_button.setFixedSize(160, 40)
+        new_proj_button.setStyleSheet("""
+            QPushButton {
+                background: #232136;
+                border: 2px dashed #A259F7;
+                border-radius: 12px;
+                color: #A259F7;
+                font-size: 16px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background: #2D033B;
+            }
+        """)
+        new_proj_button.clicked.connect(self.show_create_project)
+        toolbar.addWidget(new_proj_button)
+
+        search = QLineEdit()
+        search.setPlaceholderText("Search projects...")
+        search.textChanged.connect(self.project_proxy.setFilterFixedString)
+        self.project_proxy.setFilterFixedString("")
+        toolbar.addWidget(search, 1)
+
+        sort = QComboBox()
+        sort.addItems([label for label, _, _ in PROJECT_SORTS])
+        sort.setCurrentIndex(self.project_sort)
+        sort.currentIndexChanged.connect(self.sort_projects)
+        sort.setStyleSheet("background: #232136; color: #A259F7; font-size: 14px; padding: 6px 10px;")
+        toolbar.addWidget(sort)
+        grid_layout.addLayout(toolbar)
+
+        # Only visible cards are painted; scrolling just repaints the viewport
+        view = QListView()
+        view.setModel(self.project_proxy)
+        view.setItemDelegate(ProjectCardDelegate(view))
+        view.setViewMode(QListView.IconMode)
+        view.setMovement(QListView.Static)
+        view.setResizeMode(QListView.Adjust)
+        view.setUniformItemSizes(True)
+        view.setGridSize(ProjectCardDelegate.CARD_SIZE + QSize(24, 24))
+        view.setLayoutMode(QListView.Batched)
+        view.setBatchSize(100)
+        view.setVerticalScrollMode(QListView.ScrollPerPixel)
+        view.setSelectionMode(QListView.NoSelection)
+        view.setMouseTracking(True)
+        view.viewport().setCursor(Qt.PointingHandCursor)
+        view.setStyleSheet("background: transparent; border: none;")
+        view.clicked.connect(lambda index: self.open_project(index.data(Qt.DisplayRole)))
+        grid_layout.addWidget(view, 1)
+        return grid_page
+
+    def update_projects_page(self, *args):
+        if self.projects_stack is None:
+            return
+        if self.project_model.rowCount():
+            self.projects_stack.setCurrentIndex(2)
+        elif self.project_index.scanning:
+            self.projects_stack.setCurrentIndex(0)
+        else:
+            self.projects_stack.setCurrentIndex(1)
+
+    def sort_projects(self, sort_index):
+        self.project_sort = sort_index
+        _, role, order = PROJECT_SORTS[sort_index]
+        self.project_proxy.setSortRole(role)
+        self.project_proxy.sort(0, order)
+
     def show_create_project(self):
         self.clear_content()
 
@@ -469,7 +891,7 @@ class MainWindow(QWidget):
                     "type": "2D"
                 }
             }
-            metadata_path = os.path.join(project_path, ".vortexproject")
+            metadata_path = os.path.join(project_path, PROJECT_FILE)
             with open(metadata_path, "w", encoding="utf-8") as f:
                 json.dump(metadata, f, indent=2)
 
@@ -481,6 +903,8 @@ class MainWindow(QWidget):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    # Names the cache folder used by ProjectIndex and PixmapCache
+    app.setApplicationName("Vortex")
 
     # Load Inter font from Resources/Inter.ttc
     font_path = os.path.abspath(os.path.join("Resources", "Inter.ttc"))
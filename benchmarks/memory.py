@@ -0,0 +1,127 @@
+"""Bytes per entity of the ECS, measured with tracemalloc.
+
+Run from the repository root:
+
+    python benchmarks/memory.py --entities 100000
+    python benchmarks/memory.py --entities 50000 --save benchmarks/memory_baseline.json
+    python benchmarks/memory.py --entities 50000 --compare benchmarks/memory_baseline.json
+
+With --compare, exits with status 1 if any size grew over the baseline by
+more than the threshold.
+"""
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ecs.Components.Color import Color
+from ecs.Components.Primitives import Box2D
+from ecs.Components.Size import Size2D
+from ecs.Components.Transform import Transform2D
+from ecs.Components.Vector import Vector2D
+from ecs.Manager import ECSManager
+from run import environment
+
+# Component name -> factory, one of each per entity
+COMPONENTS = {
+    "Transform2D": lambda i: Transform2D(i, i),
+    "Color": lambda i: Color((i % 256, 0, 0)),
+    "Vector2D": lambda i: Vector2D(1.0, 0.0),
+    "Size2D": lambda i: Size2D(32, 32),
+    "Box2D": lambda i: Box2D((i, i), (i + 32, i + 32)),
+}
+
+def allocated(build) -> int:
+    # Bytes still allocated after build() returns, kept alive by its result
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+def build_world(entities: int, storage: str) -> ECSManager:
+    manager = ECSManager(storage)
+    for i in range(entities):
+        entity = manager.create_enitity()
+        for factory in COMPONENTS.values():
+            manager.add_component(entity, factory(i))
+    return manager
+
+def measure(entities: int, storage: str) -> dict:
+    world = allocated(lambda: build_world(entities, storage))
+    components = {
+        name: allocated(lambda: [factory(i) for i in range(entities)]) / entities
+        for name, factory in COMPONENTS.items()
+    }
+    return {
+        "storage": storage,
+        "entities": entities,
+        "bytes_per_entity": world / entities,
+        "bytes_per_component": components,
+    }
+
+def sizes(result) -> dict:
+    # Flat name -> bytes, the rows compared against a baseline
+    return {"entity": result["bytes_per_entity"]} | result["bytes_per_component"]
+
+def compare(results, baseline, threshold) -> list:
+    """(storage, name, baseline bytes, current bytes, ratio, status) for sizes in both."""
+    rows = []
+    for storage, result in results.items():
+        if storage not in baseline:
+            continue
+        before_sizes = sizes(baseline[storage])
+        for name, after in sizes(result).items():
+            if name not in before_sizes:
+                continue
+            before = before_sizes[name]
+            ratio = after / before if before else float("inf")
+            if ratio > 1 + threshold:
+                status = "larger"
+            elif ratio < 1 - threshold:
+                status = "smaller"
+            else:
+                status = ""
+            rows.append((storage, name, before, after, ratio, status))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=100_000)
+    parser.add_argument("--storage", nargs="+", choices=("dict", "archetype"), default=["dict"])
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.05, help="allowed growth, 0.05 is 5%%")
+    args = parser.parse_args()
+
+    results = {}
+    for storage in args.storage:
+        result = results[storage] = measure(args.entities, storage)
+        print(f"{result['entities']} entities, {storage} storage: {result['bytes_per_entity']:.0f} bytes per entity")
+        for name, size in result["bytes_per_component"].items():
+            print(f"  {name:<12} {size:8.0f} bytes")
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print(f"\nCompared to {args.compare} (commit {baseline['environment'].get('commit')}):")
+        rows = compare(results, baseline["results"], args.threshold)
+        for storage, name, before, after, ratio, status in rows:
+            print(f"{storage:<10} {name:<12} {before:8.0f} -> {after:8.0f} bytes {ratio:6.2f}x {status}")
+        counts = {result["entities"] for result in baseline["results"].values()}
+        if counts != {args.entities}:
+            print(f"Note: the baseline measured {', '.join(map(str, sorted(counts)))} entities.")
+        if any(status == "larger" for *_, status in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""Timing benchmarks for the ECS, transform and geometry hot paths.
+
+Run from the repository root:
+
+    python benchmarks/run.py                              # run everything, print a table
+    python benchmarks/run.py --filter query --quick
+    python benchmarks/run.py --save benchmarks/baseline.json
+    python benchmarks/run.py --compare benchmarks/baseline.json --threshold 0.1
+
+With --compare, exits with status 1 if any benchmark got slower than the
+baseline by more than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import numpy as np
+from ecs.Components.Color import Color
+from ecs.Components.Primitives import Box2D, Circle2D, Polygon2D, Triangle2D
+from ecs.Components.Size import Size2D
+from ecs.Components.Transform import Transform2D
+from ecs.Components.Vector import Vector2D
+from ecs.Manager import ECSManager
+
+# name -> (factory, fresh); factory(**params) does the setup and returns the timed callable.
+# Fresh benchmarks change their state, so the factory runs again before every call.
+BENCHMARKS = {}
+
+def benchmark(name, fresh=False, **grid):
+    """Registers one benchmark per combination of the `grid` parameter values."""
+    def register(factory):
+        combinations = [{}]
+        for key, values in grid.items():
+            combinations = [dict(c, **{key: value}) for c in combinations for value in values]
+        for params in combinations:
+            label = name + "".join(f"[{key}={value}]" for key, value in params.items())
+            BENCHMARKS[label] = (lambda params=params: factory(**params), fresh)
+        return factory
+    return register
+
+def _world(entities, storage, component_mix):
+    # Entity i gets the components whose bit is set in component_mix[i % len(component_mix)]
+    manager = ECSManager(storage)
+    factories = (
+        lambda i: Transform2D(i, i),
+        lambda i: Vector2D(1.0, 0.0),
+        lambda i: Size2D(32, 32),
+        lambda i: Color((i % 256, 0, 0)),
+    )
+    handles = []
+    for i in range(entities):
+        entity = manager.create_enitity()
+        mask = component_mix[i % len(component_mix)]
+        for bit, factory in enumerate(factories):
+            if mask & (1 << bit):
+                manager.add_component(entity, factory(i))
+        handles.append(entity)
+    return manager, handles
+
+# Component mixes: every entity has Transform2D + Vector2D, or only a quarter of them do
+MIXES = {
+    "all": (0b0011,),
+    "quarter": (0b0011, 0b0001, 0b0110, 0b1101),
+}
+
+@benchmark("entity.create", fresh=True, n=(1_000, 10_000), storage=("dict", "archetype"))
+def entity_create(n, storage):
+    manager = ECSManager(storage)
+    return lambda: [manager.create_enitity() for _ in range(n)]
+
+@benchmark("entity.spawn", fresh=True, n=(1_000, 10_000), storage=("dict", "archetype"))
+def entity_spawn(n, storage):
+    manager = ECSManager(storage)
+    template = [Transform2D(0, 0), Vector2D(1.0, 0.0)]
+    return lambda: manager.spawn(n, template)
+
+@benchmark("component.add", fresh=True, n=(1_000, 10_000), storage=("dict", "archetype"))
+def component_add(n, storage):
+    manager = ECSManager(storage)
+    entities = [manager.create_enitity() for _ in range(n)]
+    transforms = [Transform2D(i, i) for i in range(n)]
+    vectors = [Vector2D(1.0, 0.0) for _ in range(n)]
+
+    def run():
+        for entity, transform, vector in zip(entities, transforms, vectors):
+            manager.add_component(entity, transform)
+            manager.add_component(entity, vector)
+    return run
+
+@benchmark("component.get", n=(1_000, 10_000), storage=("dict", "archetype"))
+def component_get(n, storage):
+    manager, entities = _world(n, storage, MIXES["all"])
+    get = manager.get_component
+    return lambda: [get(entity, Transform2D) for entity in entities]
+
+@benchmark("query", n=(1_000, 10_000), storage=("dict", "archetype"), mix=tuple(MIXES))
+def query(n, storage, mix):
+    manager, _ = _world(n, storage, MIXES[mix])
+    return lambda: manager.get_entities_with_components(Transform2D, Vector2D)
+
+@benchmark("transform.matrix", cached=(False, True))
+def transform_matrix(cached):
+    transform = Transform2D(10, 20, rotation=30, scale_x=2)
+    if cached:
+        return transform.get_transformation_matrix
+
+    def run():
+        # Any matrix field set drops the cached matrix
+        transform.rotation = 30
+        return transform.get_transformation_matrix()
+    return run
+
+@benchmark("transform.matrices", n=(1_000, 10_000))
+def transform_matrices(n):
+    transforms = [Transform2D(i, i, rotation=i % 360) for i in range(n)]
+    return lambda: Transform2D.get_transformation_matrices(transforms)
+
+@benchmark("transform.matrices.archetype", n=(1_000, 10_000))
+def transform_matrices_archetype(n):
+    manager, _ = _world(n, "archetype", MIXES["all"])
+    # Adding components one by one leaves empty intermediate archetypes behind
+    archetype = max(manager.get_archetypes_with_components(Transform2D), key=lambda a: len(a.entities))
+    return lambda: Transform2D.get_archetype_transformation_matrices(archetype)
+
+def _shapes(n):
+    # n random triangles, also used as box corners, circle centers and polygons
+    return np.random.default_rng(0).uniform(0, 1000, size=(n, 3, 2)).tolist()
+
+@benchmark("primitive.create", n=(1_000, 10_000), shape=("box", "circle", "triangle", "polygon"))
+def primitive_create(n, shape):
+    points = _shapes(n)
+    if shape == "box":
+        return lambda: [Box2D(p[0], p[1]) for p in points]
+    if shape == "circle":
+        return lambda: [Circle2D(p[0], 10.0) for p in points]
+    if shape == "triangle":
+        return lambda: [Triangle2D(*p) for p in points]
+    return lambda: [Polygon2D(p) for p in points]
+
+@benchmark("primitive.create_many", n=(1_000, 10_000), shape=("box", "circle", "triangle", "polygon"))
+def primitive_create_many(n, shape):
+    points = _shapes(n)
+    if shape == "box":
+        return lambda: Box2D.create_many([p[0] for p in points], [p[1] for p in points])
+    if shape == "circle":
+        return lambda: Circle2D.create_many([p[0] for p in points], [10.0] * n)
+    if shape == "triangle":
+        return lambda: Triangle2D.create_many(points)
+    return lambda: Polygon2D.create_many(points)
+
+
+def measure(factory, fresh, repeat, min_time) -> dict:
+    """Best and median seconds per call.
+
+    Calls are grouped into runs of at least `min_time` seconds, except for
+    fresh benchmarks, which are timed one call at a time.
+    """
+    if fresh:
+        times = []
+        for _ in range(repeat):
+            run = factory()
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+        number = 1
+    else:
+        run = factory()
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+            number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed * 1.2))
+        times = [elapsed / number]
+        for _ in range(repeat - 1):
+            start = time.perf_counter()
+            for _ in range(number):
+                run()
+            times.append((time.perf_counter() - start) / number)
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "number": number,
+        "repeat": repeat,
+    }
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, cwd=os.path.dirname(__file__), check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+def compare(results, baseline, threshold) -> list:
+    """(name, baseline median, current median, ratio, status) for benchmarks in both."""
+    rows = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["median_s"]
+        after = result["median_s"]
+        ratio = after / before if before else float("inf")
+        if ratio > 1 + threshold:
+            status = "slower"
+        elif ratio < 1 - threshold:
+            status = "faster"
+        else:
+            status = ""
+        rows.append((name, before, after, ratio, status))
+    return rows
+
+def _format_time(seconds) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.3f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--min-time", type=float, default=0.1, help="seconds per timed run")
+    parser.add_argument("--quick", action="store_true", help="3 repeats of at least 0.02 s")
+    parser.add_argument("--save", metavar="PATH", help="write the results as JSON")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 is 10%%")
+    parser.add_argument("--list", action="store_true", help="print the benchmark names and exit")
+    args = parser.parse_args()
+    if args.quick:
+        args.repeat, args.min_time = 3, 0.02
+
+    selected = [name for name in BENCHMARKS if args.filter in name]
+    if args.list:
+        print("\n".join(selected))
+        return
+
+    results = {}
+    for name in selected:
+        factory, fresh = BENCHMARKS[name]
+        results[name] = measure(factory, fresh, args.repeat, args.min_time)
+        print(f"{name:<60} {_format_time(results[name]['median_s'])}", flush=True)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"environment": environment(), "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        print(f"\nCompared to {args.compare} (commit {baseline['environment'].get('commit')}):")
+        rows = compare(results, baseline["results"], args.threshold)
+        for name, before, after, ratio, status in rows:
+            print(f"{name:<60} {_format_time(before)} -> {_format_time(after)} {ratio:6.2f}x {status}")
+        if any(status == "slower" for *_, status in rows):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
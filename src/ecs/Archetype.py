@@ -0,0 +1,114 @@
+import numpy as np
+
+class Archetype:
+    """Table of all entities that share exactly the same set of component types.
+
+    Components declaring `Field`s keep their values in one NumPy column per
+    field, so systems can work on whole columns instead of single objects.
+    """
+
+    def __init__(self, component_types, capacity: int = 64):
+        self.component_types = frozenset(component_types)
+        self.capacity = capacity
+        self.entities = []
+        self.rows = {}
+        self.components = {ct: [] for ct in self.component_types}
+        self.columns = {
+            ct: {name: np.zeros(capacity, dtype=field.dtype) for name, field in ct.fields.items()}
+            for ct in self.component_types
+            if ct.fields
+        }
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, entity_id):
+        return entity_id in self.rows
+
+    def add(self, entity_id, components: dict) -> int:
+        row = len(self.entities)
+        if row == self.capacity:
+            self._grow()
+        self.entities.append(entity_id)
+        self.rows[entity_id] = row
+        for component_type, component in components.items():
+            self.components[component_type].append(component)
+            columns = self.columns.get(component_type)
+            if columns is not None:
+                for name, array in columns.items():
+                    array[row] = getattr(component, name)
+                component._columns = columns
+                component._row = row
+        return row
+
+    def extend(self, entity_ids, components: dict, columns: dict) -> None:
+        """Appends many entities at once.
+
+        `components` maps each component type to its objects, in entity order;
+        `columns` maps the types with fields to {name: values}. The objects are
+        bound to the columns, their own field values are not read.
+        """
+        start = len(self.entities)
+        count = len(entity_ids)
+        while self.capacity < start + count:
+            self._grow()
+        self.entities.extend(entity_ids)
+        self.rows.update(zip(entity_ids, range(start, start + count)))
+        for component_type, objects in components.items():
+            self.components[component_type].extend(objects)
+            table = self.columns.get(component_type)
+            if table is None:
+                continue
+            for name, values in columns[component_type].items():
+                table[name][start:start + count] = values
+            for row, component in enumerate(objects, start):
+                component._columns = table
+                component._row = row
+
+    def remove(self, entity_id) -> dict:
+        row = self.rows.pop(entity_id)
+        last = len(self.entities) - 1
+        removed = {}
+        for component_type, objects in self.components.items():
+            component = objects[row]
+            columns = self.columns.get(component_type)
+            if columns is not None:
+                # Hand the values back to the component before detaching it
+                values = {name: array[row].item() for name, array in columns.items()}
+                component._columns = None
+                component._row = -1
+                fields = component_type.fields
+                for name, value in values.items():
+                    # Write the private slot: detaching is not a change of value
+                    setattr(component, fields[name].private, value)
+                if row != last:
+                    for array in columns.values():
+                        array[row] = array[last]
+                    objects[last]._row = row
+            objects[row] = objects[last]
+            objects.pop()
+            removed[component_type] = component
+        if row != last:
+            moved = self.entities[last]
+            self.entities[row] = moved
+            self.rows[moved] = row
+        self.entities.pop()
+        return removed
+
+    def entity_ids(self) -> np.ndarray:
+        return np.fromiter(self.entities, dtype=np.int64, count=len(self.entities))
+
+    def column(self, component_type, name: str) -> np.ndarray:
+        return self.columns[component_type][name][:len(self.entities)]
+
+    def get_components(self, component_type) -> list:
+        return self.components[component_type]
+
+    def _grow(self) -> None:
+        self.capacity *= 2
+        for columns in self.columns.values():
+            for name, array in columns.items():
+                grown = np.zeros(self.capacity, dtype=array.dtype)
+                grown[:len(array)] = array
+                # Replace in place so bound components see the new array
+                columns[name] = grown
@@ -0,0 +1,43 @@
+import threading
+
+class CommandBuffer:
+    """Structural changes recorded while systems run and applied later by `flush`.
+
+    Recording is thread-safe, so systems running in parallel can spawn and
+    despawn. Spawned entity handles are valid right away, but their components
+    only appear once the buffer is flushed. Commands for entities that are no
+    longer alive at the flush do nothing.
+    """
+
+    def __init__(self, manager):
+        self.manager = manager
+        self._commands = []
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._commands)
+
+    def spawn(self, count: int, template) -> list:
+        template = self.manager._check_template(template)
+        with self._lock:
+            entities = self.manager.allocator.allocate_many(count)
+            self._commands.append((self.manager._spawn_with_all, entities, template))
+        return entities
+
+    def despawn(self, entities) -> None:
+        with self._lock:
+            self._commands.append((self.manager._despawn_alive, list(entities)))
+
+    def add_component(self, entity, component) -> None:
+        with self._lock:
+            self._commands.append((self.manager._add_component_alive, entity, component))
+
+    def remove_component(self, entity, component_type) -> None:
+        with self._lock:
+            self._commands.append((self.manager._remove_component_alive, entity, component_type))
+
+    def flush(self) -> None:
+        with self._lock:
+            commands, self._commands = self._commands, []
+        for function, *args in commands:
+            function(*args)
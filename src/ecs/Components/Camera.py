@@ -0,0 +1,52 @@
+from ecs.Components.base import Component, Field
+import numpy as np
+
+class Camera2D(Component):
+    """View onto the world: (x, y) is the world point shown at the center of
+    a `viewport_width` x `viewport_height` pixel viewport, magnified by `zoom`.
+    """
+
+    __slots__ = ("_x", "_y", "_zoom", "_viewport_width", "_viewport_height")
+
+    x = Field(np.float32)
+    y = Field(np.float32)
+    zoom = Field(np.float32)
+    viewport_width = Field(np.float32)
+    viewport_height = Field(np.float32)
+
+    def __init__(self, x: float = 0, y: float = 0, viewport_width: float = 800, viewport_height: float = 600, zoom: float = 1):
+        if zoom <= 0:
+            raise ValueError("Zoom must be positive.")
+        self.x = x
+        self.y = y
+        self.zoom = zoom
+        self.viewport_width = viewport_width
+        self.viewport_height = viewport_height
+
+    @property
+    def bounds(self):
+        # Visible world region as (x_min, y_min, x_max, y_max)
+        half_width = self.viewport_width / (2 * self.zoom)
+        half_height = self.viewport_height / (2 * self.zoom)
+        return (self.x - half_width, self.y - half_height, self.x + half_width, self.y + half_height)
+
+    def get_view_matrix(self) -> np.ndarray:
+        # World to screen pixels
+        zoom = self.zoom
+        return np.array([
+            [zoom, 0.0, self.viewport_width / 2 - self.x * zoom],
+            [0.0, zoom, self.viewport_height / 2 - self.y * zoom],
+            [0.0, 0.0, 1.0]
+        ])
+
+    def world_to_screen(self, x: float, y: float):
+        return (
+            (x - self.x) * self.zoom + self.viewport_width / 2,
+            (y - self.y) * self.zoom + self.viewport_height / 2,
+        )
+
+    def screen_to_world(self, x: float, y: float):
+        return (
+            (x - self.viewport_width / 2) / self.zoom + self.x,
+            (y - self.viewport_height / 2) / self.zoom + self.y,
+        )
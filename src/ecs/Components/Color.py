@@ -1,48 +1,140 @@
-from ecs.Components.base import Component
+import sys
+from functools import lru_cache
+import numpy as np
+from ecs.Components.base import Component, TrackedField
+
+# Colors are packed into one uint32 whose bytes are r, g, b, a in memory order,
+# the layout GL expects for 4 x GL_UNSIGNED_BYTE vertex colors.
+WHITE = 0xFFFFFFFF
+BLACK = int.from_bytes(bytes((0, 0, 0, 255)), sys.byteorder)
+
+# Distinct colors remembered by each conversion cache
+CACHE_SIZE = 4096
+
+def pack_rgba(r: int, g: int, b: int, a: int = 255) -> int:
+    try:
+        return int.from_bytes(bytes((r, g, b, a)), sys.byteorder)
+    except (TypeError, ValueError):
+        raise ValueError("Color channels must be integers from 0 to 255.") from None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_hex(value: str) -> int:
+    """Packs '#RRGGBB' or '#RRGGBBAA', with or without the '#'."""
+    digits = value[1:] if value.startswith('#') else value
+    if len(digits) not in (6, 8):
+        raise ValueError("Hex string must be 6 or 8 characters.")
+    try:
+        channels = bytes.fromhex(digits)
+    except ValueError:
+        raise ValueError(f"Invalid hex color {value!r}.") from None
+    if len(channels) == 3:
+        channels += b'\xff'
+    return int.from_bytes(channels, sys.byteorder)
+
+@lru_cache(maxsize=CACHE_SIZE)
+def unpack_rgba(packed: int) -> tuple:
+    return tuple(packed.to_bytes(4, sys.byteorder))
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_hex(packed: int) -> str:
+    # Alpha is only written when the color is not opaque
+    r, g, b, a = unpack_rgba(packed)
+    if a == 255:
+        return f'#{r:02X}{g:02X}{b:02X}'
+    return f'#{r:02X}{g:02X}{b:02X}{a:02X}'
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_floats(packed: int) -> tuple:
+    return tuple(c / 255.0 for c in unpack_rgba(packed))
+
+def pack_colors(colors) -> np.ndarray:
+    """(N, 3) or (N, 4) channels in 0..255 to (N,) packed uint32 colors."""
+    colors = np.asarray(colors).reshape(len(colors), -1)
+    if colors.shape[1] not in (3, 4):
+        raise ValueError("Colors must have 3 or 4 channels.")
+    if colors.size and (colors.min() < 0 or colors.max() > 255):
+        raise ValueError("Color channels must be integers from 0 to 255.")
+    rgba = np.full((len(colors), 4), 255, dtype=np.uint8)
+    rgba[:, :colors.shape[1]] = colors
+    return rgba.view(np.uint32).ravel()
+
+def unpack_colors(packed) -> np.ndarray:
+    """(N,) packed colors to (N, 4) float32 channels in 0..1."""
+    channels = np.ascontiguousarray(packed, dtype=np.uint32).view(np.uint8).reshape(-1, 4)
+    return channels * np.float32(1 / 255)
 
 class Color(Component):
+    """RGBA color stored as a single packed uint32.
+
+    Accepts hex strings ('#RRGGBB' or '#RRGGBBAA'), RGB or RGBA sequences
+    with channels in 0..255, or another packed value. Conversions to hex and
+    floats are cached per distinct color.
+    """
+
+    __slots__ = ("_packed",)
+
+    packed = TrackedField(np.uint32)
+
     def __init__(self, value):
-        self._rgb = None
-        self._hex = None
         self.set_color(value)
 
     def set_color(self, value):
         if isinstance(value, str):
-            self.hex = value
+            self.packed = parse_hex(value)
         elif isinstance(value, (list, tuple)):
-            self.rgb = value
+            if len(value) not in (3, 4):
+                raise ValueError("RGB must be a list or tuple of three or four values.")
+            self.packed = pack_rgba(*(int(c) for c in value))
+        elif isinstance(value, Color):
+            self.packed = value.packed
         else:
             raise ValueError("Color must be a hex string or RGB list/tuple.")
 
     @property
     def rgb(self):
-        return self._rgb
+        return unpack_rgba(self.packed)[:3]
 
     @rgb.setter
     def rgb(self, value):
         if not (isinstance(value, (list, tuple)) and len(value) == 3):
             raise ValueError("RGB must be a list or tuple of three values.")
-        self._rgb = tuple(int(c) for c in value)
-        self._hex = self.rgb_to_hex(self._rgb)
+        self.packed = pack_rgba(*(int(c) for c in value), self.alpha)
+
+    @property
+    def rgba(self):
+        return unpack_rgba(self.packed)
+
+    @rgba.setter
+    def rgba(self, value):
+        if not (isinstance(value, (list, tuple)) and len(value) == 4):
+            raise ValueError("RGBA must be a list or tuple of four values.")
+        self.packed = pack_rgba(*(int(c) for c in value))
+
+    @property
+    def alpha(self) -> int:
+        return unpack_rgba(self.packed)[3]
+
+    @alpha.setter
+    def alpha(self, value):
+        self.packed = pack_rgba(*self.rgb, int(value))
 
     @property
     def hex(self):
-        return self._hex
+        return to_hex(self.packed)
 
     @hex.setter
     def hex(self, value):
         if not isinstance(value, str):
             raise ValueError("Hex must be a string.")
-        if value.startswith('#'):
-            value = value[1:]
-        if len(value) != 6:
-            raise ValueError("Hex string must be 6 characters.")
-        self._hex = '#' + value.upper()
-        self._rgb = self.hex_to_rgb(self._hex)
+        self.packed = parse_hex(value)
+
+    @property
+    def floats(self):
+        # (r, g, b, a) in 0..1, as used by OpenGL
+        return to_floats(self.packed)
 
     def rgb_to_hex(self, rgb):
-        return '#' + ''.join(f'{c:02X}' for c in rgb)
+        return to_hex(pack_rgba(*rgb))
 
     def hex_to_rgb(self, hex_str):
-        hex_str = hex_str.lstrip('#')
-        return tuple(int(hex_str[i:i+2], 16) for i in (0, 2, 4))
+        return unpack_rgba(parse_hex(hex_str))[:3]
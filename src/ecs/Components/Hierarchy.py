@@ -0,0 +1,43 @@
+from ecs.Components.base import Component, TrackedField
+import numpy as np
+
+# Value of Hierarchy.parent for root nodes
+NO_PARENT = -1
+# Value of Hierarchy.parent_generation when the parent was given as a bare id and is not checked
+ANY_GENERATION = -1
+
+class Hierarchy(Component):
+    __slots__ = ("_parent", "_parent_generation")
+
+    parent = TrackedField(np.int64)
+    parent_generation = TrackedField(np.int64)
+
+    def __init__(self, parent = None):
+        # Parent may be given as an Entity handle or a bare entity id; only handles
+        # let a destroyed parent whose id was reused be told apart
+        if parent is None:
+            self.parent = NO_PARENT
+            self.parent_generation = ANY_GENERATION
+        elif isinstance(parent, (int, np.integer)):
+            self.parent = int(parent)
+            self.parent_generation = ANY_GENERATION
+        else:
+            self.parent = parent.id
+            self.parent_generation = parent.generation
+
+    @property
+    def is_root(self) -> bool:
+        return self.parent == NO_PARENT
+
+    def get_parent(self, generations) -> int:
+        """Parent id, or NO_PARENT if the parent entity was destroyed.
+
+        `generations` is the current generation of every id, `manager.allocator.generations`.
+        """
+        parent = self.parent
+        if parent == NO_PARENT:
+            return NO_PARENT
+        generation = self.parent_generation
+        if generation != ANY_GENERATION and (parent >= len(generations) or generations[parent] != generation):
+            return NO_PARENT
+        return parent
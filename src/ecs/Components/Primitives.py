@@ -1,7 +1,52 @@
-from base import Component
+from ecs.Components.base import Component
+from ecs import Geometry
+from itertools import repeat
 import math
 
-class Box2D(Component):
+class Primitive2D(Component):
+    __slots__ = ("x_min", "x_max", "y_min", "y_max", "width", "height", "area", "middle_point")
+
+    # Every _calculate_properties call is reported as a change
+    tracked = True
+
+    @property
+    def bounds(self):
+        return (self.x_min, self.y_min, self.x_max, self.y_max)
+
+    @classmethod
+    def _from_batch(cls, properties, values):
+        """Yield (component, value) pairs for the batch results of a Geometry kernel.
+
+        Each component gets the properties _calculate_properties would set;
+        the caller stores the shape's own slots from `value` and may override
+        the computed ones; `middle_points` may be None when it sets them. The
+        results are copied into the components, which do not keep the kernel
+        arrays.
+        """
+        bounds, areas, middle_points = properties
+        columns = zip(
+            cls._new_many(len(areas)),
+            values,
+            *bounds.T.tolist(),
+            (bounds[:, 2] - bounds[:, 0]).tolist(),
+            (bounds[:, 3] - bounds[:, 1]).tolist(),
+            areas.tolist(),
+            zip(*middle_points.T.tolist()) if middle_points is not None else repeat(None),
+        )
+        for component, value, x_min, y_min, x_max, y_max, width, height, area, middle_point in columns:
+            component.x_min = x_min
+            component.y_min = y_min
+            component.x_max = x_max
+            component.y_max = y_max
+            component.width = width
+            component.height = height
+            component.area = area
+            component.middle_point = middle_point
+            yield component, value
+
+class Box2D(Primitive2D):
+    __slots__ = ("_point1", "_point2")
+
     def __init__(self, point1, point2):
         self._point1 = point1
         self._point2 = point2
@@ -16,6 +61,7 @@ class Box2D(Component):
         self.height = self.y_max - self.y_min
         self.area = self.width * self.height
         self.middle_point = ((self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2)
+        self._field_changed(None)
 
     @property
     def point1(self):
@@ -35,7 +81,20 @@ class Box2D(Component):
         self._point2 = value
         self._calculate_properties()
 
-class Polygon2D(Component):
+    @classmethod
+    def create_many(cls, points1, points2) -> list:
+        points1, points2 = list(points1), list(points2)
+        properties = Geometry.box_properties(points1, points2)
+        boxes = []
+        for box, (point1, point2) in cls._from_batch(properties, zip(points1, points2)):
+            box._point1 = point1
+            box._point2 = point2
+            boxes.append(box)
+        return boxes
+
+class Polygon2D(Primitive2D):
+    __slots__ = ("_points",)
+
     def __init__(self, points):
         self._points = points
         self._calculate_properties()
@@ -48,6 +107,7 @@ class Polygon2D(Component):
         self.height = self.y_max - self.y_min
         self.area = self._calculate_area()
         self.middle_point = ((self.x_min + self.x_max) / 2, (self.y_min + self.y_max) / 2)
+        self._field_changed(None)
 
     def _calculate_area(self):
         area = 0
@@ -67,7 +127,19 @@ class Polygon2D(Component):
         self._points = value
         self._calculate_properties()
 
-class Circle2D(Component):
+    @classmethod
+    def create_many(cls, polygons) -> list:
+        polygons = list(polygons)
+        properties = Geometry.polygon_properties(*Geometry.pack_polygons(polygons))
+        components = []
+        for polygon, points in cls._from_batch(properties, polygons):
+            polygon._points = points
+            components.append(polygon)
+        return components
+
+class Circle2D(Primitive2D):
+    __slots__ = ("_center", "_radius", "x", "y")
+
     def __init__(self, center, radius):
         self._center = center
         self._radius = radius
@@ -75,8 +147,12 @@ class Circle2D(Component):
 
     def _calculate_properties(self):
         self.x, self.y = self._center
+        self.x_min, self.x_max = self.x - self._radius, self.x + self._radius
+        self.y_min, self.y_max = self.y - self._radius, self.y + self._radius
+        self.width = self.height = 2 * self._radius
         self.area = math.pi * self._radius ** 2
         self.middle_point = self._center
+        self._field_changed(None)
 
     @property
     def center(self):
@@ -96,7 +172,22 @@ class Circle2D(Component):
         self._radius = value
         self._calculate_properties()
 
-class Triangle2D(Component):
+    @classmethod
+    def create_many(cls, centers, radii) -> list:
+        centers, radii = list(centers), list(radii)
+        bounds, areas, _ = Geometry.circle_properties(centers, radii)
+        circles = []
+        # The middle point is the center as given, like _calculate_properties sets it
+        for circle, (center, radius) in cls._from_batch((bounds, areas, None), zip(centers, radii)):
+            circle._center = circle.middle_point = center
+            circle._radius = radius
+            circle.x, circle.y = center
+            circles.append(circle)
+        return circles
+
+class Triangle2D(Primitive2D):
+    __slots__ = ("_points",)
+
     def __init__(self, point1, point2, point3):
         self._points = [point1, point2, point3]
         self._calculate_properties()
@@ -112,6 +203,7 @@ class Triangle2D(Component):
             sum(x for x, _ in self._points) / 3,
             sum(y for _, y in self._points) / 3
         )
+        self._field_changed(None)
 
     def _calculate_area(self):
         x1, y1 = self._points[0]
@@ -129,3 +221,15 @@ class Triangle2D(Component):
             raise ValueError("Triangle requires exactly 3 points.")
         self._points = value
         self._calculate_properties()
+
+    @classmethod
+    def create_many(cls, triangles) -> list:
+        triangles = [list(points) for points in triangles]
+        if any(len(points) != 3 for points in triangles):
+            raise ValueError("Triangle requires exactly 3 points.")
+
+        components = []
+        for triangle, points in cls._from_batch(Geometry.triangle_properties(triangles), triangles):
+            triangle._points = points
+            components.append(triangle)
+        return components
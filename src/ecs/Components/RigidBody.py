@@ -0,0 +1,23 @@
+from ecs.Components.base import Component, TrackedField
+import numpy as np
+
+# Values of RigidBody.body_type, matching pymunk.Body.DYNAMIC/KINEMATIC/STATIC
+DYNAMIC = 0
+KINEMATIC = 1
+STATIC = 2
+
+class RigidBody(Component):
+    __slots__ = ("_body_type", "_mass", "_friction", "_elasticity")
+
+    body_type = TrackedField(np.uint8)
+    mass = TrackedField(np.float32)
+    friction = TrackedField(np.float32)
+    elasticity = TrackedField(np.float32)
+
+    def __init__(self, body_type: int = DYNAMIC, mass: float = 1, friction: float = 0.7, elasticity: float = 0):
+        if body_type not in (DYNAMIC, KINEMATIC, STATIC):
+            raise ValueError("Body type must be DYNAMIC, KINEMATIC or STATIC.")
+        self.body_type = body_type
+        self.mass = mass
+        self.friction = friction
+        self.elasticity = elasticity
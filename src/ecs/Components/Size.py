@@ -1,25 +1,11 @@
-from base import Component
+from ecs.Components.base import Component
 
 class Size2D(Component):
-    def __init__(self, width: int, height: int):
-        self._width = width
-        self._height = height
-
-    @property
-    def width(self):
-        return self._width
-
-    @width.setter
-    def width(self, value):
-        self._width = value
+    __slots__ = ("width", "height")
 
-    @property
-    def height(self):
-        return self._height
-
-    @height.setter
-    def height(self, value):
-        self._height = value
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
 
     @property
     def area(self):
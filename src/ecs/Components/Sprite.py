@@ -0,0 +1,26 @@
+from ecs.Components.base import Component, TrackedField
+import numpy as np
+
+class Sprite(Component):
+    __slots__ = ("_texture", "_u0", "_v0", "_u1", "_v1")
+
+    # OpenGL texture name, 0 draws an untextured quad
+    texture = TrackedField(np.uint32)
+    u0 = TrackedField(np.float32)
+    v0 = TrackedField(np.float32)
+    u1 = TrackedField(np.float32)
+    v1 = TrackedField(np.float32)
+
+    def __init__(self, texture: int = 0, uv = (0.0, 0.0, 1.0, 1.0)):
+        self.texture = texture
+        self.uv = uv
+
+    @property
+    def uv(self):
+        return (self.u0, self.v0, self.u1, self.v1)
+
+    @uv.setter
+    def uv(self, value):
+        if len(value) != 4:
+            raise ValueError("UV must be (u0, v0, u1, v1).")
+        self.u0, self.v0, self.u1, self.v1 = value
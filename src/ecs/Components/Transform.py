@@ -1,8 +1,27 @@
-from base import Component
+from ecs.Components.base import Component, TrackedField
 import numpy as np
+import math
 
 class Transform2D(Component):
+    x = TrackedField(np.float32)
+    y = TrackedField(np.float32)
+    width = TrackedField(np.float32)
+    height = TrackedField(np.float32)
+    scale_x = TrackedField(np.float32)
+    scale_y = TrackedField(np.float32)
+    rotation = TrackedField(np.float32)
+    pivot_x = TrackedField(np.float32)
+    pivot_y = TrackedField(np.float32)
+
+    __slots__ = (
+        "_x", "_y", "_width", "_height", "_scale_x", "_scale_y", "_rotation", "_pivot_x", "_pivot_y",
+        "_matrix",
+    )
+    transient = ("_matrix",)
+
     def __init__(self, x: int, y: int, width: float = 64, scale_x: float = 1, scale_y: float = 1, height: float = 64, rotation: int = 0, pivot_x = None, pivot_y = None):
+        # Cached result of get_transformation_matrix, dropped when a field changes
+        self._matrix = None
         self.x = x
         self.y = y
         self.width = width
@@ -15,46 +34,112 @@ class Transform2D(Component):
         self.pivot_x = pivot_x if pivot_x is not None else width / 2
         self.pivot_y = pivot_y if pivot_y is not None else height / 2
 
+    @property
+    def dirty(self) -> bool:
+        return self._matrix is None
+
+    def _field_changed(self, name) -> None:
+        # None means "possibly everything", see ECSManager.mark_changed
+        if name is None or name in MATRIX_FIELDS:
+            self._matrix = None
+        super()._field_changed(name)
+
     def get_transformation_matrix(self):
-        rad = np.radians(self.rotation)
-        cos_r = np.cos(rad)
-        sin_r = np.sin(rad)
-
-        # Translate to sprite position
-        translation = np.array([
-            [1, 0, self.x],
-            [0, 1, self.y],
-            [0, 0, 1]
+        if self._matrix is not None:
+            return self._matrix
+        # Closed form of T * PivotBack * Rotation * Scale * PivotTranslation
+        a, b, c, d, tx, ty = _affine(
+            self.x, self.y, self.rotation, self.scale_x, self.scale_y, self.pivot_x, self.pivot_y
+        )
+        matrix = np.array([
+            [a, b, tx],
+            [c, d, ty],
+            [0.0, 0.0, 1.0]
         ])
+        # Shared with later callers, so it must not be modified in place
+        matrix.flags.writeable = False
+        self._matrix = matrix
+        return matrix
 
-        # Translate to pivot point (relative to sprite origin)
-        pivot_translation = np.array([
-            [1, 0, -self.pivot_x],
-            [0, 1, -self.pivot_y],
-            [0, 0, 1]
-        ])
+    @property
+    def bounds(self):
+        # Axis-aligned box around the transformed (0, 0)-(width, height) rectangle
+        a, b, c, d, tx, ty = _affine(
+            self.x, self.y, self.rotation, self.scale_x, self.scale_y, self.pivot_x, self.pivot_y
+        )
+        w, h = self.width, self.height
+        xs = (tx, a * w + tx, a * w + b * h + tx, b * h + tx)
+        ys = (ty, c * w + ty, c * w + d * h + ty, d * h + ty)
+        return (min(xs), min(ys), max(xs), max(ys))
 
-        # Rotation matrix
-        rotation = np.array([
-            [cos_r, -sin_r, 0],
-            [sin_r, cos_r, 0],
-            [0, 0, 1]
-        ])
+    @staticmethod
+    def get_transformation_matrices(transforms, affine: bool = False, dtype=np.float32):
+        transforms = list(transforms)
+        count = len(transforms)
+        columns = {
+            name: np.fromiter((getattr(t, name) for t in transforms), dtype=np.float64, count=count)
+            for name in MATRIX_FIELDS
+        }
+        return compute_transformation_matrices(**columns, affine=affine, dtype=dtype)
 
-        # Scale matrix
-        scale = np.array([
-            [self.scale_x, 0, 0],
-            [0, self.scale_y, 0],
-            [0, 0, 1]
-        ])
+    @staticmethod
+    def get_archetype_transformation_matrices(archetype, affine: bool = False, dtype=np.float32):
+        columns = {name: archetype.column(Transform2D, name) for name in MATRIX_FIELDS}
+        return compute_transformation_matrices(**columns, affine=affine, dtype=dtype)
 
-        # Translate back from pivot
-        pivot_back = np.array([
-            [1, 0, self.pivot_x],
-            [0, 1, self.pivot_y],
-            [0, 0, 1]
-        ])
 
-        # Combine: T * (PivotBack * Rotation * Scale * PivotTranslation)
-        transform = translation @ pivot_back @ rotation @ scale @ pivot_translation
-        return transform
+# Fields the transformation matrix depends on
+MATRIX_FIELDS = ("x", "y", "rotation", "scale_x", "scale_y", "pivot_x", "pivot_y")
+
+def _affine(x, y, rotation, scale_x, scale_y, pivot_x, pivot_y):
+    rad = math.radians(rotation)
+    cos_r = math.cos(rad)
+    sin_r = math.sin(rad)
+    a = cos_r * scale_x
+    b = -sin_r * scale_y
+    c = sin_r * scale_x
+    d = cos_r * scale_y
+    tx = x + pivot_x - (a * pivot_x + b * pivot_y)
+    ty = y + pivot_y - (c * pivot_x + d * pivot_y)
+    return a, b, c, d, tx, ty
+
+def compute_transformation_matrices(x, y, rotation, scale_x, scale_y, pivot_x, pivot_y, affine: bool = False, dtype=np.float32):
+    """Vectorized `get_transformation_matrix` over equally sized field arrays.
+
+    Returns an (N, 3, 3) array, or the (N, 2, 3) affine part when `affine` is True.
+    """
+    rad = np.radians(np.asarray(rotation, dtype=np.float64))
+    cos_r = np.cos(rad)
+    sin_r = np.sin(rad)
+    pivot_x = np.asarray(pivot_x, dtype=np.float64)
+    pivot_y = np.asarray(pivot_y, dtype=np.float64)
+
+    out = np.zeros((len(rad), 2 if affine else 3, 3), dtype=dtype)
+    a = cos_r * scale_x
+    b = -sin_r * scale_y
+    c = sin_r * scale_x
+    d = cos_r * scale_y
+    out[:, 0, 0] = a
+    out[:, 0, 1] = b
+    out[:, 1, 0] = c
+    out[:, 1, 1] = d
+    out[:, 0, 2] = x + pivot_x - (a * pivot_x + b * pivot_y)
+    out[:, 1, 2] = y + pivot_y - (c * pivot_x + d * pivot_y)
+    if not affine:
+        out[:, 2, 2] = 1
+    return out
+
+def compute_bounds(matrices, widths, heights) -> np.ndarray:
+    """Vectorized `Transform2D.bounds` for (N, 2, 3) or (N, 3, 3) matrices.
+
+    Returns (N, 4) rows of x_min, y_min, x_max, y_max.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64)
+    widths = np.asarray(widths, dtype=np.float64)[:, None]
+    heights = np.asarray(heights, dtype=np.float64)[:, None]
+    zero = np.zeros_like(widths)
+    local_x = np.hstack((zero, widths, widths, zero))
+    local_y = np.hstack((zero, zero, heights, heights))
+    xs = matrices[:, 0, 0:1] * local_x + matrices[:, 0, 1:2] * local_y + matrices[:, 0, 2:3]
+    ys = matrices[:, 1, 0:1] * local_x + matrices[:, 1, 1:2] * local_y + matrices[:, 1, 2:3]
+    return np.stack((xs.min(axis=1), ys.min(axis=1), xs.max(axis=1), ys.max(axis=1)), axis=1)
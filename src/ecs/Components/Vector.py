@@ -1,27 +1,321 @@
-from base import Component
-from math import sqrt
+from ecs.Components.base import Component
+from math import atan2, cos, degrees, hypot, radians, sin
+import numpy as np
+
+# Angles are in degrees, like Transform2D.rotation. Methods ending in _ip change
+# the vector in place, the others return a new one.
+
+def _xy(value):
+    if isinstance(value, Vector2D):
+        return value.x, value.y
+    x, y = value
+    return x, y
 
 class Vector2D(Component):
-    def __init__(self, x: float, y: float):
-        self._x = x
-        self._y = y
+    __slots__ = ("x", "y")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = x
+        self.y = y
+
+    def __repr__(self):
+        return f"Vector2D({self.x!r}, {self.y!r})"
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __eq__(self, other):
+        if isinstance(other, Vector2D):
+            return self.x == other.x and self.y == other.y
+        if not isinstance(other, (tuple, list)) or len(other) != 2:
+            return NotImplemented
+        return (self.x, self.y) == tuple(other)
+
+    __hash__ = None
+
+    def copy(self) -> "Vector2D":
+        return Vector2D(self.x, self.y)
+
+    def __add__(self, other):
+        x, y = _xy(other)
+        return Vector2D(self.x + x, self.y + y)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        x, y = _xy(other)
+        return Vector2D(self.x - x, self.y - y)
+
+    def __rsub__(self, other):
+        x, y = _xy(other)
+        return Vector2D(x - self.x, y - self.y)
+
+    def __mul__(self, factor):
+        return Vector2D(self.x * factor, self.y * factor)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        return Vector2D(self.x / divisor, self.y / divisor)
+
+    def __neg__(self):
+        return Vector2D(-self.x, -self.y)
+
+    def __iadd__(self, other):
+        x, y = _xy(other)
+        self.x += x
+        self.y += y
+        return self
+
+    def __isub__(self, other):
+        x, y = _xy(other)
+        self.x -= x
+        self.y -= y
+        return self
+
+    def __imul__(self, factor):
+        self.x *= factor
+        self.y *= factor
+        return self
+
+    def __itruediv__(self, divisor):
+        self.x /= divisor
+        self.y /= divisor
+        return self
+
+    @property
+    def magnitude(self):
+        return hypot(self.x, self.y)
+
+    @property
+    def magnitude_squared(self):
+        return self.x * self.x + self.y * self.y
+
+    @property
+    def angle(self) -> float:
+        return degrees(atan2(self.y, self.x))
+
+    def dot(self, other) -> float:
+        x, y = _xy(other)
+        return self.x * x + self.y * y
+
+    def cross(self, other) -> float:
+        # z of the 3D cross product, positive when other is clockwise on screen (y down)
+        x, y = _xy(other)
+        return self.x * y - self.y * x
+
+    def distance_to(self, other) -> float:
+        x, y = _xy(other)
+        return hypot(self.x - x, self.y - y)
+
+    def scale(self, factor) -> "Vector2D":
+        return self * factor
+
+    def scale_ip(self, factor) -> "Vector2D":
+        return self.__imul__(factor)
+
+    def normalize(self) -> "Vector2D":
+        return self.copy().normalize_ip()
+
+    def normalize_ip(self) -> "Vector2D":
+        length = self.magnitude
+        if length == 0:
+            raise ValueError("Cannot normalize a zero-length vector.")
+        return self.__itruediv__(length)
+
+    def clamp_magnitude(self, max_length: float) -> "Vector2D":
+        return self.copy().clamp_magnitude_ip(max_length)
+
+    def clamp_magnitude_ip(self, max_length: float) -> "Vector2D":
+        length = self.magnitude
+        if length > max_length:
+            self.__imul__(max_length / length)
+        return self
+
+    def rotate(self, angle: float) -> "Vector2D":
+        return self.copy().rotate_ip(angle)
+
+    def rotate_ip(self, angle: float) -> "Vector2D":
+        rad = radians(angle)
+        cos_a, sin_a = cos(rad), sin(rad)
+        self.x, self.y = self.x * cos_a - self.y * sin_a, self.x * sin_a + self.y * cos_a
+        return self
+
+    def lerp(self, other, t: float) -> "Vector2D":
+        x, y = _xy(other)
+        return Vector2D(self.x + (x - self.x) * t, self.y + (y - self.y) * t)
+
+
+class Vector2DArray:
+    """N vectors in an (N, 2) float64 array, with the Vector2D operations vectorized.
+
+    Operands may be another Vector2DArray, an (N, 2) array, or a single
+    vector broadcast to every row. Factors, divisors and angles are scalars
+    or (N,) arrays applying one value per row.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data):
+        self.data = np.array(data, dtype=np.float64).reshape(-1, 2)
+
+    @classmethod
+    def zeros(cls, count: int) -> "Vector2DArray":
+        return cls._wrap(np.zeros((count, 2), dtype=np.float64))
+
+    @classmethod
+    def from_vectors(cls, vectors) -> "Vector2DArray":
+        values = np.fromiter((c for v in vectors for c in (v.x, v.y)), dtype=np.float64)
+        return cls._wrap(values.reshape(-1, 2))
+
+    @classmethod
+    def _wrap(cls, data) -> "Vector2DArray":
+        # No copy, `data` must already be a float64 (N, 2) array
+        array = cls.__new__(cls)
+        array.data = data
+        return array
+
+    def to_vectors(self) -> list:
+        return [Vector2D(x, y) for x, y in self.data.tolist()]
+
+    def copy(self) -> "Vector2DArray":
+        return self._wrap(self.data.copy())
+
+    def __repr__(self):
+        return f"Vector2DArray({self.data.tolist()!r})"
+
+    def __len__(self):
+        return len(self.data)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Vector2D(*self.data[index].tolist())
+        return self._wrap(self.data[index])
+
+    def __setitem__(self, index, value):
+        self.data[index] = self._operand(value)
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.data[:, 0]
 
     @property
-    def x(self):
-        return self._x
+    def y(self) -> np.ndarray:
+        return self.data[:, 1]
+
+    @staticmethod
+    def _operand(other):
+        if isinstance(other, Vector2DArray):
+            return other.data
+        if isinstance(other, Vector2D):
+            return np.array((other.x, other.y), dtype=np.float64)
+        return np.asarray(other, dtype=np.float64)
+
+    @staticmethod
+    def _per_row(value):
+        value = np.asarray(value, dtype=np.float64)
+        return value[:, None] if value.ndim == 1 else value
+
+    def __add__(self, other):
+        return self._wrap(self.data + self._operand(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._wrap(self.data - self._operand(other))
+
+    def __rsub__(self, other):
+        return self._wrap(self._operand(other) - self.data)
+
+    def __mul__(self, factor):
+        return self._wrap(self.data * self._per_row(factor))
 
-    @x.setter
-    def x(self, value):
-        self._x = value
+    __rmul__ = __mul__
+
+    def __truediv__(self, divisor):
+        return self._wrap(self.data / self._per_row(divisor))
+
+    def __neg__(self):
+        return self._wrap(-self.data)
+
+    def __iadd__(self, other):
+        np.add(self.data, self._operand(other), out=self.data)
+        return self
+
+    def __isub__(self, other):
+        np.subtract(self.data, self._operand(other), out=self.data)
+        return self
+
+    def __imul__(self, factor):
+        np.multiply(self.data, self._per_row(factor), out=self.data)
+        return self
+
+    def __itruediv__(self, divisor):
+        np.divide(self.data, self._per_row(divisor), out=self.data)
+        return self
 
     @property
-    def y(self):
-        return self._y
+    def magnitude(self) -> np.ndarray:
+        return np.hypot(self.data[:, 0], self.data[:, 1])
 
-    @y.setter
-    def y(self, value):
-        self._y = value
+    @property
+    def magnitude_squared(self) -> np.ndarray:
+        return np.einsum("ij,ij->i", self.data, self.data)
 
     @property
-    def magnitude(self):
-        return sqrt(self.x ** 2 + self.y ** 2)
+    def angle(self) -> np.ndarray:
+        return np.degrees(np.arctan2(self.data[:, 1], self.data[:, 0]))
+
+    def dot(self, other) -> np.ndarray:
+        other = np.broadcast_to(self._operand(other), self.data.shape)
+        return np.einsum("ij,ij->i", self.data, other)
+
+    def cross(self, other) -> np.ndarray:
+        other = np.broadcast_to(self._operand(other), self.data.shape)
+        return self.data[:, 0] * other[:, 1] - self.data[:, 1] * other[:, 0]
+
+    def distance_to(self, other) -> np.ndarray:
+        delta = self.data - self._operand(other)
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    def scale(self, factor) -> "Vector2DArray":
+        return self * factor
+
+    def scale_ip(self, factor) -> "Vector2DArray":
+        return self.__imul__(factor)
+
+    def normalize(self) -> "Vector2DArray":
+        return self.copy().normalize_ip()
+
+    def normalize_ip(self) -> "Vector2DArray":
+        # Zero-length rows stay zero instead of raising
+        length = self.magnitude
+        np.divide(self.data, length[:, None], out=self.data, where=length[:, None] != 0)
+        return self
+
+    def clamp_magnitude(self, max_length) -> "Vector2DArray":
+        return self.copy().clamp_magnitude_ip(max_length)
+
+    def clamp_magnitude_ip(self, max_length) -> "Vector2DArray":
+        length = self.magnitude
+        too_long = length > max_length
+        factor = np.divide(max_length, length, out=np.ones_like(length), where=too_long)
+        np.multiply(self.data, factor[:, None], out=self.data)
+        return self
+
+    def rotate(self, angle) -> "Vector2DArray":
+        return self.copy().rotate_ip(angle)
+
+    def rotate_ip(self, angle) -> "Vector2DArray":
+        rad = np.radians(angle)
+        cos_a, sin_a = np.cos(rad), np.sin(rad)
+        x = self.data[:, 0].copy()
+        y = self.data[:, 1]
+        self.data[:, 0] = x * cos_a - y * sin_a
+        self.data[:, 1] = x * sin_a + y * cos_a
+        return self
+
+    def lerp(self, other, t) -> "Vector2DArray":
+        other = self._operand(other)
+        return self._wrap(self.data + (other - self.data) * self._per_row(t))
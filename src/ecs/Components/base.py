@@ -1,2 +1,109 @@
+class Field:
+    """Numeric component attribute that can live in an archetype column."""
+
+    def __init__(self, dtype):
+        self.dtype = dtype
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.private = '_' + name
+
+    def __get__(self, component, owner=None):
+        if component is None:
+            return self
+        if component._columns is None:
+            return getattr(component, self.private)
+        return component._columns[self.name][component._row].item()
+
+    def __set__(self, component, value):
+        if component._columns is None:
+            setattr(component, self.private, value)
+        else:
+            component._columns[self.name][component._row] = value
+
+
+class TrackedField(Field):
+    """Field whose assignments are reported through `Component._field_changed`."""
+
+    def __set__(self, component, value):
+        super().__set__(component, value)
+        component._field_changed(self.name)
+
+
+# Slots of Component itself, describing where an instance is stored rather than its state
+BINDING_SLOTS = ("_columns", "_row", "_changes", "_entity_id")
+
 class Component:
-    pass
+    """Base class of all components.
+
+    Components use __slots__ to stay small; subclasses list the slots they
+    need, including the private `_name` storage of each Field.
+    """
+
+    __slots__ = BINDING_SLOTS
+
+    # Field name -> Field, collected for every subclass
+    fields = {}
+    # True if changes are reported through _field_changed, set automatically for TrackedFields
+    tracked = False
+    # Slots holding the component's own state, collected for every subclass
+    _state_slots = ()
+    # State slots that are caches, not saved in snapshots and reset to None on load
+    transient = ()
+
+    def __new__(cls, *args, **kwargs):
+        component = super().__new__(cls)
+        # Set by an Archetype while the component is stored in its columns
+        component._columns = None
+        component._row = -1
+        # Set by the ECSManager for components with tracked fields
+        component._changes = None
+        component._entity_id = -1
+        return component
+
+    @classmethod
+    def _new_many(cls, count: int) -> list:
+        # `count` instances in the state __new__ leaves them in, without a call per instance
+        new = object.__new__
+        components = []
+        append = components.append
+        for _ in range(count):
+            component = new(cls)
+            component._columns = None
+            component._row = -1
+            component._changes = None
+            component._entity_id = -1
+            append(component)
+        return components
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.fields = {
+            name: attr
+            for klass in reversed(cls.__mro__)
+            for name, attr in vars(klass).items()
+            if isinstance(attr, Field)
+        }
+        if any(isinstance(field, TrackedField) for field in cls.fields.values()):
+            cls.tracked = True
+        cls._state_slots = tuple(
+            name
+            for klass in reversed(cls.__mro__)
+            for name in vars(klass).get("__slots__", ())
+            if name not in BINDING_SLOTS and name not in ("__dict__", "__weakref__")
+        )
+
+    def _copy_state(self, other) -> None:
+        # Makes a pooled, detached instance equal to the template component `other`
+        for name in self._state_slots:
+            try:
+                value = getattr(other, name)
+            except AttributeError:
+                continue
+            setattr(self, name, value)
+        if hasattr(other, "__dict__"):
+            self.__dict__.update(other.__dict__)
+
+    def _field_changed(self, name) -> None:
+        if self._changes is not None:
+            self._changes.add(self._entity_id)
@@ -1,9 +1,59 @@
-from typing import List
-import uuid
-
 class Entity:
+    """Handle to an entity: a dense index plus the generation it was allocated in."""
+
+    __slots__ = ("id", "generation")
+
+    def __init__(self, id: int, generation: int = 0):
+        self.id = id
+        self.generation = generation
+
+    def __eq__(self, other):
+        return isinstance(other, Entity) and self.id == other.id and self.generation == other.generation
+
+    def __hash__(self):
+        return hash((self.id, self.generation))
+
+    def __repr__(self):
+        return f"Entity({self.id}, {self.generation})"
+
+
+class EntityAllocator:
+    """Hands out dense integer ids, recycling released ones.
+
+    Each id has a generation counter that is bumped on release, so handles
+    to a destroyed entity can be told apart from its reused id.
+    """
+
     def __init__(self):
-        self.id = self._generate_id()
+        self.generations = []
+        self._free = []
+
+    def __len__(self):
+        return len(self.generations) - len(self._free)
+
+    def allocate(self) -> Entity:
+        if self._free:
+            index = self._free.pop()
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+        return Entity(index, self.generations[index])
+
+    def allocate_many(self, count: int) -> list:
+        reused = min(count, len(self._free))
+        indices = self._free[len(self._free) - reused:]
+        del self._free[len(self._free) - reused:]
+        start = len(self.generations)
+        self.generations.extend([0] * (count - reused))
+        indices.extend(range(start, len(self.generations)))
+        generations = self.generations
+        return [Entity(index, generations[index]) for index in indices]
+
+    def release(self, entity: Entity) -> None:
+        if not self.is_alive(entity):
+            raise ValueError(f"{entity} is not alive.")
+        self.generations[entity.id] += 1
+        self._free.append(entity.id)
 
-    def _generate_id(self):
-        return uuid.uuid4()
+    def is_alive(self, entity: Entity) -> bool:
+        return entity.id < len(self.generations) and self.generations[entity.id] == entity.generation
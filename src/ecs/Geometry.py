@@ -0,0 +1,106 @@
+from itertools import chain
+import numpy as np
+
+# Vectorized counterparts of the Primitive2D property calculations.
+# Every *_properties kernel returns (bounds, areas, middle_points) with bounds
+# as (N, 4) rows of x_min, y_min, x_max, y_max and middle points as (N, 2),
+# matching what the components compute one at a time.
+
+def _as_points(points, depth: int = 1) -> np.ndarray:
+    # (M, 2) float64 points; lists are flattened through fromiter, much faster than np.asarray
+    if isinstance(points, np.ndarray):
+        return points.astype(np.float64, copy=False).reshape(-1, 2)
+    coordinates = points
+    for _ in range(depth):
+        coordinates = chain.from_iterable(coordinates)
+    return np.fromiter(coordinates, dtype=np.float64).reshape(-1, 2)
+
+def box_properties(point1, point2):
+    point1 = _as_points(point1)
+    point2 = _as_points(point2)
+    low = np.minimum(point1, point2)
+    high = np.maximum(point1, point2)
+    size = high - low
+    return np.hstack((low, high)), size[:, 0] * size[:, 1], (low + high) / 2
+
+def circle_properties(centers, radii):
+    centers = _as_points(centers)
+    radii = np.asarray(radii, dtype=np.float64).reshape(-1, 1)
+    bounds = np.hstack((centers - radii, centers + radii))
+    return bounds, np.pi * radii[:, 0] ** 2, centers.copy()
+
+def triangle_properties(points):
+    points = _as_points(points, depth=2).reshape(-1, 3, 2)
+    bounds = np.hstack((points.min(axis=1), points.max(axis=1)))
+    x, y = points[:, :, 0], points[:, :, 1]
+    areas = np.abs(
+        x[:, 0] * (y[:, 1] - y[:, 2]) + x[:, 1] * (y[:, 2] - y[:, 0]) + x[:, 2] * (y[:, 0] - y[:, 1])
+    ) / 2
+    return bounds, areas, points.mean(axis=1)
+
+def pack_polygons(polygons):
+    """Flattens a list of point lists into (M, 2) points and (N + 1,) offsets.
+
+    Polygon i is points[offsets[i]:offsets[i + 1]].
+    """
+    counts = np.fromiter((len(polygon) for polygon in polygons), dtype=np.int64, count=len(polygons))
+    if np.any(counts == 0):
+        raise ValueError("Polygons need at least one point.")
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    coordinates = chain.from_iterable(chain.from_iterable(polygons))
+    points = np.fromiter(coordinates, dtype=np.float64, count=2 * int(offsets[-1])).reshape(-1, 2)
+    return points, offsets
+
+def _next_vertex(offsets):
+    # Index of the following vertex, wrapping around inside each polygon
+    following = np.arange(1, offsets[-1] + 1)
+    following[offsets[1:] - 1] = offsets[:-1]
+    return following
+
+def polygon_properties(points, offsets):
+    points = np.asarray(points, dtype=np.float64)
+    starts = offsets[:-1]
+    bounds = np.hstack((
+        np.minimum.reduceat(points, starts, axis=0),
+        np.maximum.reduceat(points, starts, axis=0),
+    ))
+    following = points[_next_vertex(offsets)]
+    # Shoelace formula, summed per polygon
+    cross = points[:, 0] * following[:, 1] - points[:, 1] * following[:, 0]
+    areas = np.abs(np.add.reduceat(cross, starts)) / 2
+    return bounds, areas, (bounds[:, :2] + bounds[:, 2:]) / 2
+
+def boxes_contain_point(bounds, x, y):
+    bounds = np.asarray(bounds)
+    return (bounds[:, 0] <= x) & (x <= bounds[:, 2]) & (bounds[:, 1] <= y) & (y <= bounds[:, 3])
+
+def circles_contain_point(centers, radii, x, y):
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 2)
+    dx = centers[:, 0] - x
+    dy = centers[:, 1] - y
+    return dx * dx + dy * dy <= np.asarray(radii, dtype=np.float64) ** 2
+
+def triangles_contain_point(points, x, y):
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3, 2)
+    a, b, c = points[:, 0], points[:, 1], points[:, 2]
+
+    def side(p, q):
+        return (x - q[:, 0]) * (p[:, 1] - q[:, 1]) - (p[:, 0] - q[:, 0]) * (y - q[:, 1])
+
+    d1, d2, d3 = side(a, b), side(b, c), side(c, a)
+    has_negative = (d1 < 0) | (d2 < 0) | (d3 < 0)
+    has_positive = (d1 > 0) | (d2 > 0) | (d3 > 0)
+    return ~(has_negative & has_positive)
+
+def polygons_contain_point(points, offsets, x, y):
+    # Even-odd rule: count edges crossed by a ray going right from the point
+    points = np.asarray(points, dtype=np.float64)
+    following = points[_next_vertex(offsets)]
+    xi, yi = points[:, 0], points[:, 1]
+    xj, yj = following[:, 0], following[:, 1]
+    straddles = (yi > y) != (yj > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing_x = xi + (y - yi) * (xj - xi) / (yj - yi)
+    crossings = straddles & (x < crossing_x)
+    return np.add.reduceat(crossings.astype(np.int64), offsets[:-1]) % 2 == 1
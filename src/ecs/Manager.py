@@ -1,25 +1,294 @@
-from Components import *
 from collections import defaultdict
-from Entity import Entity
+import threading
+import numpy as np
+from ecs.Archetype import Archetype
+from ecs.Commands import CommandBuffer
+from ecs.Entity import Entity, EntityAllocator
+from ecs.Query import Query
+from engine.Profiler import profiler
+
+STORAGE_MODES = ("dict", "archetype")
 
 class ECSManager:
-    def __init__(self):
+    def __init__(self, storage: str = "dict", max_pool_size: int = 4096):
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Storage must be one of {STORAGE_MODES}.")
+        self.storage = storage
+        self.allocator = EntityAllocator()
         self.entities = set()
         self.components = defaultdict(dict)
 
+        # Archetype storage: component set -> table, entity id -> its table
+        self.archetypes = {}
+        self.entity_archetypes = {}
+
+        # Cached queries: component set -> Query, component type -> queries using it
+        self.queries = {}
+        self._queries_by_type = defaultdict(list)
+        # Systems of a scheduler stage may create the same query concurrently
+        self._query_lock = threading.Lock()
+
+        # Component type -> ids of entities whose tracked fields changed this frame
+        self.changes = defaultdict(set)
+        # Component type -> ids of entities that lost a tracked component this frame
+        self.removals = defaultdict(set)
+
+        # Component type -> detached instances kept by despawn() for reuse by spawn()
+        self.pools = defaultdict(list)
+        self.max_pool_size = max_pool_size
+
+        # Structural changes recorded during systems, applied by flush()
+        self.commands = CommandBuffer(self)
+
     def create_enitity(self):
-        entity = Entity()
+        entity = self.allocator.allocate()
         self.entities.add(entity.id)
         return entity
 
+    def destroy_entity(self, entity: Entity) -> None:
+        self._destroy(entity, recycle=False)
+
+    @profiler.profile
+    def spawn(self, count: int, template) -> list:
+        # template: detached components, copied (or taken from the pools) for every entity
+        template = self._check_template(template)
+        entities = self.allocator.allocate_many(count)
+        self._spawn_with_all(entities, template)
+        return entities
+
+    @profiler.profile
+    def despawn(self, entities) -> None:
+        for entity in entities:
+            self._destroy(entity, recycle=True)
+
+    @profiler.profile
+    def flush(self) -> None:
+        self.commands.flush()
+
+    def is_alive(self, entity: Entity) -> bool:
+        return self.allocator.is_alive(entity)
+
     def add_component(self, entity: Entity, component):
-        self.components[type(component)][entity.id] = component
+        self._check_alive(entity)
+        self._store_component(entity.id, component)
+        if self.storage == "archetype":
+            self._move_entity(entity.id)
+        for query in self._queries_by_type[type(component)]:
+            if self._has_components(entity.id, query.component_types):
+                query._add(entity.id)
+
+    def add_components(self, entity: Entity, components) -> None:
+        self._check_alive(entity)
+        self._attach(entity.id, list(components))
+
+    def remove_component(self, entity: Entity, component_type):
+        self._check_alive(entity)
+        component = self.components[component_type].pop(entity.id, None)
+        if component is None:
+            return None
+        self._untrack(component)
+        if self.storage == "archetype":
+            self._move_entity(entity.id)
+        for query in self._queries_by_type[component_type]:
+            query._discard(entity.id)
+        return component
 
     def get_component(self, entity: Entity, component_type):
+        if not self.allocator.is_alive(entity):
+            return None
         return self.components[component_type].get(entity.id)
 
     def get_entities_with_components(self, *component_types):
-        sets = [set(self.components[ct].keys()) for ct in component_types]
-        entity_ids = set.intersection(*sets)
-        return [entity for entity in self.entities if entity in entity_ids]
+        return list(self.query(*component_types))
+
+    def query(self, *component_types) -> Query:
+        key = frozenset(component_types)
+        query = self.queries.get(key)
+        if query is None:
+            with self._query_lock:
+                query = self.queries.get(key)
+                if query is None:
+                    query = self._create_query(key)
+        return query
+
+    def _create_query(self, key) -> Query:
+        query = Query(key)
+        # Only the smallest store needs scanning to seed the query
+        smallest = min((self.components[ct] for ct in key), key=len)
+        for entity_id in smallest:
+            if self._has_components(entity_id, key):
+                query._add(entity_id)
+        # Published last, so other threads never see a half-seeded query
+        for component_type in key:
+            self._queries_by_type[component_type].append(query)
+        self.queries[key] = query
+        return query
+
+    def get_changed_entities(self, component_type) -> set:
+        return self.changes[component_type]
+
+    def get_removed_entities(self, component_type) -> set:
+        # May include entities whose component was replaced rather than removed
+        return self.removals[component_type]
+
+    def mark_changed(self, component_type, entity_ids) -> None:
+        # For writes that bypass the component objects, such as archetype columns
+        store = self.components[component_type]
+        for entity_id in entity_ids:
+            component = store.get(entity_id)
+            if component is not None:
+                component._field_changed(None)
+
+    @profiler.profile
+    def clear_changes(self) -> None:
+        for changes in self.changes.values():
+            changes.clear()
+        for removals in self.removals.values():
+            removals.clear()
+
+    def get_archetypes_with_components(self, *component_types):
+        if self.storage != "archetype":
+            raise RuntimeError("Archetypes are only available with archetype storage.")
+        wanted = set(component_types)
+        return [archetype for key, archetype in self.archetypes.items() if wanted <= key]
+
+    def get_field_columns(self, component_type):
+        """(entity ids, {field name: values}) for every entity with `component_type`, sorted by id."""
+        fields = component_type.fields
+        if self.storage != "archetype":
+            store = self.components[component_type]
+            entity_ids = np.array(sorted(store), dtype=np.int64)
+            objects = [store[entity_id] for entity_id in entity_ids.tolist()]
+            return entity_ids, {
+                name: np.fromiter((getattr(component, name) for component in objects), dtype=field.dtype, count=len(objects))
+                for name, field in fields.items()
+            }
+        # Whole archetype columns, put in entity id order
+        archetypes = [archetype for archetype in self.get_archetypes_with_components(component_type) if len(archetype)]
+        entity_ids = np.concatenate([archetype.entity_ids() for archetype in archetypes] + [np.empty(0, dtype=np.int64)])
+        order = np.argsort(entity_ids, kind="stable")
+        return entity_ids[order], {
+            name: np.concatenate(
+                [archetype.column(component_type, name) for archetype in archetypes]
+                + [np.empty(0, dtype=field.dtype)]
+            )[order]
+            for name, field in fields.items()
+        }
+
+    def _check_alive(self, entity: Entity) -> None:
+        if not self.allocator.is_alive(entity):
+            raise ValueError(f"{entity} is stale or was never created by this manager.")
+
+    def _store_component(self, entity_id, component) -> None:
+        component_type = type(component)
+        store = self.components[component_type]
+        previous = store.get(entity_id)
+        if previous is not None:
+            self._untrack(previous)
+        store[entity_id] = component
+        if component_type.tracked:
+            changes = self.changes[component_type]
+            component._changes = changes
+            component._entity_id = entity_id
+            changes.add(entity_id)
+
+    @staticmethod
+    def _check_template(template) -> list:
+        template = list(template)
+        for prototype in template:
+            if prototype._changes is not None or prototype._columns is not None:
+                raise ValueError("Template components must not be attached to an entity.")
+        return template
+
+    def _spawn_with_all(self, entities, template) -> None:
+        is_alive = self.allocator.is_alive
+        for entity in entities:
+            # Deferred spawns may have been despawned before the flush
+            if is_alive(entity):
+                self._spawn_with(entity, template)
+
+    # Deferred commands skip entities that died before the flush, so one stale
+    # command cannot abort the rest of the buffer
+
+    def _despawn_alive(self, entities) -> None:
+        is_alive = self.allocator.is_alive
+        for entity in entities:
+            if is_alive(entity):
+                self._destroy(entity, recycle=True)
+
+    def _add_component_alive(self, entity: Entity, component) -> None:
+        if self.allocator.is_alive(entity):
+            self.add_component(entity, component)
+
+    def _remove_component_alive(self, entity: Entity, component_type) -> None:
+        if self.allocator.is_alive(entity):
+            self.remove_component(entity, component_type)
+
+    def _spawn_with(self, entity: Entity, template) -> None:
+        self.entities.add(entity.id)
+        self._attach(entity.id, [self._instantiate(prototype) for prototype in template])
+
+    def _attach(self, entity_id, components) -> None:
+        for component in components:
+            self._store_component(entity_id, component)
+        # One archetype move and one query pass for all components
+        if self.storage == "archetype":
+            self._move_entity(entity_id)
+        for query in {query for component in components for query in self._queries_by_type[type(component)]}:
+            if self._has_components(entity_id, query.component_types):
+                query._add(entity_id)
+
+    def _instantiate(self, prototype):
+        component_type = type(prototype)
+        pool = self.pools.get(component_type)
+        component = pool.pop() if pool else component_type.__new__(component_type)
+        component._copy_state(prototype)
+        return component
+
+    def _destroy(self, entity: Entity, recycle: bool) -> None:
+        self._check_alive(entity)
+        entity_id = entity.id
+        if self.storage == "archetype":
+            archetype = self.entity_archetypes.pop(entity_id, None)
+            if archetype is not None:
+                archetype.remove(entity_id)
+        for component_type, store in self.components.items():
+            component = store.pop(entity_id, None)
+            if component is not None:
+                self._untrack(component)
+                for query in self._queries_by_type[component_type]:
+                    query._discard(entity_id)
+                if recycle:
+                    pool = self.pools[component_type]
+                    if len(pool) < self.max_pool_size:
+                        pool.append(component)
+        self.entities.discard(entity_id)
+        self.allocator.release(entity)
+
+    def _untrack(self, component) -> None:
+        if component._changes is not None:
+            component._changes.discard(component._entity_id)
+            self.removals[type(component)].add(component._entity_id)
+            component._changes = None
+            component._entity_id = -1
+
+    def _has_components(self, entity_id, component_types) -> bool:
+        return all(entity_id in self.components[ct] for ct in component_types)
 
+    def _move_entity(self, entity_id):
+        current = self.entity_archetypes.pop(entity_id, None)
+        if current is not None:
+            current.remove(entity_id)
+        components = {
+            ct: store[entity_id]
+            for ct, store in self.components.items()
+            if entity_id in store
+        }
+        if not components:
+            return
+        key = frozenset(components)
+        archetype = self.archetypes.get(key)
+        if archetype is None:
+            archetype = self.archetypes[key] = Archetype(key)
+        archetype.add(entity_id, components)
+        self.entity_archetypes[entity_id] = archetype
@@ -0,0 +1,29 @@
+class Query:
+    """Entities having all of `component_types`, kept up to date by the ECSManager.
+
+    Iteration order is the order in which entities started matching.
+    """
+
+    def __init__(self, component_types):
+        self.component_types = frozenset(component_types)
+        # dict as an insertion-ordered set
+        self._entities = {}
+
+    def __iter__(self):
+        return iter(self._entities)
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __contains__(self, entity_id):
+        return entity_id in self._entities
+
+    @property
+    def entities(self):
+        return self._entities.keys()
+
+    def _add(self, entity_id) -> None:
+        self._entities[entity_id] = None
+
+    def _discard(self, entity_id) -> None:
+        self._entities.pop(entity_id, None)
@@ -0,0 +1,328 @@
+import json
+import struct
+import zlib
+import numpy as np
+from ecs.Components.Color import Color
+from ecs.Components.Sprite import Sprite
+from ecs.Components.Transform import Transform2D
+from ecs.Manager import ECSManager
+from ecs.Snapshot import component_type_name, import_component_type
+
+# Replays record the Field values of component types whose whole state lives in
+# Fields, so playback can recreate them. Float fields are quantized to a step
+# (0 records the exact bits); every frame stores, per type, the entities that
+# gained or lost the component and, per field, the ids and value deltas of the
+# entities whose quantized value changed. Every `keyframe_interval` frames the
+# full state is stored instead, so seeking never replays more than one interval.
+DEFAULT_TYPES = (Transform2D, Sprite, Color)
+DEFAULT_STEP = 1 / 256
+
+MAGIC = b"VXREPLAY"
+HEADER = struct.Struct("<8sI")
+FRAME_SIZE = struct.Struct("<I")
+
+def _quantize(values, dtype, step) -> np.ndarray:
+    if np.issubdtype(dtype, np.floating):
+        if step:
+            return np.rint(np.asarray(values, dtype=np.float64) / step).astype(np.int64)
+        bits = np.dtype(f"<i{dtype.itemsize}")
+        return np.asarray(values, dtype=dtype).view(bits).astype(np.int64)
+    return np.asarray(values).astype(np.int64)
+
+def _dequantize(values, dtype, step) -> np.ndarray:
+    if np.issubdtype(dtype, np.floating):
+        if step:
+            return (values * step).astype(dtype)
+        return values.astype(np.dtype(f"<i{dtype.itemsize}")).view(dtype)
+    return values.astype(dtype)
+
+def _encode(arrays, level) -> bytes:
+    # One int64 buffer: array count, array lengths, then the arrays back to back
+    lengths = [len(array) for array in arrays]
+    buffer = np.concatenate([np.array([len(arrays)] + lengths, dtype="<i8")] + [a.astype("<i8") for a in arrays])
+    return zlib.compress(buffer.tobytes(), level)
+
+def _decode(frame) -> list:
+    buffer = np.frombuffer(zlib.decompress(frame), dtype="<i8")
+    count = int(buffer[0])
+    lengths = buffer[1:1 + count]
+    ends = np.cumsum(lengths) + 1 + count
+    return [buffer[end - length:end] for length, end in zip(lengths.tolist(), ends.tolist())]
+
+def _pack_ids(ids) -> np.ndarray:
+    # Sorted ids as differences, mostly small numbers that compress well
+    return np.diff(ids, prepend=0)
+
+def _unpack_ids(packed) -> np.ndarray:
+    return np.cumsum(packed)
+
+
+class _Channel:
+    """Recorded state of one component type, dense by entity id."""
+
+    def __init__(self, component_type, steps):
+        self.component_type = component_type
+        self.fields = [
+            (name, np.dtype(field.dtype), steps.get(name, DEFAULT_STEP) if np.issubdtype(field.dtype, np.floating) else 0)
+            for name, field in component_type.fields.items()
+        ]
+        self.present = np.zeros(0, dtype=bool)
+        self.values = {name: np.zeros(0, dtype=np.int64) for name, _, _ in self.fields}
+
+    def reset(self) -> None:
+        self.present[:] = False
+        for values in self.values.values():
+            values[:] = 0
+
+    def reserve(self, count: int) -> None:
+        if count <= len(self.present):
+            return
+        size = max(count, 2 * len(self.present), 64)
+        self.present = np.concatenate((self.present, np.zeros(size - len(self.present), dtype=bool)))
+        for name, values in self.values.items():
+            self.values[name] = np.concatenate((values, np.zeros(size - len(values), dtype=np.int64)))
+
+    def describe(self) -> dict:
+        return {
+            "type": component_type_name(self.component_type),
+            "fields": [[name, dtype.str, step] for name, dtype, step in self.fields],
+        }
+
+
+def _check_replayable(component_type) -> None:
+    privates = {field.private for field in component_type.fields.values()}
+    extra = set(component_type._state_slots) - privates - set(component_type.transient)
+    if not component_type.fields or extra:
+        raise ValueError(f"{component_type.__name__} keeps state outside Fields and cannot be replayed.")
+
+
+class Replay:
+    """Frames recorded by a `ReplayRecorder`, kept compressed in memory."""
+
+    def __init__(self, channels, keyframe_interval: int):
+        self.channels = channels            # described channels, see _Channel.describe
+        self.keyframe_interval = keyframe_interval
+        self.frames = []                    # zlib-compressed frame buffers
+
+    def __len__(self):
+        return len(self.frames)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(len(frame) for frame in self.frames)
+
+    def save(self, path) -> None:
+        header = json.dumps({"channels": self.channels, "keyframe_interval": self.keyframe_interval}).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, len(header)))
+            file.write(header)
+            for frame in self.frames:
+                file.write(FRAME_SIZE.pack(len(frame)))
+                file.write(frame)
+
+    @classmethod
+    def load(cls, path) -> "Replay":
+        with open(path, "rb") as file:
+            magic, header_size = HEADER.unpack(file.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a Vortex2D replay.")
+            header = json.loads(file.read(header_size))
+            replay = cls(header["channels"], header["keyframe_interval"])
+            while size := file.read(FRAME_SIZE.size):
+                replay.frames.append(file.read(FRAME_SIZE.unpack(size)[0]))
+        return replay
+
+
+class ReplayRecorder:
+    """Records the Field values of `component_types` once per tick.
+
+    Call `record()` every simulation step, before `manager.clear_changes()`:
+    tracked types are only compared for entities the manager reports as
+    changed. `steps` maps a component type to {field name: quantization step}.
+    """
+
+    def __init__(self, manager, component_types=DEFAULT_TYPES, keyframe_interval: int = 300, steps=None, level: int = 6):
+        for component_type in component_types:
+            _check_replayable(component_type)
+        steps = steps or {}
+        self.manager = manager
+        self.level = level
+        self._channels = [_Channel(ct, steps.get(ct, {})) for ct in component_types]
+        self.replay = Replay([channel.describe() for channel in self._channels], keyframe_interval)
+
+    def record(self) -> None:
+        keyframe = len(self.replay.frames) % self.replay.keyframe_interval == 0
+        arrays = []
+        for channel in self._channels:
+            arrays.extend(self._record_channel(channel, keyframe))
+        self.replay.frames.append(_encode(arrays, self.level))
+
+    def _record_channel(self, channel, keyframe) -> list:
+        manager = self.manager
+        component_type = channel.component_type
+        store = manager.components[component_type]
+        channel.reserve(len(manager.allocator.generations))
+
+        if component_type.tracked and not keyframe:
+            candidates = manager.get_changed_entities(component_type) | manager.get_removed_entities(component_type)
+            candidates = np.array(sorted(candidates), dtype=np.int64)
+            current = np.array([entity_id in store for entity_id in candidates.tolist()], dtype=bool)
+            ids = candidates[current]
+            columns = {
+                name: np.fromiter((getattr(store[entity_id], name) for entity_id in ids.tolist()), dtype=dtype, count=len(ids))
+                for name, dtype, _ in channel.fields
+            }
+            gone = candidates[~current & channel.present[candidates]]
+        else:
+            ids, columns = manager.get_field_columns(component_type)
+            still = np.zeros(len(channel.present), dtype=bool)
+            still[ids] = True
+            gone = np.flatnonzero(channel.present & ~still)
+
+        was_present = channel.present[ids]
+        added = ids[~was_present]
+        channel.present[gone] = False
+        channel.present[ids] = True
+
+        changes = []
+        for name, dtype, step in channel.fields:
+            values = channel.values[name]
+            values[gone] = 0
+            quantized = _quantize(columns[name], dtype, step)
+            previous = np.where(was_present, values[ids], 0)
+            changed = quantized != previous
+            changes.append((ids[changed], (quantized - previous)[changed]))
+            values[ids] = quantized
+
+        if keyframe:
+            # Full state, as deltas from an empty world
+            live = np.flatnonzero(channel.present)
+            gone = np.empty(0, dtype=np.int64)
+            added = live
+            changes = []
+            for name, _, _ in channel.fields:
+                values = channel.values[name][live]
+                nonzero = values != 0
+                changes.append((live[nonzero], values[nonzero]))
+
+        arrays = [_pack_ids(added), _pack_ids(gone)]
+        for changed_ids, deltas in changes:
+            arrays.append(_pack_ids(changed_ids))
+            arrays.append(deltas)
+        return arrays
+
+
+class ReplayPlayer:
+    """Plays a `Replay` back into its own ECSManager, `manager`.
+
+    Recorded entity ids map to entities of `manager`, created and destroyed
+    as the replay goes. Seeking restarts from the keyframe before the target
+    unless the target is ahead within the same interval, so the state of a
+    frame is the same however it was reached.
+    """
+
+    def __init__(self, replay: Replay, storage: str = "dict"):
+        self.replay = replay
+        self.manager = ECSManager(storage)
+        self.frame = -1
+        self._channels = []
+        for description in replay.channels:
+            component_type = import_component_type(description["type"])
+            channel = _Channel(component_type, {})
+            channel.fields = [(name, np.dtype(dtype), step) for name, dtype, step in description["fields"]]
+            self._channels.append(channel)
+        self._entities = {}    # recorded entity id -> Entity of manager
+
+    def __len__(self):
+        return len(self.replay)
+
+    def step(self) -> None:
+        self.seek(self.frame + 1)
+
+    def seek(self, frame: int) -> None:
+        if not 0 <= frame < len(self.replay):
+            raise IndexError(f"Frame {frame} is outside the replay of {len(self.replay)} frames.")
+        interval = self.replay.keyframe_interval
+        keyframe = frame - frame % interval
+        start = self.frame + 1
+        if frame < self.frame or self.frame < keyframe:
+            start = keyframe
+        touched = [set() for _ in self._channels]
+        for index in range(start, frame + 1):
+            self._apply_frame(index, index % interval == 0, touched)
+        self.frame = frame
+        self._sync(touched)
+
+    def _apply_frame(self, index, keyframe, touched) -> None:
+        arrays = iter(_decode(self.replay.frames[index]))
+        for channel, changed in zip(self._channels, touched):
+            added = _unpack_ids(next(arrays))
+            gone = _unpack_ids(next(arrays))
+            if keyframe:
+                # Everything not in the keyframe disappears
+                changed.update(np.flatnonzero(channel.present).tolist())
+                channel.reset()
+            channel.reserve(int(max(added.max(initial=-1), gone.max(initial=-1))) + 1)
+            channel.present[gone] = False
+            channel.present[added] = True
+            for name, _, _ in channel.fields:
+                channel.values[name][gone] = 0
+                channel.values[name][added] = 0
+            changed.update(added.tolist())
+            changed.update(gone.tolist())
+            for name, _, _ in channel.fields:
+                ids = _unpack_ids(next(arrays))
+                deltas = next(arrays)
+                channel.reserve(int(ids.max(initial=-1)) + 1)
+                channel.values[name][ids] += deltas
+                changed.update(ids.tolist())
+
+    def _sync(self, touched) -> None:
+        manager = self.manager
+        created = {}    # entity -> components to add in one go
+        emptied = []    # recorded ids that lost a component
+        for channel, changed in zip(self._channels, touched):
+            component_type = channel.component_type
+            store = manager.components[component_type]
+            ids = np.array(sorted(changed), dtype=np.int64)
+            if len(ids) == 0:
+                continue
+            present = channel.present[ids]
+            values = {
+                name: _dequantize(channel.values[name][ids], dtype, step).tolist()
+                for name, dtype, step in channel.fields
+            }
+            for row, recorded_id in enumerate(ids.tolist()):
+                entity = self._entities.get(recorded_id)
+                if not present[row]:
+                    if entity is not None and entity.id in store:
+                        manager.remove_component(entity, component_type)
+                        emptied.append(recorded_id)
+                    continue
+                if entity is None:
+                    entity = self._entities[recorded_id] = manager.create_enitity()
+                component = store.get(entity.id)
+                if component is None:
+                    component = component_type.__new__(component_type)
+                    for slot in component_type.transient:
+                        setattr(component, slot, None)
+                    for name, _, _ in channel.fields:
+                        setattr(component, component_type.fields[name].private, values[name][row])
+                    created.setdefault(entity, []).append(component)
+                    continue
+                for name, _, _ in channel.fields:
+                    value = values[name][row]
+                    if getattr(component, name) != value:
+                        setattr(component, name, value)
+        for entity, components in created.items():
+            manager.add_components(entity, components)
+        for recorded_id in emptied:
+            self._release(recorded_id)
+
+    def _release(self, recorded_id) -> None:
+        # Destroys the playback entity once none of its recorded components are left
+        entity = self._entities.get(recorded_id)
+        if entity is None or any(entity.id in self.manager.components[channel.component_type] for channel in self._channels):
+            return
+        self.manager.destroy_entity(entity)
+        del self._entities[recorded_id]
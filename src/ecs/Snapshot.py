@@ -0,0 +1,214 @@
+import importlib
+import json
+import pickle
+import struct
+import numpy as np
+from ecs.Archetype import Archetype
+from ecs.Manager import ECSManager
+
+# File layout, little-endian:
+#   MAGIC, version (uint32), index size (uint32), JSON index,
+#   then the data section: raw arrays, each starting on an ALIGNMENT boundary.
+# The index describes every array as {"offset", "dtype", "shape"}, with offsets
+# relative to the start of the data section, which is itself aligned.
+MAGIC = b"VXSNAP\r\n"
+VERSION = 1
+HEADER = struct.Struct("<8sII")
+ALIGNMENT = 64
+
+def _align(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+def component_type_name(component_type) -> str:
+    return f"{component_type.__module__}:{component_type.__qualname__}"
+
+def import_component_type(name: str):
+    module, _, qualname = name.partition(":")
+    component_type = importlib.import_module(module)
+    for part in qualname.split("."):
+        component_type = getattr(component_type, part)
+    return component_type
+
+def _slot_array(values):
+    # Numbers and bools become a typed column; anything else is pickled
+    kinds = {type(value) for value in values}
+    if kinds <= {bool}:
+        return np.array(values, dtype=np.bool_)
+    try:
+        if kinds <= {int}:
+            return np.array(values, dtype="<i8")
+        if kinds <= {int, float}:
+            return np.array(values, dtype="<f8")
+    except OverflowError:
+        pass
+    return None
+
+
+class _Writer:
+    def __init__(self):
+        self.arrays = []
+        self.size = 0
+
+    def add(self, array) -> dict:
+        array = np.ascontiguousarray(array)
+        if array.dtype.byteorder == ">":
+            array = array.astype(array.dtype.newbyteorder("<"))
+        offset = _align(self.size)
+        self.arrays.append((offset, array))
+        self.size = offset + array.nbytes
+        return {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+
+    def add_pickle(self, value) -> dict:
+        return self.add(np.frombuffer(pickle.dumps(value, pickle.HIGHEST_PROTOCOL), dtype=np.uint8))
+
+
+def save_world(manager: ECSManager, path) -> None:
+    """Writes every entity and component of `manager` to a snapshot file.
+
+    Field values are written as whole columns; other state slots as a typed
+    column when they hold numbers, otherwise pickled per component type.
+    """
+    writer = _Writer()
+    allocator = manager.allocator
+    index = {
+        "storage": manager.storage,
+        "generations": writer.add(np.array(allocator.generations, dtype="<i8")),
+        "free": writer.add(np.array(allocator._free, dtype="<i8")),
+        "entities": writer.add(np.array(sorted(manager.entities), dtype="<i8")),
+        "components": [],
+    }
+    for component_type, store in manager.components.items():
+        if not store:
+            continue
+        entity_ids, fields = manager.get_field_columns(component_type)
+        objects = [store[entity_id] for entity_id in entity_ids.tolist()]
+        skipped = {field.private for field in component_type.fields.values()} | set(component_type.transient)
+        slots, pickled = {}, {}
+        for slot in component_type._state_slots:
+            if slot in skipped:
+                continue
+            values = [getattr(component, slot, None) for component in objects]
+            array = _slot_array(values)
+            if array is None:
+                pickled[slot] = values
+            else:
+                slots[slot] = writer.add(array)
+        index["components"].append({
+            "type": component_type_name(component_type),
+            "entities": writer.add(entity_ids),
+            "fields": {name: writer.add(values) for name, values in fields.items()},
+            "slots": slots,
+            "pickled": writer.add_pickle(pickled) if pickled else None,
+        })
+
+    index_bytes = json.dumps(index).encode("utf-8")
+    data_start = _align(HEADER.size + len(index_bytes))
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(index_bytes)))
+        file.write(index_bytes)
+        for offset, array in writer.arrays:
+            file.seek(data_start + offset)
+            file.write(memoryview(array).cast("B"))
+        # Extends the file to its full size when the last array is empty
+        file.truncate(data_start + writer.size)
+
+
+def load_world(path, storage: str = None, mmap: bool = True) -> ECSManager:
+    """Reads a snapshot written by `save_world` into a new ECSManager.
+
+    Arrays are used straight from a memory map of the file (or one read of
+    it when `mmap` is False); entities keep their ids and generations.
+    `storage` defaults to the storage mode the world was saved with. Loaded
+    components count as changed, like newly added ones.
+
+    Snapshots may contain pickles: only load files you trust.
+    """
+    with open(path, "rb") as file:
+        magic, version, index_size = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a Vortex2D snapshot.")
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}, expected {VERSION}.")
+        index = json.loads(file.read(index_size))
+    data_start = _align(HEADER.size + index_size)
+    if mmap:
+        raw = np.memmap(path, dtype=np.uint8, mode="r")
+    else:
+        raw = np.fromfile(path, dtype=np.uint8)
+    data = raw[data_start:]
+
+    def array(entry):
+        dtype = np.dtype(entry["dtype"])
+        count = int(np.prod(entry["shape"], dtype=np.int64))
+        offset = entry["offset"]
+        return data[offset:offset + count * dtype.itemsize].view(dtype).reshape(entry["shape"])
+
+    manager = ECSManager(storage or index["storage"])
+    manager.allocator.generations = array(index["generations"]).tolist()
+    manager.allocator._free = array(index["free"]).tolist()
+    manager.entities = set(array(index["entities"]).tolist())
+
+    blocks = []
+    for entry in index["components"]:
+        component_type = import_component_type(entry["type"])
+        entity_ids = array(entry["entities"])
+        fields = {name: array(column) for name, column in entry["fields"].items()}
+        objects = _build_components(component_type, len(entity_ids), entry, array, fields, manager.storage)
+        _store(manager, component_type, entity_ids.tolist(), objects)
+        blocks.append((component_type, entity_ids, objects, fields))
+
+    if manager.storage == "archetype":
+        _build_archetypes(manager, blocks)
+    return manager
+
+def _build_components(component_type, count, entry, array, fields, storage) -> list:
+    new = component_type.__new__
+    objects = [new(component_type) for _ in range(count)]
+    values = {slot: array(column).tolist() for slot, column in entry["slots"].items()}
+    if entry["pickled"] is not None:
+        values.update(pickle.loads(array(entry["pickled"]).tobytes()))
+    if storage != "archetype":
+        # Archetype storage binds the components to columns instead
+        for name, column in fields.items():
+            values[component_type.fields[name].private] = column.tolist()
+    for slot in component_type.transient:
+        values[slot] = [None] * count
+    for slot, slot_values in values.items():
+        for component, value in zip(objects, slot_values):
+            setattr(component, slot, value)
+    return objects
+
+def _store(manager, component_type, entity_ids, objects) -> None:
+    manager.components[component_type].update(zip(entity_ids, objects))
+    if component_type.tracked:
+        changes = manager.changes[component_type]
+        for entity_id, component in zip(entity_ids, objects):
+            component._changes = changes
+            component._entity_id = entity_id
+        changes.update(entity_ids)
+
+def _build_archetypes(manager, blocks) -> None:
+    # Group entities by their exact set of component types, then fill each table at once
+    entity_count = len(manager.allocator.generations)
+    membership = np.zeros((entity_count, len(blocks)), dtype=bool)
+    for column, (_, entity_ids, _, _) in enumerate(blocks):
+        membership[entity_ids, column] = True
+    has_components = membership.any(axis=1)
+    if not has_components.any():
+        return
+    signatures, groups = np.unique(membership[has_components], axis=0, return_inverse=True)
+    candidates = np.flatnonzero(has_components)
+
+    for group, signature in enumerate(signatures):
+        entity_ids = candidates[groups.ravel() == group]
+        components, columns = {}, {}
+        for column in np.flatnonzero(signature).tolist():
+            component_type, block_ids, objects, fields = blocks[column]
+            positions = np.searchsorted(block_ids, entity_ids)
+            components[component_type] = [objects[position] for position in positions.tolist()]
+            columns[component_type] = {name: values[positions] for name, values in fields.items()}
+        key = frozenset(components)
+        archetype = manager.archetypes[key] = Archetype(key, capacity=max(64, len(entity_ids)))
+        ids = entity_ids.tolist()
+        archetype.extend(ids, components, columns)
+        manager.entity_archetypes.update(dict.fromkeys(ids, archetype))
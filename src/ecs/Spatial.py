@@ -0,0 +1,310 @@
+import math
+
+# Bounds are (x_min, y_min, x_max, y_max) tuples, as returned by Primitive2D.bounds
+
+def overlaps(a, b) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+def contains_point(bounds, x, y) -> bool:
+    return bounds[0] <= x <= bounds[2] and bounds[1] <= y <= bounds[3]
+
+def union(a, b):
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+def perimeter(bounds) -> float:
+    return 2 * ((bounds[2] - bounds[0]) + (bounds[3] - bounds[1]))
+
+
+class SpatialHash:
+    """Uniform grid of `cell_size` cells, each holding the items overlapping it.
+
+    Best when items are of similar size, around one cell.
+    """
+
+    def __init__(self, cell_size: float = 64):
+        self.cell_size = cell_size
+        self.cells = {}     # (cx, cy) -> set of items
+        self.bounds = {}    # item -> bounds
+        self._ranges = {}   # item -> covered cell range
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, item):
+        return item in self.bounds
+
+    def insert(self, item, bounds) -> None:
+        if item in self.bounds:
+            self.update(item, bounds)
+            return
+        self.bounds[item] = bounds
+        cell_range = self._cell_range(bounds)
+        self._ranges[item] = cell_range
+        for cell in self._cells_in(cell_range):
+            self.cells.setdefault(cell, set()).add(item)
+
+    def update(self, item, bounds) -> None:
+        cell_range = self._cell_range(bounds)
+        self.bounds[item] = bounds
+        if cell_range == self._ranges[item]:
+            return
+        self._unlink(item)
+        self._ranges[item] = cell_range
+        for cell in self._cells_in(cell_range):
+            self.cells.setdefault(cell, set()).add(item)
+
+    def remove(self, item) -> None:
+        self._unlink(item)
+        del self._ranges[item]
+        del self.bounds[item]
+
+    def query_region(self, x_min, y_min, x_max, y_max) -> list:
+        region = (x_min, y_min, x_max, y_max)
+        found = set()
+        for cell in self._cells_in(self._cell_range(region)):
+            items = self.cells.get(cell)
+            if items:
+                found.update(items)
+        return [item for item in found if overlaps(self.bounds[item], region)]
+
+    def query_point(self, x, y) -> list:
+        size = self.cell_size
+        items = self.cells.get((math.floor(x / size), math.floor(y / size)), ())
+        return [item for item in items if contains_point(self.bounds[item], x, y)]
+
+    def pairs(self) -> set:
+        found = set()
+        for items in self.cells.values():
+            if len(items) < 2:
+                continue
+            ordered = sorted(items)
+            for i, a in enumerate(ordered):
+                bounds_a = self.bounds[a]
+                for b in ordered[i + 1:]:
+                    if (a, b) not in found and overlaps(bounds_a, self.bounds[b]):
+                        found.add((a, b))
+        return found
+
+    def _cell_range(self, bounds):
+        size = self.cell_size
+        return (
+            math.floor(bounds[0] / size), math.floor(bounds[1] / size),
+            math.floor(bounds[2] / size), math.floor(bounds[3] / size),
+        )
+
+    @staticmethod
+    def _cells_in(cell_range):
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                yield (cx, cy)
+
+    def _unlink(self, item) -> None:
+        for cell in self._cells_in(self._ranges[item]):
+            items = self.cells[cell]
+            items.discard(item)
+            if not items:
+                del self.cells[cell]
+
+
+class _Node:
+    __slots__ = ("bounds", "parent", "left", "right", "height", "item")
+
+    def __init__(self, bounds, item=None):
+        self.bounds = bounds
+        self.parent = None
+        self.left = None
+        self.right = None
+        self.height = 0
+        self.item = item
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.left is None
+
+
+class AABBTree:
+    """Dynamic bounding volume tree, balanced with AVL-style rotations.
+
+    Leaves store bounds enlarged by `margin`, so small movements do not
+    touch the tree. Best for items of very different sizes or sparse worlds.
+    """
+
+    def __init__(self, margin: float = 4):
+        self.margin = margin
+        self.root = None
+        self.bounds = {}    # item -> exact bounds
+        self._leaves = {}   # item -> leaf node
+
+    def __len__(self):
+        return len(self.bounds)
+
+    def __contains__(self, item):
+        return item in self.bounds
+
+    def insert(self, item, bounds) -> None:
+        if item in self.bounds:
+            self.update(item, bounds)
+            return
+        self.bounds[item] = bounds
+        leaf = _Node(self._fatten(bounds), item)
+        self._leaves[item] = leaf
+        self._insert_leaf(leaf)
+
+    def update(self, item, bounds) -> None:
+        self.bounds[item] = bounds
+        leaf = self._leaves[item]
+        fat = leaf.bounds
+        if fat[0] <= bounds[0] and fat[1] <= bounds[1] and bounds[2] <= fat[2] and bounds[3] <= fat[3]:
+            return
+        self._remove_leaf(leaf)
+        leaf.bounds = self._fatten(bounds)
+        self._insert_leaf(leaf)
+
+    def remove(self, item) -> None:
+        self._remove_leaf(self._leaves.pop(item))
+        del self.bounds[item]
+
+    def query_region(self, x_min, y_min, x_max, y_max) -> list:
+        region = (x_min, y_min, x_max, y_max)
+        return [item for item in self._query(region) if overlaps(self.bounds[item], region)]
+
+    def query_point(self, x, y) -> list:
+        return self.query_region(x, y, x, y)
+
+    def pairs(self) -> set:
+        found = set()
+        for item, leaf in self._leaves.items():
+            bounds = self.bounds[item]
+            for other in self._query(leaf.bounds):
+                if other == item:
+                    continue
+                pair = (item, other) if item < other else (other, item)
+                if pair not in found and overlaps(bounds, self.bounds[other]):
+                    found.add(pair)
+        return found
+
+    def _fatten(self, bounds):
+        m = self.margin
+        return (bounds[0] - m, bounds[1] - m, bounds[2] + m, bounds[3] + m)
+
+    def _query(self, region):
+        if self.root is None:
+            return
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            if not overlaps(node.bounds, region):
+                continue
+            if node.is_leaf:
+                yield node.item
+            else:
+                stack.append(node.left)
+                stack.append(node.right)
+
+    def _insert_leaf(self, leaf) -> None:
+        if self.root is None:
+            self.root = leaf
+            leaf.parent = None
+            return
+
+        # Descend towards the sibling with the smallest perimeter increase
+        bounds = leaf.bounds
+        node = self.root
+        while not node.is_leaf:
+            combined = perimeter(union(node.bounds, bounds))
+            cost = 2 * combined
+            inheritance = 2 * (combined - perimeter(node.bounds))
+            cost_left = self._descend_cost(node.left, bounds) + inheritance
+            cost_right = self._descend_cost(node.right, bounds) + inheritance
+            if cost < cost_left and cost < cost_right:
+                break
+            node = node.left if cost_left < cost_right else node.right
+
+        sibling = node
+        old_parent = sibling.parent
+        parent = _Node(union(sibling.bounds, bounds))
+        parent.parent = old_parent
+        parent.height = sibling.height + 1
+        parent.left = sibling
+        parent.right = leaf
+        sibling.parent = parent
+        leaf.parent = parent
+        if old_parent is None:
+            self.root = parent
+        elif old_parent.left is sibling:
+            old_parent.left = parent
+        else:
+            old_parent.right = parent
+        self._refit(leaf.parent)
+
+    @staticmethod
+    def _descend_cost(node, bounds) -> float:
+        cost = perimeter(union(node.bounds, bounds))
+        if not node.is_leaf:
+            cost -= perimeter(node.bounds)
+        return cost
+
+    def _remove_leaf(self, leaf) -> None:
+        if leaf is self.root:
+            self.root = None
+            return
+        parent = leaf.parent
+        grandparent = parent.parent
+        sibling = parent.right if parent.left is leaf else parent.left
+        if grandparent is None:
+            self.root = sibling
+            sibling.parent = None
+        else:
+            if grandparent.left is parent:
+                grandparent.left = sibling
+            else:
+                grandparent.right = sibling
+            sibling.parent = grandparent
+            self._refit(grandparent)
+        leaf.parent = None
+
+    def _refit(self, node) -> None:
+        while node is not None:
+            node = self._balance(node)
+            node.height = 1 + max(node.left.height, node.right.height)
+            node.bounds = union(node.left.bounds, node.right.bounds)
+            node = node.parent
+
+    def _balance(self, a):
+        # Rotates the taller grandchild up when a's subtrees differ in height by 2+
+        if a.is_leaf or a.height < 2:
+            return a
+        b, c = a.left, a.right
+        balance = c.height - b.height
+        if balance > 1:
+            return self._rotate(a, c, b, is_right=True)
+        if balance < -1:
+            return self._rotate(a, b, c, is_right=False)
+        return a
+
+    def _rotate(self, a, up, other, is_right):
+        # `up` (a child of a) takes a's place; a keeps `other` plus up's shorter child
+        f, g = up.left, up.right
+        up.left = a
+        up.parent = a.parent
+        a.parent = up
+        if up.parent is None:
+            self.root = up
+        elif up.parent.left is a:
+            up.parent.left = up
+        else:
+            up.parent.right = up
+
+        taller, shorter = (f, g) if f.height > g.height else (g, f)
+        up.right = taller
+        if is_right:
+            a.right = shorter
+        else:
+            a.left = shorter
+        shorter.parent = a
+        a.bounds = union(other.bounds, shorter.bounds)
+        a.height = 1 + max(other.height, shorter.height)
+        up.bounds = union(a.bounds, taller.bounds)
+        up.height = 1 + max(a.height, taller.height)
+        return up
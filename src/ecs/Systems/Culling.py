@@ -0,0 +1,77 @@
+from ecs.Components.Camera import Camera2D
+from ecs.Components.Hierarchy import Hierarchy, NO_PARENT
+from ecs.Components.Transform import Transform2D, compute_bounds
+from ecs.Systems.base import System
+import numpy as np
+
+class CullingSystem(System):
+    """Finds the entities of a `SpatialIndexSystem` whose bounds overlap a camera's view.
+
+    Renderers given this system only draw `visible`. With a `HierarchySystem`,
+    children are re-indexed by their world bounds, so add this system after
+    both the spatial index and the hierarchy.
+    """
+
+    reads = (Camera2D, Transform2D, Hierarchy)
+
+    def __init__(self, spatial, camera=None, hierarchy=None, margin: float = 0.0):
+        self.spatial = spatial
+        # Re-indexing children writes the shared index; world matrices come from the hierarchy
+        self.writes = (spatial.index,)
+        if hierarchy is not None:
+            self.reads = self.reads + (hierarchy,)
+        # Entity id of the camera, None uses the first entity with a Camera2D
+        self.camera = camera
+        self.hierarchy = hierarchy
+        # Extra world units around the view, for sprites drawn beyond their bounds
+        self.margin = margin
+        # Entity ids to draw, None when there is no camera and nothing is culled
+        self.visible = None
+        # Camera bounds of the last update, (x_min, y_min, x_max, y_max)
+        self.view = None
+        self.visible_count = 0
+        self.culled_count = 0
+
+    def update(self, manager, dt: float = 0.0) -> None:
+        if self.hierarchy is not None:
+            self._index_world_bounds(manager)
+
+        camera = self.get_camera(manager)
+        total = len(self.spatial.index)
+        if camera is None:
+            self.visible = None
+            self.view = None
+            self.visible_count = total
+            self.culled_count = 0
+            return
+
+        self.view = camera.bounds
+        x_min, y_min, x_max, y_max = self.view
+        m = self.margin
+        self.visible = set(self.spatial.query_region(x_min - m, y_min - m, x_max + m, y_max + m))
+        self.visible_count = len(self.visible)
+        self.culled_count = total - self.visible_count
+
+    def get_camera(self, manager) -> Camera2D:
+        cameras = manager.components[Camera2D]
+        if self.camera is not None:
+            return cameras.get(self.camera)
+        return next(iter(cameras.values()), None)
+
+    def _index_world_bounds(self, manager) -> None:
+        # SpatialIndexSystem only knows local transforms; fix up children that moved
+        hierarchy = self.hierarchy
+        index = self.spatial.index
+        entity_ids = [entity_id for entity_id in hierarchy.world_changed.tolist() if entity_id in index]
+        if not entity_ids:
+            return
+        rows = np.array([hierarchy.rows[entity_id] for entity_id in entity_ids], dtype=np.int64)
+        attached = hierarchy.parent_rows[rows] != NO_PARENT
+        if not attached.any():
+            return
+        transforms = manager.components[Transform2D]
+        children = [entity_id for entity_id, keep in zip(entity_ids, attached.tolist()) if keep]
+        sizes = np.array([(transforms[entity_id].width, transforms[entity_id].height) for entity_id in children])
+        bounds = compute_bounds(hierarchy.world[rows[attached]], sizes[:, 0], sizes[:, 1])
+        for entity_id, box in zip(children, bounds.tolist()):
+            index.update(entity_id, tuple(box))
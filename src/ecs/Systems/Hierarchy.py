@@ -0,0 +1,113 @@
+from ecs.Components.Hierarchy import Hierarchy, NO_PARENT
+from ecs.Components.Transform import Transform2D
+from ecs.Systems.base import System
+import numpy as np
+
+class HierarchySystem(System):
+    """Computes world matrices for entities with `Transform2D` and `Hierarchy`.
+
+    Nodes are kept sorted by depth so each level is multiplied with its
+    parents' world matrices in one batched matmul. Only subtrees below a
+    changed `Transform2D` are recomputed.
+    """
+
+    reads = (Transform2D, Hierarchy)
+
+    def __init__(self, dtype=np.float32):
+        # The world matrices are shared state: systems reading them run after this one
+        self.writes = (self,)
+        self.dtype = dtype
+        self.order = np.empty(0, dtype=np.int64)   # entity ids, sorted by depth
+        self.rows = {}                             # entity id -> row in order
+        self.parent_rows = np.empty(0, dtype=np.int64)
+        self.levels = []                           # (start, end) rows of each depth
+        self.world = np.empty((0, 3, 3), dtype=dtype)
+        # Entity ids whose world matrix was recomputed by the last update
+        self.world_changed = np.empty(0, dtype=np.int64)
+
+    def update(self, manager, dt: float = 0.0) -> None:
+        query = manager.query(Transform2D, Hierarchy)
+        restructured = self._restructured(manager, query)
+        if restructured:
+            self._rebuild(manager, query)
+            dirty = np.ones(len(self.order), dtype=bool)
+        else:
+            dirty = np.zeros(len(self.order), dtype=bool)
+            rows = [self.rows[entity_id] for entity_id in manager.get_changed_entities(Transform2D) if entity_id in self.rows]
+            dirty[rows] = True
+
+        transforms = manager.components[Transform2D]
+        for start, end in self.levels:
+            parents = self.parent_rows[start:end]
+            has_parent = parents != NO_PARENT
+            # A node is dirty if it changed itself or its parent was recomputed
+            dirty[start:end][has_parent] |= dirty[parents[has_parent]]
+            level_dirty = np.flatnonzero(dirty[start:end]) + start
+            if len(level_dirty) == 0:
+                continue
+            local = Transform2D.get_transformation_matrices(
+                (transforms[entity_id] for entity_id in self.order[level_dirty]), dtype=self.dtype
+            )
+            parents = self.parent_rows[level_dirty]
+            has_parent = parents != NO_PARENT
+            local[has_parent] = self.world[parents[has_parent]] @ local[has_parent]
+            self.world[level_dirty] = local
+        self.world_changed = self.order[dirty]
+
+    def get_world_matrix(self, entity_id) -> np.ndarray:
+        return self.world[self.rows[entity_id]]
+
+    def _restructured(self, manager, query) -> bool:
+        # Parents changed, or entities joined or left the query
+        if manager.get_changed_entities(Hierarchy) or manager.get_removed_entities(Hierarchy):
+            return True
+        if len(query) != len(self.order):
+            return True
+        rows = self.rows
+        if any(entity_id in rows for entity_id in manager.get_removed_entities(Transform2D)):
+            return True
+        return any(entity_id not in rows and entity_id in query for entity_id in manager.get_changed_entities(Transform2D))
+
+    def _rebuild(self, manager, query) -> None:
+        hierarchy = manager.components[Hierarchy]
+        # Live parent of every node, stale parents make their children roots
+        generations = manager.allocator.generations
+        parents = {entity_id: hierarchy[entity_id].get_parent(generations) for entity_id in query}
+        depths = {}
+        for entity_id in query:
+            self._depth(entity_id, parents, query, depths)
+
+        order = sorted(query, key=depths.__getitem__)
+        self.order = np.array(order, dtype=np.int64)
+        self.rows = {entity_id: row for row, entity_id in enumerate(order)}
+        self.parent_rows = np.array(
+            [self.rows.get(parents[entity_id], NO_PARENT) for entity_id in order],
+            dtype=np.int64,
+        )
+        self.world = np.empty((len(order), 3, 3), dtype=self.dtype)
+
+        self.levels = []
+        start = 0
+        for row in range(1, len(order) + 1):
+            if row == len(order) or depths[order[row]] != depths[order[start]]:
+                self.levels.append((start, row))
+                start = row
+
+    def _depth(self, entity_id, parents, query, depths) -> None:
+        # Walk up to the first node with a known depth, then fill in the chain
+        chain = []
+        node = entity_id
+        while node not in depths:
+            if node in chain:
+                raise ValueError(f"Hierarchy cycle through entity {node}.")
+            parent = parents[node]
+            if parent == NO_PARENT or parent not in query:
+                # Parents without Transform2D/Hierarchy make the node a root
+                depths[node] = 0
+                break
+            chain.append(node)
+            node = parent
+        depth = depths[node]
+        for node in reversed(chain):
+            depth += 1
+            depths[node] = depth
@@ -0,0 +1,65 @@
+from ecs.Components.Transform import Transform2D
+from ecs.Systems.base import System
+import numpy as np
+
+class InterpolationSystem(System):
+    """Affine world matrices of every `Transform2D` at the last two fixed steps.
+
+    Run it after every other system, once per fixed step; a `GameLoop` given it
+    as `interpolation` does so. Renderers then draw `blend(entity_ids, alpha)`,
+    the matrices `alpha` of the way from the previous step to the current one.
+    """
+
+    def __init__(self, hierarchy=None):
+        # Children use the world matrices computed by the HierarchySystem
+        self.hierarchy = hierarchy
+        self.reads = (Transform2D,) + ((hierarchy,) if hierarchy is not None else ())
+        self.writes = (self,)
+        # (2, 3) matrices by entity id, and the generation each id had, -1 for none
+        self.previous = np.zeros((0, 2, 3), dtype=np.float32)
+        self.current = np.zeros((0, 2, 3), dtype=np.float32)
+        self.previous_generations = np.full(0, -1, dtype=np.int64)
+        self.generations = np.full(0, -1, dtype=np.int64)
+        # Entity ids whose matrix differs between the two steps
+        self.moving = np.empty(0, dtype=np.int64)
+
+    def update(self, manager, dt: float = 0.0) -> None:
+        entity_ids, matrices = self._matrices(manager)
+        size = len(manager.allocator.generations)
+        current = np.zeros((size, 2, 3), dtype=np.float32)
+        current[entity_ids] = matrices
+        generations = np.full(size, -1, dtype=np.int64)
+        generations[entity_ids] = np.asarray(manager.allocator.generations, dtype=np.int64)[entity_ids]
+        self.previous, self.previous_generations = self.current, self.generations
+        self.current, self.generations = current, generations
+
+        # Only the same entity at both steps is blended, not a recycled id
+        count = min(len(self.previous), size)
+        same = (generations[:count] >= 0) & (generations[:count] == self.previous_generations[:count])
+        moved = (current[:count] != self.previous[:count]).any(axis=(1, 2))
+        self.moving = np.flatnonzero(same & moved)
+
+    def blend(self, entity_ids, alpha: float) -> np.ndarray:
+        # Entity ids should come from `moving`, others are not guaranteed to have a previous matrix
+        previous = self.previous[entity_ids]
+        return previous + (self.current[entity_ids] - previous) * np.float32(alpha)
+
+    def _matrices(self, manager):
+        if manager.storage == "archetype":
+            entity_ids = [np.empty(0, dtype=np.int64)]
+            matrices = [np.empty((0, 2, 3), dtype=np.float32)]
+            for archetype in manager.get_archetypes_with_components(Transform2D):
+                entity_ids.append(archetype.entity_ids())
+                matrices.append(Transform2D.get_archetype_transformation_matrices(archetype, affine=True))
+            entity_ids = np.concatenate(entity_ids)
+            matrices = np.concatenate(matrices)
+        else:
+            transforms = manager.components[Transform2D]
+            entity_ids = np.fromiter(transforms.keys(), dtype=np.int64, count=len(transforms))
+            matrices = Transform2D.get_transformation_matrices(transforms.values(), affine=True)
+        if self.hierarchy is not None:
+            rows = self.hierarchy.rows
+            rows = np.fromiter((rows.get(entity_id, -1) for entity_id in entity_ids.tolist()), dtype=np.int64, count=len(entity_ids))
+            attached = rows >= 0
+            matrices[attached] = self.hierarchy.world[rows[attached], :2]
+        return entity_ids, matrices
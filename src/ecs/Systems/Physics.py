@@ -0,0 +1,206 @@
+import math
+import numpy as np
+import pymunk
+import pymunk.batch
+from ecs.Components.Primitives import Box2D, Circle2D, Polygon2D, Triangle2D
+from ecs.Components.RigidBody import RigidBody, DYNAMIC, KINEMATIC, STATIC
+from ecs.Components.Transform import Transform2D
+from ecs.Systems.base import System
+
+SHAPE_TYPES = (Box2D, Circle2D, Polygon2D, Triangle2D)
+
+BODY_TYPES = {
+    DYNAMIC: pymunk.Body.DYNAMIC,
+    KINEMATIC: pymunk.Body.KINEMATIC,
+    STATIC: pymunk.Body.STATIC,
+}
+
+# Per body in the batch float buffer: x, y, angle
+SYNC_FIELDS = pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION | pymunk.batch.BodyFields.ANGLE
+
+def _to_local(points, position, angle):
+    # World space points into the frame of a body at position, rotated by angle
+    cos_a, sin_a = math.cos(-angle), math.sin(-angle)
+    px, py = position
+    return [
+        ((x - px) * cos_a - (y - py) * sin_a, (x - px) * sin_a + (y - py) * cos_a)
+        for x, y in points
+    ]
+
+class PhysicsSystem(System):
+    """Simulates entities with `Transform2D`, `RigidBody` and a primitive in pymunk.
+
+    The primitive, in world space when the body is created, gives the
+    collision shape. Bodies sit at the transform's pivot; after each step
+    only bodies that actually moved are written back to `Transform2D`.
+    """
+
+    reads = (RigidBody,) + SHAPE_TYPES
+    writes = (Transform2D,)
+
+    def __init__(self, gravity=(0, 900), iterations: int = 10, sleep_time_threshold: float = 0.5):
+        self.space = pymunk.Space()
+        self.space.gravity = gravity
+        self.space.iterations = iterations
+        self.space.sleep_time_threshold = sleep_time_threshold
+        self.bodies = {}           # entity id -> pymunk.Body
+        self._entities = {}        # pymunk body id -> entity id
+        self._sources = {}         # entity id -> what its body was built from, see _body_sources
+        self._synced = {}          # entity id -> (x, y, rotation) last written to its Transform2D
+        self._buffer = pymunk.batch.Buffer()
+        self._previous_ids = np.empty(0, dtype=np.uintp)
+        self._previous_state = np.empty((0, 3), dtype=np.float64)
+
+    def update(self, manager, dt: float) -> None:
+        # Must run before manager.clear_changes()
+        self._sync_bodies(manager)
+        self._push_teleports(manager)
+        self.space.step(dt)
+        self._pull_moved(manager)
+
+    def get_body(self, entity_id) -> pymunk.Body:
+        return self.bodies.get(entity_id)
+
+    def _sync_bodies(self, manager) -> None:
+        # Bodies are rebuilt when a needed component was removed or replaced, or the
+        # RigidBody changed; created once Transform2D, RigidBody and a primitive are all there.
+        # The change sets last the whole frame, so a body is compared with what it was
+        # built from and only rebuilt once, not on every fixed step of the frame.
+        query = manager.query(Transform2D, RigidBody)
+        stale = manager.get_removed_entities(RigidBody) | manager.get_changed_entities(RigidBody)
+        stale |= manager.get_removed_entities(Transform2D)
+        arrived = set(manager.get_changed_entities(Transform2D))
+        for shape_type in SHAPE_TYPES:
+            stale |= manager.get_removed_entities(shape_type)
+            arrived |= manager.get_changed_entities(shape_type)
+        for entity_id in stale:
+            sources = self._body_sources(manager, entity_id, query)
+            if not self._built_from(entity_id, sources):
+                self._remove_body(entity_id)
+                if sources is not None:
+                    self._create_body(entity_id, sources)
+        for entity_id in arrived - stale:
+            if entity_id not in self.bodies:
+                sources = self._body_sources(manager, entity_id, query)
+                if sources is not None:
+                    self._create_body(entity_id, sources)
+
+    @staticmethod
+    def _body_sources(manager, entity_id, query):
+        # (generation, components, RigidBody values) a body is built from, None if incomplete
+        if entity_id not in query:
+            return None
+        primitive = next(
+            (manager.components[ct][entity_id] for ct in SHAPE_TYPES if entity_id in manager.components[ct]),
+            None,
+        )
+        if primitive is None:
+            return None
+        rigid_body = manager.components[RigidBody][entity_id]
+        components = (manager.components[Transform2D][entity_id], rigid_body, primitive)
+        values = (rigid_body.body_type, rigid_body.mass, rigid_body.friction, rigid_body.elasticity)
+        return manager.allocator.generations[entity_id], components, values
+
+    def _built_from(self, entity_id, sources) -> bool:
+        built = self._sources.get(entity_id)
+        if built is None or sources is None:
+            return built is sources
+        # Components by identity: a replaced one must rebuild even if equal
+        return (
+            built[0] == sources[0]
+            and all(old is new for old, new in zip(built[1], sources[1]))
+            and built[2] == sources[2]
+        )
+
+    def _create_body(self, entity_id, sources) -> None:
+        transform, rigid_body, primitive = sources[1]
+
+        position = (transform.x + transform.pivot_x, transform.y + transform.pivot_y)
+        body_type = BODY_TYPES[rigid_body.body_type]
+        body = pymunk.Body(body_type=body_type)
+        body.position = position
+        body.angle = math.radians(transform.rotation)
+
+        if isinstance(primitive, Circle2D):
+            offset = _to_local([(primitive.x, primitive.y)], position, body.angle)[0]
+            shape = pymunk.Circle(body, primitive.radius, offset)
+            moment = pymunk.moment_for_circle(rigid_body.mass, 0, primitive.radius, offset)
+        else:
+            if isinstance(primitive, Box2D):
+                points = [
+                    (primitive.x_min, primitive.y_min), (primitive.x_max, primitive.y_min),
+                    (primitive.x_max, primitive.y_max), (primitive.x_min, primitive.y_max),
+                ]
+            else:
+                points = primitive.points
+            vertices = _to_local(points, position, body.angle)
+            shape = pymunk.Poly(body, vertices)
+            moment = pymunk.moment_for_poly(rigid_body.mass, vertices)
+        if body_type == pymunk.Body.DYNAMIC:
+            body.mass = rigid_body.mass
+            body.moment = moment
+        shape.friction = rigid_body.friction
+        shape.elasticity = rigid_body.elasticity
+
+        self.space.add(body, shape)
+        self.bodies[entity_id] = body
+        self._entities[body.id] = entity_id
+        self._sources[entity_id] = sources
+        self._synced[entity_id] = (transform.x, transform.y, transform.rotation)
+
+    def _remove_body(self, entity_id) -> None:
+        body = self.bodies.pop(entity_id, None)
+        if body is None:
+            return
+        self.space.remove(body, *body.shapes)
+        del self._entities[body.id]
+        del self._synced[entity_id]
+        del self._sources[entity_id]
+
+    def _push_teleports(self, manager) -> None:
+        # Transforms changed by game code, not by our own write-back
+        transforms = manager.components[Transform2D]
+        for entity_id in manager.get_changed_entities(Transform2D):
+            body = self.bodies.get(entity_id)
+            if body is None:
+                continue
+            transform = transforms[entity_id]
+            current = (transform.x, transform.y, transform.rotation)
+            if current == self._synced[entity_id]:
+                continue
+            body.position = (transform.x + transform.pivot_x, transform.y + transform.pivot_y)
+            body.angle = math.radians(transform.rotation)
+            if body.body_type == pymunk.Body.STATIC:
+                self.space.reindex_shapes_for_body(body)
+            self._synced[entity_id] = current
+
+    def _pull_moved(self, manager) -> None:
+        buffer = self._buffer
+        buffer.clear()
+        pymunk.batch.get_space_bodies(self.space, SYNC_FIELDS, buffer)
+        ids = np.frombuffer(buffer.int_buf(), dtype=np.uintp)
+        state = np.frombuffer(buffer.float_buf(), dtype=np.float64).reshape(-1, 3)
+        order = np.argsort(ids)
+        ids = ids[order]
+        state = state[order]
+
+        if np.array_equal(ids, self._previous_ids):
+            moved = np.flatnonzero(np.any(state != self._previous_state, axis=1))
+        else:
+            moved = np.arange(len(ids))
+        self._previous_ids = ids
+        self._previous_state = state
+
+        transforms = manager.components[Transform2D]
+        for row, (x, y, angle) in zip(moved.tolist(), state[moved].tolist()):
+            entity_id = self._entities.get(ids[row].item())
+            if entity_id is None:
+                continue
+            transform = transforms.get(entity_id)
+            if transform is None:
+                continue
+            transform.x = x - transform.pivot_x
+            transform.y = y - transform.pivot_y
+            transform.rotation = math.degrees(angle)
+            # Read back, columns may round the values
+            self._synced[entity_id] = (transform.x, transform.y, transform.rotation)
@@ -0,0 +1,39 @@
+from ecs.Components.Primitives import Box2D, Circle2D, Polygon2D, Triangle2D
+from ecs.Spatial import SpatialHash
+from ecs.Systems.base import System
+
+PRIMITIVE_TYPES = (Box2D, Circle2D, Polygon2D, Triangle2D)
+
+class SpatialIndexSystem(System):
+    """Keeps a spatial index of entity ids in sync with their primitive bounds.
+
+    Each entity is expected to have at most one of `component_types`.
+    """
+
+    def __init__(self, index=None, component_types=PRIMITIVE_TYPES):
+        self.index = index if index is not None else SpatialHash()
+        self.component_types = component_types
+        self.reads = tuple(component_types)
+        # The index is shared state too: systems using it conflict with this one
+        self.writes = (self.index,)
+
+    def update(self, manager, dt: float = 0.0) -> None:
+        # Must run before manager.clear_changes()
+        stores = [manager.components[component_type] for component_type in self.component_types]
+        # All removals first: a recycled id may have lost one type and gained another
+        for component_type in self.component_types:
+            for entity_id in manager.get_removed_entities(component_type):
+                if entity_id in self.index and not any(entity_id in store for store in stores):
+                    self.index.remove(entity_id)
+        for component_type, store in zip(self.component_types, stores):
+            for entity_id in manager.get_changed_entities(component_type):
+                self.index.insert(entity_id, store[entity_id].bounds)
+
+    def query_region(self, x_min, y_min, x_max, y_max) -> list:
+        return self.index.query_region(x_min, y_min, x_max, y_max)
+
+    def query_point(self, x, y) -> list:
+        return self.index.query_point(x, y)
+
+    def pairs(self) -> set:
+        return self.index.pairs()
@@ -0,0 +1,12 @@
+class System:
+    """Logic run every step by a Scheduler.
+
+    `reads` and `writes` list the component types the system accesses; the
+    scheduler runs systems in parallel only when these do not conflict.
+    """
+
+    reads = ()
+    writes = ()
+
+    def update(self, manager, dt: float) -> None:
+        raise NotImplementedError
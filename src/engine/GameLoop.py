@@ -0,0 +1,157 @@
+import time
+import numpy as np
+from engine.Profiler import profiler
+
+class FrameTimings:
+    """Rolling window of per-phase frame times, in seconds."""
+
+    def __init__(self, phases, history: int = 300):
+        self.phases = tuple(phases)
+        self.history = history
+        self.samples = np.zeros((history, len(self.phases)), dtype=np.float64)
+        self.count = 0
+
+    def record(self, durations) -> None:
+        self.samples[self.count % self.history] = durations
+        self.count += 1
+
+    def _window(self) -> np.ndarray:
+        return self.samples[:min(self.count, self.history)]
+
+    def percentile(self, phase: str, q: float) -> float:
+        window = self._window()
+        if len(window) == 0:
+            return 0.0
+        return float(np.percentile(window[:, self.phases.index(phase)], q))
+
+    def frame_percentile(self, q: float) -> float:
+        window = self._window()
+        if len(window) == 0:
+            return 0.0
+        return float(np.percentile(window.sum(axis=1), q))
+
+    def summary(self, percentiles=(50, 95, 99)) -> dict:
+        window = self._window()
+        columns = {phase: window[:, i] for i, phase in enumerate(self.phases)}
+        columns["frame"] = window.sum(axis=1)
+        summary = {}
+        for name, values in columns.items():
+            if len(values) == 0:
+                summary[name] = {f"p{q}": 0.0 for q in percentiles} | {"max": 0.0}
+                continue
+            summary[name] = {f"p{q}": float(v) for q, v in zip(percentiles, np.percentile(values, percentiles))}
+            summary[name]["max"] = float(values.max())
+        return summary
+
+
+class GameLoop:
+    """Fixed-timestep simulation with interpolated rendering.
+
+    Systems run in steps of exactly `fixed_dt`; renderers get the fraction of
+    a step left over as `alpha` to interpolate between the last two states,
+    which `interpolation`, an `InterpolationSystem`, records after every step.
+    Frame times above `max_frame_time` are clamped and at most `max_steps`
+    steps run per frame, so a slow frame cannot snowball into slower ones.
+    """
+
+    PHASES = ("input", "systems", "render", "swap")
+
+    def __init__(
+        self,
+        window,
+        manager = None,
+        fixed_dt: float = 1 / 60,
+        max_frame_time: float = 0.25,
+        max_steps: int = 5,
+        history: int = 300,
+        clock = time.perf_counter,
+        interpolation = None
+    ):
+        if interpolation is not None and manager is None:
+            raise ValueError("Interpolation needs the manager whose transforms it records.")
+        self.window = window
+        self.manager = manager
+        self.interpolation = interpolation
+        self.fixed_dt = fixed_dt
+        self.max_frame_time = max_frame_time
+        self.max_steps = max_steps
+        self.clock = clock
+        self.systems = []
+        self.renderers = []
+        self.timings = FrameTimings(self.PHASES, history)
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.frame = 0
+        self.simulation_time = 0.0
+        # Simulation time thrown away to stay real-time, in seconds
+        self.dropped_time = 0.0
+
+    def add_system(self, system) -> None:
+        # Called as system(dt) once per fixed step
+        self.systems.append(system)
+
+    def add_renderer(self, renderer) -> None:
+        # Called as renderer(alpha) once per frame, before the window draws
+        self.renderers.append(renderer)
+
+    def run(self) -> None:
+        previous = self.clock()
+        while not self.window.should_close():
+            now = self.clock()
+            self.step(now - previous)
+            previous = now
+
+    def step(self, frame_time: float) -> int:
+        with profiler.zone("GameLoop.step"):
+            steps = self._step(frame_time)
+        profiler.next_frame()
+        return steps
+
+    def _step(self, frame_time: float) -> int:
+        clock = self.clock
+        start = clock()
+        if self.manager is not None:
+            # Applied before systems run, so they see the changes and removals it makes
+            self.manager.flush()
+        self.window.poll_events()
+        input_done = clock()
+
+        if frame_time > self.max_frame_time:
+            self.dropped_time += frame_time - self.max_frame_time
+            frame_time = self.max_frame_time
+        self.accumulator += frame_time
+        steps = 0
+        while self.accumulator >= self.fixed_dt and steps < self.max_steps:
+            for system in self.systems:
+                system(self.fixed_dt)
+            if self.interpolation is not None:
+                self.interpolation.update(self.manager, self.fixed_dt)
+            self.accumulator -= self.fixed_dt
+            self.simulation_time += self.fixed_dt
+            steps += 1
+        if self.accumulator >= self.fixed_dt:
+            # Still behind after max_steps: keep only the partial step
+            behind = self.accumulator - self.accumulator % self.fixed_dt
+            self.dropped_time += behind
+            self.accumulator -= behind
+        systems_done = clock()
+
+        self.alpha = self.accumulator / self.fixed_dt
+        for renderer in self.renderers:
+            renderer(self.alpha)
+        self.window.render()
+        render_done = clock()
+
+        self.window.swap_buffers()
+        swap_done = clock()
+
+        if self.manager is not None:
+            self.manager.clear_changes()
+        self.timings.record((
+            input_done - start,
+            systems_done - input_done,
+            render_done - systems_done,
+            swap_done - render_done,
+        ))
+        self.frame += 1
+        return steps
@@ -0,0 +1,149 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+class _NullZone:
+    # Shared by every zone while profiling is disabled
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_ZONE = _NullZone()
+
+class _Zone:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc):
+        profiler = self.profiler
+        end = profiler.clock()
+        profiler._record(self.name, self.start, end - self.start)
+        return False
+
+
+class Profiler:
+    """Records named zones of work, per frame and per thread.
+
+    Zones are opened with `zone(name)` or the `profile` decorator. While
+    `enabled` is False they cost one attribute check. Events are kept in a
+    ring of `max_events` and can be exported as a Chrome trace
+    (chrome://tracing, Perfetto) or summarized in process.
+    """
+
+    def __init__(self, enabled: bool = False, max_events: int = 100_000, clock=time.perf_counter_ns):
+        self.enabled = enabled
+        # Returns nanoseconds
+        self.clock = clock
+        # (name, thread id, start ns, duration ns, frame)
+        self.events = deque(maxlen=max_events)
+        self.frame = 0
+        self._threads = {}   # thread id -> thread name
+
+    def zone(self, name: str):
+        if not self.enabled:
+            return _NULL_ZONE
+        return _Zone(self, name)
+
+    def profile(self, name=None):
+        """Decorator timing every call, as `@profile` or `@profile("name")`."""
+        def decorate(function):
+            zone_name = name if isinstance(name, str) else function.__qualname__
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return function(*args, **kwargs)
+                with _Zone(self, zone_name):
+                    return function(*args, **kwargs)
+            return wrapper
+
+        if callable(name):
+            return decorate(name)
+        return decorate
+
+    def next_frame(self) -> None:
+        # Called once per frame by the GameLoop; events are tagged with the current frame
+        self.frame += 1
+
+    def clear(self) -> None:
+        self.events.clear()
+
+    def _record(self, name, start, duration) -> None:
+        thread_id = threading.get_ident()
+        if thread_id not in self._threads:
+            self._threads[thread_id] = threading.current_thread().name
+        self.events.append((name, thread_id, start, duration, self.frame))
+
+    def frame_zones(self, frame: int = None) -> dict:
+        """Zone name -> total milliseconds in `frame`, by default the last finished one."""
+        if frame is None:
+            frame = self.frame - 1
+        totals = defaultdict(float)
+        for name, _, _, duration, event_frame in self.events:
+            if event_frame == frame:
+                totals[name] += duration / 1e6
+        return dict(totals)
+
+    def summary(self) -> dict:
+        """Zone name -> count, total, mean and max milliseconds over the kept events."""
+        durations = defaultdict(list)
+        for name, _, _, duration, _ in self.events:
+            durations[name].append(duration)
+        summary = {}
+        for name, values in durations.items():
+            total = sum(values) / 1e6
+            summary[name] = {
+                "count": len(values),
+                "total_ms": total,
+                "mean_ms": total / len(values),
+                "max_ms": max(values) / 1e6,
+            }
+        return summary
+
+    def report(self) -> str:
+        lines = [f"{'zone':<32} {'count':>8} {'total ms':>10} {'mean ms':>9} {'max ms':>9}"]
+        rows = sorted(self.summary().items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        for name, stats in rows:
+            lines.append(
+                f"{name:<32} {stats['count']:>8} {stats['total_ms']:>10.3f} "
+                f"{stats['mean_ms']:>9.3f} {stats['max_ms']:>9.3f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> dict:
+        pid = os.getpid()
+        events = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+            for thread_id, name in self._threads.items()
+        ]
+        events.extend(
+            {
+                "name": name, "ph": "X", "pid": pid, "tid": thread_id,
+                "ts": start / 1e3, "dur": duration / 1e3, "args": {"frame": frame},
+            }
+            for name, thread_id, start, duration, frame in self.events
+        )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path) -> None:
+        with open(path, "w") as file:
+            json.dump(self.chrome_trace(), file)
+
+
+# Shared by the engine; set VORTEX2D_PROFILE=1 to start with profiling enabled
+_PROFILE_OFF = ("", "0", "false", "no", "off")
+profiler = Profiler(enabled=os.environ.get("VORTEX2D_PROFILE", "").strip().lower() not in _PROFILE_OFF)
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import numpy as np
+from OpenGL.GL import *
+from PIL import Image
+from ecs.Components.Sprite import Sprite
+
+# Bump when the cache layout or packing changes
+CACHE_VERSION = 1
+
+class SkylinePacker:
+    """Bottom-left skyline bin packer for one atlas page."""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        # Segments of the skyline as [x, y, width], left to right
+        self.skyline = [[0, 0, width]]
+
+    def insert(self, width: int, height: int):
+        best = None
+        for index in range(len(self.skyline)):
+            y = self._fit(index, width, height)
+            if y is None:
+                continue
+            x = self.skyline[index][0]
+            if best is None or (y + height, x) < (best[1] + height, best[0]):
+                best = (x, y, index)
+        if best is None:
+            return None
+        x, y, index = best
+        self._add_segment(index, x, y + height, width)
+        return x, y
+
+    def _fit(self, index, width, height):
+        x = self.skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            _, segment_y, segment_width = self.skyline[index]
+            y = max(y, segment_y)
+            if y + height > self.height:
+                return None
+            remaining -= segment_width
+            index += 1
+        return y
+
+    def _add_segment(self, index, x, y, width):
+        self.skyline.insert(index, [x, y, width])
+        right = x + width
+        # Trim or drop the segments now hidden below the new one
+        i = index + 1
+        while i < len(self.skyline):
+            segment = self.skyline[i]
+            if segment[0] >= right:
+                break
+            overlap = right - segment[0]
+            if overlap >= segment[2]:
+                del self.skyline[i]
+                continue
+            segment[0] += overlap
+            segment[2] -= overlap
+            break
+        # Merge neighbours at the same height
+        i = 0
+        while i < len(self.skyline) - 1:
+            if self.skyline[i][1] == self.skyline[i + 1][1]:
+                self.skyline[i][2] += self.skyline[i + 1][2]
+                del self.skyline[i + 1]
+            else:
+                i += 1
+
+
+class AtlasRegion:
+    def __init__(self, page: int, x: int, y: int, width: int, height: int, page_width: int, page_height: int):
+        self.page = page
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.uv = (
+            x / page_width,
+            y / page_height,
+            (x + width) / page_width,
+            (y + height) / page_height,
+        )
+
+
+class TextureAtlas:
+    """Sprite images packed into one or more atlas pages.
+
+    `build` caches the pages and region metadata under `cache_dir`, keyed by
+    a hash of the source files' contents, and only repacks when they change.
+    """
+
+    def __init__(self, pages, regions: dict, page_size):
+        self.pages = pages          # PIL RGBA images
+        self.regions = regions      # name -> AtlasRegion
+        self.page_size = page_size
+        self.textures = []          # OpenGL texture names, filled by upload()
+
+    @classmethod
+    def build(cls, sources, page_size=(2048, 2048), padding: int = 1, cache_dir=None):
+        if not isinstance(sources, dict):
+            sources = cls._name_sources(sources)
+        key = cls._cache_key(sources, page_size, padding)
+        if cache_dir is not None:
+            cached = cls._load_cache(os.path.join(cache_dir, key), page_size)
+            if cached is not None:
+                return cached
+
+        images = {}
+        for name, path in sources.items():
+            with Image.open(path) as image:
+                images[name] = image.convert("RGBA")
+        atlas = cls._pack(images, page_size, padding)
+        if cache_dir is not None:
+            atlas._save_cache(os.path.join(cache_dir, key), key)
+        return atlas
+
+    @staticmethod
+    def _name_sources(paths) -> dict:
+        sources = {}
+        for path in paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name in sources:
+                raise ValueError(
+                    f"Images '{sources[name]}' and '{path}' are both named '{name}'; pass a dict of names instead."
+                )
+            sources[name] = path
+        return sources
+
+    @classmethod
+    def _pack(cls, images: dict, page_size, padding: int):
+        page_width, page_height = page_size
+        # Tallest first keeps the skyline flat
+        order = sorted(images, key=lambda name: (images[name].height, images[name].width), reverse=True)
+        packers = []
+        pages = []
+        regions = {}
+        for name in order:
+            image = images[name]
+            width, height = image.width + padding, image.height + padding
+            if width > page_width or height > page_height:
+                raise ValueError(f"Image '{name}' does not fit in a {page_width}x{page_height} atlas page.")
+            for page, packer in enumerate(packers):
+                position = packer.insert(width, height)
+                if position is not None:
+                    break
+            else:
+                packers.append(SkylinePacker(page_width, page_height))
+                pages.append(Image.new("RGBA", page_size, (0, 0, 0, 0)))
+                page = len(packers) - 1
+                position = packers[page].insert(width, height)
+            x, y = position
+            pages[page].paste(image, (x, y))
+            regions[name] = AtlasRegion(page, x, y, image.width, image.height, page_width, page_height)
+        return cls(pages, regions, page_size)
+
+    @staticmethod
+    def _cache_key(sources: dict, page_size, padding: int) -> str:
+        digest = hashlib.sha1(f"{CACHE_VERSION}:{page_size}:{padding}".encode())
+        for name in sorted(sources):
+            with open(sources[name], "rb") as f:
+                digest.update(name.encode())
+                digest.update(hashlib.sha1(f.read()).digest())
+        return digest.hexdigest()
+
+    @classmethod
+    def _load_cache(cls, path, page_size):
+        metadata_path = os.path.join(path, "atlas.json")
+        if not os.path.isfile(metadata_path):
+            return None
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                metadata = json.load(f)
+            pages = []
+            for filename in metadata["pages"]:
+                with Image.open(os.path.join(path, filename)) as page:
+                    pages.append(page.convert("RGBA"))
+            page_width, page_height = page_size
+            regions = {
+                name: AtlasRegion(page, x, y, width, height, page_width, page_height)
+                for name, (page, x, y, width, height) in metadata["regions"].items()
+            }
+        except (OSError, ValueError, KeyError):
+            # Broken or partly written cache: build() repacks and overwrites it
+            return None
+        return cls(pages, regions, page_size)
+
+    def _save_cache(self, path, key: str) -> None:
+        os.makedirs(path, exist_ok=True)
+        filenames = []
+        for index, page in enumerate(self.pages):
+            filename = f"page_{index}.png"
+            page.save(os.path.join(path, filename))
+            filenames.append(filename)
+        metadata = {
+            "version": CACHE_VERSION,
+            "key": key,
+            "pages": filenames,
+            "regions": {
+                name: [r.page, r.x, r.y, r.width, r.height]
+                for name, r in self.regions.items()
+            },
+        }
+        # Metadata last, so a cache interrupted mid-write is never picked up
+        with open(os.path.join(path, "atlas.json"), "w", encoding="utf-8") as f:
+            json.dump(metadata, f)
+
+    def upload(self) -> list:
+        if self.textures:
+            return self.textures
+        for page in self.pages:
+            texture = glGenTextures(1)
+            glBindTexture(GL_TEXTURE_2D, texture)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+            glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+            data = np.asarray(page, dtype=np.uint8)
+            glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, page.width, page.height, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
+            self.textures.append(texture)
+        glBindTexture(GL_TEXTURE_2D, 0)
+        return self.textures
+
+    def delete(self) -> None:
+        if self.textures:
+            glDeleteTextures(self.textures)
+            self.textures = []
+
+    def sprite(self, name: str) -> Sprite:
+        region = self.regions[name]
+        texture = self.textures[region.page] if self.textures else 0
+        return Sprite(texture=texture, uv=region.uv)
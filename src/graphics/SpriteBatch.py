@@ -0,0 +1,336 @@
+import ctypes
+import numpy as np
+from OpenGL.GL import *
+from ecs.Components.Color import Color, WHITE
+from ecs.Components.Hierarchy import Hierarchy
+from ecs.Components.Sprite import Sprite
+from ecs.Components.Transform import Transform2D, MATRIX_FIELDS, compute_transformation_matrices
+
+# x, y, u, v as float32, then the packed RGBA color as 4 bytes
+VERTEX_SIZE = 5
+VERTEX_STRIDE = VERTEX_SIZE * 4
+
+def pack_sprite_vertices(matrices, sizes, uvs, colors, out=None) -> np.ndarray:
+    """Writes four vertices per sprite, corners ordered (0, 0), (w, 0), (w, h), (0, h).
+
+    `matrices` is (N, 2, 3) or (N, 3, 3), `sizes` (N, 2), `uvs` (N, 4) as
+    (u0, v0, u1, v1) and `colors` (N,) packed colors as stored by `Color`.
+    Returns an (N * 4, VERTEX_SIZE) float32 array, written into `out` when
+    given; the color slot holds the packed bytes, not a float.
+    """
+    matrices = np.asarray(matrices, dtype=np.float32)
+    sizes = np.asarray(sizes, dtype=np.float32)
+    uvs = np.asarray(uvs, dtype=np.float32)
+    count = len(matrices)
+    if out is None:
+        out = np.empty((count * 4, VERTEX_SIZE), dtype=np.float32)
+    vertices = out[:count * 4].reshape(count, 4, VERTEX_SIZE)
+
+    _write_corners(vertices, matrices, sizes)
+    vertices[:, :, 2] = uvs[:, [0, 2, 2, 0]]
+    vertices[:, :, 3] = uvs[:, [1, 1, 3, 3]]
+    vertices.view(np.uint32)[:, :, 4] = np.asarray(colors, dtype=np.uint32)[:, None]
+    return out[:count * 4]
+
+def _write_corners(vertices, matrices, sizes) -> None:
+    # x, y of the four corners of each (N, 4, VERTEX_SIZE) quad
+    width = sizes[:, 0:1]
+    height = sizes[:, 1:2]
+    zero = np.zeros_like(width)
+    local_x = np.hstack((zero, width, width, zero))
+    local_y = np.hstack((zero, zero, height, height))
+    vertices[:, :, 0] = matrices[:, 0, 0:1] * local_x + matrices[:, 0, 1:2] * local_y + matrices[:, 0, 2:3]
+    vertices[:, :, 1] = matrices[:, 1, 0:1] * local_x + matrices[:, 1, 1:2] * local_y + matrices[:, 1, 2:3]
+
+def quad_indices(count: int) -> np.ndarray:
+    # Two triangles per quad: 0-1-2 and 2-3-0
+    base = np.arange(count, dtype=np.uint32)[:, None] * 4
+    return (base + np.array([0, 1, 2, 2, 3, 0], dtype=np.uint32)).ravel()
+
+
+# Component types whose changes and removals make a sprite's quad out of date
+SPRITE_TYPES = (Transform2D, Sprite, Color)
+
+class SpriteBatch:
+    """Draws every entity with `Transform2D` and `Sprite` from one vertex buffer.
+
+    `collect` packs all quads on the CPU, sorted by texture; `draw` uploads
+    them once and issues one draw call per texture. Given a `CullingSystem`,
+    only its visible entities are packed and drawn through its camera.
+
+    Quads are kept per entity between calls and only repacked for entities
+    the manager reports as changed, so `collect` must run every frame before
+    `manager.clear_changes()`; call `invalidate()` after skipping frames.
+
+    Given an `InterpolationSystem` and the loop's `alpha`, sprites that moved
+    in the last fixed step are drawn between their previous and current place.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.capacity = capacity
+        self.vertices = np.zeros((capacity * 4, VERTEX_SIZE), dtype=np.float32)
+        self.count = 0
+        # Entities skipped by the last collect because they were off-screen
+        self.culled = 0
+        # World region mapped to the window, None draws in window pixels
+        self.view = None
+        # (texture, first quad, quad count) per draw call
+        self.batches = []
+        self.vbo = None
+        self.ibo = None
+        self._buffer_capacity = 0
+
+        # Packed quad, size, texture and presence of every collected entity, by entity id
+        self._quads = np.zeros((0, 4, VERTEX_SIZE), dtype=np.float32)
+        self._sizes = np.zeros((0, 2), dtype=np.float32)
+        self._textures = np.zeros(0, dtype=np.int64)
+        self._present = np.zeros(0, dtype=bool)
+        self._collected = 0
+        # Entity ids in vertex order and the quad position of each id, kept while nothing is culled
+        self._order = None
+        self._positions = np.zeros(0, dtype=np.int64)
+        self._manager = None
+        # Entity ids drawn at an interpolated place by the last collect
+        self._blended = np.empty(0, dtype=np.int64)
+
+    def invalidate(self) -> None:
+        # Repacks every sprite on the next collect
+        self._manager = None
+
+    def collect(self, manager, hierarchy=None, culling=None, interpolation=None, alpha: float = 1.0) -> int:
+        query = manager.query(Transform2D, Sprite)
+        self._reserve(len(manager.allocator.generations))
+        dirty = None
+        if manager is self._manager:
+            dirty = self._update(manager, query, hierarchy)
+        if manager is not self._manager or self._collected != len(query):
+            # First collect, another manager or missed changes: repack everything
+            self._manager = manager
+            self._present[:] = False
+            self._collected = 0
+            self._order = None
+            self._repack(manager, query, hierarchy, None)
+
+        if culling is not None and culling.visible is not None:
+            entity_ids = np.fromiter(culling.visible, dtype=np.int64, count=len(culling.visible))
+            entity_ids = entity_ids[entity_ids < len(self._present)]
+            entity_ids = np.sort(entity_ids[self._present[entity_ids]])
+            self.view = culling.view
+            self._order = None
+            order = entity_ids[np.argsort(self._textures[entity_ids], kind="stable")]
+        else:
+            self.view = None
+            order = self._order
+            if order is None:
+                entity_ids = np.flatnonzero(self._present)
+                order = entity_ids[np.argsort(self._textures[entity_ids], kind="stable")]
+        count = len(order)
+        self.culled = len(query) - count
+        if count > self.capacity:
+            while self.capacity < count:
+                self.capacity *= 2
+            self.vertices = np.zeros((self.capacity * 4, VERTEX_SIZE), dtype=np.float32)
+            self._order = None
+
+        quads = self.vertices.reshape(-1, 4, VERTEX_SIZE)
+        if order is self._order:
+            # Same sprites in the same order: only rewrite the quads that changed
+            changed_ids = np.flatnonzero(dirty & self._present)
+            quads[self._positions[changed_ids]] = self._quads[changed_ids]
+            # and put the ones drawn interpolated last time back in place
+            blended = self._blended[self._present[self._blended]]
+            quads[self._positions[blended]] = self._quads[blended]
+            positions = self._positions
+        else:
+            quads[:count] = self._quads[order]
+            self.batches = self._split_batches(self._textures[order])
+            if culling is None or culling.visible is None:
+                self._order = order
+                self._positions[order] = np.arange(count)
+                positions = self._positions
+            else:
+                positions = np.full(len(self._present), -1, dtype=np.int64)
+                positions[order] = np.arange(count)
+        self._blended = np.empty(0, dtype=np.int64)
+        if interpolation is not None:
+            self._interpolate(interpolation, alpha, quads, positions)
+        self.count = count
+        return count
+
+    def _interpolate(self, interpolation, alpha, quads, positions) -> None:
+        entity_ids = interpolation.moving
+        entity_ids = entity_ids[entity_ids < len(self._present)]
+        entity_ids = entity_ids[self._present[entity_ids]]
+        entity_ids = entity_ids[positions[entity_ids] >= 0]
+        if len(entity_ids) == 0:
+            return
+        blended = quads[positions[entity_ids]]
+        _write_corners(blended, interpolation.blend(entity_ids, alpha), self._sizes[entity_ids])
+        quads[positions[entity_ids]] = blended
+        self._blended = entity_ids
+
+    def _update(self, manager, query, hierarchy) -> np.ndarray:
+        # Repacks the entities reported as changed, returns them as a mask by entity id
+        changed = set()
+        types = SPRITE_TYPES + ((Hierarchy,) if hierarchy is not None else ())
+        for component_type in types:
+            changed |= manager.get_changed_entities(component_type)
+            changed |= manager.get_removed_entities(component_type)
+        if hierarchy is not None:
+            changed.update(hierarchy.world_changed.tolist())
+        dirty = np.zeros(len(self._present), dtype=bool)
+        dirty[list(changed)] = True
+
+        # Entities that left the query
+        gone = [entity_id for entity_id in changed if self._present[entity_id] and entity_id not in query]
+        if gone:
+            self._present[gone] = False
+            self._collected -= len(gone)
+            self._order = None
+        if changed:
+            self._repack(manager, query, hierarchy, dirty)
+        return dirty
+
+    def _repack(self, manager, query, hierarchy, dirty) -> None:
+        if manager.storage == "archetype":
+            self._repack_archetypes(manager, hierarchy, dirty)
+        else:
+            self._repack_objects(manager, query, hierarchy, dirty)
+
+    def _reserve(self, size: int) -> None:
+        if size <= len(self._present):
+            return
+        size = max(size, 2 * len(self._present), 64)
+        extra = size - len(self._present)
+        self._quads = np.concatenate((self._quads, np.zeros((extra, 4, VERTEX_SIZE), dtype=np.float32)))
+        self._sizes = np.concatenate((self._sizes, np.zeros((extra, 2), dtype=np.float32)))
+        self._textures = np.concatenate((self._textures, np.zeros(extra, dtype=np.int64)))
+        self._present = np.concatenate((self._present, np.zeros(extra, dtype=bool)))
+        self._positions = np.concatenate((self._positions, np.zeros(extra, dtype=np.int64)))
+
+    def _repack_archetypes(self, manager, hierarchy, dirty) -> None:
+        # Whole columns per archetype, only the dirty rows when given
+        for archetype in manager.get_archetypes_with_components(Transform2D, Sprite):
+            entity_ids = archetype.entity_ids()
+            if dirty is None:
+                rows = slice(None)
+            else:
+                rows = np.flatnonzero(dirty[entity_ids])
+                if len(rows) == 0:
+                    continue
+
+            def column(component_type, name):
+                return archetype.column(component_type, name)[rows]
+
+            matrices = compute_transformation_matrices(
+                **{name: column(Transform2D, name) for name in MATRIX_FIELDS}, affine=True
+            )
+            sizes = np.stack((column(Transform2D, "width"), column(Transform2D, "height")), axis=1)
+            uvs = np.stack([column(Sprite, name) for name in ("u0", "v0", "u1", "v1")], axis=1)
+            selected = entity_ids[rows]
+            if Color in archetype.component_types:
+                tints = column(Color, "packed")
+            else:
+                tints = np.full(len(selected), WHITE, dtype=np.uint32)
+            self._store(selected, column(Sprite, "texture"), matrices, sizes, uvs, tints, hierarchy)
+
+    def _repack_objects(self, manager, query, hierarchy, dirty) -> None:
+        if dirty is None:
+            entity_ids = list(query)
+        else:
+            entity_ids = [entity_id for entity_id in np.flatnonzero(dirty).tolist() if entity_id in query]
+            if not entity_ids:
+                return
+        count = len(entity_ids)
+        transforms = [manager.components[Transform2D][entity_id] for entity_id in entity_ids]
+        sprites = [manager.components[Sprite][entity_id] for entity_id in entity_ids]
+        colors = manager.components[Color]
+
+        textures = np.fromiter((sprite.texture for sprite in sprites), dtype=np.int64, count=count)
+        matrices = Transform2D.get_transformation_matrices(transforms, affine=True)
+        sizes = np.array([(t.width, t.height) for t in transforms], dtype=np.float32).reshape(count, 2)
+        uvs = np.array([sprite.uv for sprite in sprites], dtype=np.float32).reshape(count, 4)
+        tints = np.fromiter(
+            (colors[entity_id].packed if entity_id in colors else WHITE for entity_id in entity_ids),
+            dtype=np.uint32, count=count,
+        )
+        self._store(np.array(entity_ids, dtype=np.int64), textures, matrices, sizes, uvs, tints, hierarchy)
+
+    def _store(self, entity_ids, textures, matrices, sizes, uvs, tints, hierarchy) -> None:
+        if hierarchy is not None:
+            # Children use the world matrices computed by the HierarchySystem
+            rows = np.fromiter((hierarchy.rows.get(entity_id, -1) for entity_id in entity_ids.tolist()), dtype=np.int64, count=len(entity_ids))
+            attached = rows >= 0
+            matrices[attached] = hierarchy.world[rows[attached], :2]
+
+        added = ~self._present[entity_ids]
+        textures = textures.astype(np.int64)
+        if added.any() or (self._textures[entity_ids] != textures).any():
+            self._order = None
+        self._collected += int(added.sum())
+        self._present[entity_ids] = True
+        self._sizes[entity_ids] = sizes
+        self._textures[entity_ids] = textures
+        self._quads[entity_ids] = pack_sprite_vertices(matrices, sizes, uvs, tints).reshape(-1, 4, VERTEX_SIZE)
+
+    def draw(self, width: int, height: int) -> None:
+        if self.count == 0:
+            return
+        if self.vbo is None:
+            self.vbo = glGenBuffers(1)
+            self.ibo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ibo)
+        if self._buffer_capacity != self.capacity:
+            # Reallocate only when the CPU side grew, otherwise stream into the same storage
+            glBufferData(GL_ARRAY_BUFFER, self.vertices.nbytes, None, GL_DYNAMIC_DRAW)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, quad_indices(self.capacity), GL_STATIC_DRAW)
+            self._buffer_capacity = self.capacity
+        glBufferSubData(GL_ARRAY_BUFFER, 0, self.count * 4 * VERTEX_STRIDE, self.vertices)
+
+        glMatrixMode(GL_PROJECTION)
+        glLoadIdentity()
+        if self.view is None:
+            glOrtho(0, width, height, 0, -1, 1)
+        else:
+            x_min, y_min, x_max, y_max = self.view
+            glOrtho(x_min, x_max, y_max, y_min, -1, 1)
+        glMatrixMode(GL_MODELVIEW)
+        glLoadIdentity()
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, VERTEX_STRIDE, ctypes.c_void_p(8))
+        glColorPointer(4, GL_UNSIGNED_BYTE, VERTEX_STRIDE, ctypes.c_void_p(16))
+
+        for texture, first, count in self.batches:
+            if texture:
+                glEnable(GL_TEXTURE_2D)
+                glBindTexture(GL_TEXTURE_2D, texture)
+            else:
+                glDisable(GL_TEXTURE_2D)
+            glDrawElements(GL_TRIANGLES, count * 6, GL_UNSIGNED_INT, ctypes.c_void_p(first * 6 * 4))
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def delete(self) -> None:
+        if self.vbo is not None:
+            glDeleteBuffers(2, [self.vbo, self.ibo])
+            self.vbo = self.ibo = None
+            self._buffer_capacity = 0
+
+    @staticmethod
+    def _split_batches(textures) -> list:
+        if len(textures) == 0:
+            return []
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(textures)) + 1))
+        ends = np.append(starts[1:], len(textures))
+        return [(int(textures[start]), int(start), int(end - start)) for start, end in zip(starts, ends)]
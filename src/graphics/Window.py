@@ -1,6 +1,7 @@
 import glfw
 from OpenGL.GL import *
 from ecs.Components.Color import Color
+from engine.Profiler import profiler
 
 class Window:
     def __init__(
@@ -20,6 +21,8 @@ class Window:
         self.bg_color = bg_color if bg_color else Color('#000000')
         self.window = None
         self.monitor = None
+        # Objects with draw(width, height), called every update between clear and swap
+        self.renderers = []
 
     def initialize(self) -> None:
         if not glfw.init():
@@ -43,15 +46,36 @@ class Window:
         glViewport(0, 0, self.width, self.height)
 
     def set_background_color(self, color: Color) -> None:
-        rgb = color.rgb
-        glClearColor(rgb[0]/255.0, rgb[1]/255.0, rgb[2]/255.0, 1.0)
+        glClearColor(*color.floats)
 
     def should_close(self) -> bool:
         return glfw.window_should_close(self.window)
 
+    def add_renderer(self, renderer) -> None:
+        self.renderers.append(renderer)
+
+    def remove_renderer(self, renderer) -> None:
+        self.renderers.remove(renderer)
+
+    @profiler.profile
     def update(self) -> None:
+        self.render()
+        self.swap_buffers()
+        self.poll_events()
+
+    # Steps of update(), for loops that time or order them separately
+    @profiler.profile
+    def render(self) -> None:
         glClear(GL_COLOR_BUFFER_BIT)
+        for renderer in self.renderers:
+            renderer.draw(self.width, self.height)
+
+    @profiler.profile
+    def swap_buffers(self) -> None:
         glfw.swap_buffers(self.window)
+
+    @profiler.profile
+    def poll_events(self) -> None:
         glfw.poll_events()
 
     def terminate(self) -> None:
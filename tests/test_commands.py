@@ -0,0 +1,36 @@
+import pytest
+from ecs.Components.Transform import Transform2D
+from ecs.Components.Vector import Vector2D
+from ecs.Manager import ECSManager
+
+
+@pytest.fixture(params=["dict", "archetype"])
+def manager(request):
+    return ECSManager(storage=request.param)
+
+
+def test_double_despawn_does_not_drop_later_commands(manager):
+    entity = manager.spawn(1, [Transform2D(0, 0)])[0]
+    manager.commands.despawn([entity])
+    manager.commands.despawn([entity])
+    spawned = manager.commands.spawn(3, [Transform2D(1, 2)])
+    manager.flush()
+
+    assert not manager.is_alive(entity)
+    assert len(manager.commands) == 0
+    for new in spawned:
+        assert manager.is_alive(new)
+        assert manager.get_component(new, Transform2D).x == 1
+    assert set(manager.query(Transform2D)) == {new.id for new in spawned}
+
+
+def test_commands_for_dead_entities_do_nothing(manager):
+    entity = manager.spawn(1, [Transform2D(0, 0)])[0]
+    manager.despawn([entity])
+    manager.commands.add_component(entity, Vector2D(1, 1))
+    manager.commands.remove_component(entity, Transform2D)
+    spawned = manager.commands.spawn(1, [Transform2D(5, 5)])
+    manager.flush()
+
+    assert manager.get_component(spawned[0], Transform2D).x == 5
+    assert len(manager.query(Vector2D)) == 0
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+from ecs.Components.Sprite import Sprite
+from ecs.Components.Transform import Transform2D
+from ecs.Manager import ECSManager
+from ecs.Systems.Interpolation import InterpolationSystem
+from engine.GameLoop import GameLoop
+from graphics.SpriteBatch import SpriteBatch
+
+
+class FakeWindow:
+    def should_close(self):
+        return False
+
+    def poll_events(self):
+        pass
+
+    def render(self):
+        pass
+
+    def swap_buffers(self):
+        pass
+
+
+@pytest.fixture(params=["dict", "archetype"])
+def manager(request):
+    return ECSManager(storage=request.param)
+
+
+def positions(batch):
+    return batch.vertices[:batch.count * 4, :2].copy()
+
+
+def test_blend_is_halfway_between_steps(manager):
+    entity = manager.spawn(1, [Transform2D(0, 0, width=10, height=10)])[0]
+    interpolation = InterpolationSystem()
+    interpolation.update(manager)
+    transform = manager.get_component(entity, Transform2D)
+    transform.x = 10
+    transform.rotation = 90
+    interpolation.update(manager)
+
+    assert interpolation.moving.tolist() == [entity.id]
+    previous = interpolation.previous[entity.id]
+    current = interpolation.current[entity.id]
+    np.testing.assert_allclose(interpolation.blend([entity.id], 0.5)[0], (previous + current) / 2, atol=1e-6)
+
+
+def test_collect_draws_moving_sprites_halfway(manager):
+    moving, still = manager.spawn(1, [Transform2D(0, 0, width=10, height=20), Sprite()]) + \
+        manager.spawn(1, [Transform2D(50, 50, width=10, height=10), Sprite()])
+    interpolation = InterpolationSystem()
+    batch = SpriteBatch()
+    interpolation.update(manager)
+    batch.collect(manager)
+    before = positions(batch)
+    manager.clear_changes()
+
+    transform = manager.get_component(moving, Transform2D)
+    transform.x, transform.y, transform.scale_x = 30, 10, 2
+    interpolation.update(manager)
+    batch.collect(manager)
+    after = positions(batch)
+
+    batch.invalidate()
+    batch.collect(manager, interpolation=interpolation, alpha=0.5)
+    np.testing.assert_allclose(positions(batch), (before + after) / 2, atol=1e-4)
+    manager.clear_changes()
+
+    # Quads blended by the last collect go back in place once nothing moves
+    interpolation.update(manager)
+    batch.collect(manager, interpolation=interpolation, alpha=0.5)
+    np.testing.assert_allclose(positions(batch), after, atol=1e-4)
+
+
+def test_recycled_ids_are_not_blended(manager):
+    entity = manager.spawn(1, [Transform2D(0, 0)])[0]
+    interpolation = InterpolationSystem()
+    interpolation.update(manager)
+    manager.despawn([entity])
+    recycled = manager.spawn(1, [Transform2D(100, 100)])[0]
+    assert recycled.id == entity.id
+    interpolation.update(manager)
+
+    assert len(interpolation.moving) == 0
+
+
+def test_game_loop_renders_between_steps(manager):
+    entity = manager.spawn(1, [Transform2D(0, 0, width=10, height=10), Sprite()])[0]
+    transform = manager.get_component(entity, Transform2D)
+    interpolation = InterpolationSystem()
+    batch = SpriteBatch()
+    loop = GameLoop(FakeWindow(), manager, fixed_dt=0.1, interpolation=interpolation)
+
+    def move(dt):
+        transform.x += 10
+
+    drawn = []
+    loop.add_system(move)
+    loop.add_renderer(lambda alpha: drawn.append(
+        (alpha, batch.collect(manager, interpolation=interpolation, alpha=alpha), positions(batch))
+    ))
+    loop.step(0.1)
+    loop.step(0.15)
+
+    alpha, count, vertices = drawn[-1]
+    assert alpha == pytest.approx(0.5)
+    assert count == 1
+    # Between x=10 after the first step and x=20 after the second
+    np.testing.assert_allclose(vertices[:, 0], [15, 25, 25, 15], atol=1e-4)
+    np.testing.assert_allclose(vertices[:, 1], [0, 0, 10, 10], atol=1e-4)
+
+
+def test_interpolation_needs_a_manager():
+    with pytest.raises(ValueError):
+        GameLoop(FakeWindow(), None, interpolation=InterpolationSystem())
+
@@ -0,0 +1,96 @@
+import pytest
+from ecs.Components.Primitives import Box2D
+from ecs.Components.RigidBody import RigidBody
+from ecs.Components.Transform import Transform2D
+from ecs.Manager import ECSManager
+from ecs.Systems.Physics import PhysicsSystem
+
+DT = 1 / 60
+
+
+@pytest.fixture(params=["dict", "archetype"])
+def manager(request):
+    return ECSManager(storage=request.param)
+
+
+def spawn_box(manager, mass=1):
+    return manager.spawn(1, [Transform2D(0, 0, width=10, height=10), RigidBody(mass=mass), Box2D((0, 0), (10, 10))])[0]
+
+
+def test_changed_rigid_body_is_rebuilt_once_per_frame(manager):
+    physics = PhysicsSystem(gravity=(0, 600))
+    entity = spawn_box(manager)
+    physics.update(manager, DT)
+    manager.clear_changes()
+
+    manager.get_component(entity, RigidBody).mass = 2
+    bodies = []
+    for _ in range(3):
+        physics.update(manager, DT)
+        bodies.append(physics.get_body(entity.id))
+
+    assert bodies[0] is bodies[1] is bodies[2]
+    assert bodies[0].mass == 2
+    # Three steps of gravity since the rebuild, not one
+    assert bodies[0].velocity.y == pytest.approx(3 * 600 * DT)
+
+
+def test_rigid_body_changed_again_in_the_same_frame_is_rebuilt(manager):
+    physics = PhysicsSystem()
+    entity = spawn_box(manager)
+    physics.update(manager, DT)
+    manager.clear_changes()
+
+    rigid_body = manager.get_component(entity, RigidBody)
+    rigid_body.mass = 2
+    physics.update(manager, DT)
+    rigid_body.mass = 5
+    physics.update(manager, DT)
+
+    assert physics.get_body(entity.id).mass == 5
+
+
+def test_replaced_primitive_rebuilds_the_body(manager):
+    physics = PhysicsSystem()
+    entity = spawn_box(manager)
+    physics.update(manager, DT)
+    body = physics.get_body(entity.id)
+    manager.clear_changes()
+
+    manager.add_component(entity, Box2D((0, 0), (20, 20)))
+    physics.update(manager, DT)
+    physics.update(manager, DT)
+
+    assert physics.get_body(entity.id) is not body
+    assert len(physics.space.bodies) == 1
+
+
+def test_recycled_id_gets_a_new_body(manager):
+    physics = PhysicsSystem(gravity=(0, 600))
+    entity = spawn_box(manager)
+    for _ in range(5):
+        physics.update(manager, DT)
+    manager.clear_changes()
+
+    manager.despawn([entity])
+    recycled = spawn_box(manager)
+    assert recycled.id == entity.id
+    physics.update(manager, DT)
+
+    # One step of gravity, not the six the old body had
+    assert physics.get_body(recycled.id).velocity.y == pytest.approx(600 * DT)
+    assert len(physics.space.bodies) == 1
+
+
+def test_body_is_removed_with_its_rigid_body(manager):
+    physics = PhysicsSystem()
+    entity = spawn_box(manager)
+    physics.update(manager, DT)
+    manager.clear_changes()
+
+    manager.remove_component(entity, RigidBody)
+    physics.update(manager, DT)
+    physics.update(manager, DT)
+
+    assert physics.get_body(entity.id) is None
+    assert len(physics.space.bodies) == 0
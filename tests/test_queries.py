@@ -0,0 +1,58 @@
+import threading
+import time
+import pytest
+import ecs.Manager
+from ecs.Components.Transform import Transform2D
+from ecs.Components.Vector import Vector2D
+from ecs.Manager import ECSManager
+from ecs.Query import Query
+from ecs.Scheduler import Scheduler
+
+
+@pytest.fixture(params=["dict", "archetype"])
+def manager(request):
+    return ECSManager(storage=request.param)
+
+
+class SlowQuery(Query):
+    def __init__(self, component_types):
+        # Widens the window between the cache check and the insert
+        time.sleep(0.01)
+        super().__init__(component_types)
+
+
+class QuerySystem:
+    reads = ()
+    writes = ()
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+        self.query = None
+
+    def update(self, manager, dt):
+        self.barrier.wait()
+        self.query = manager.query(Transform2D, Vector2D)
+
+
+def test_concurrent_systems_share_one_query(manager, monkeypatch):
+    monkeypatch.setattr(ecs.Manager, "Query", SlowQuery)
+    entity = manager.spawn(1, [Transform2D(0, 0), Vector2D(1, 1)])[0]
+    barrier = threading.Barrier(8)
+    systems = [QuerySystem(barrier) for _ in range(8)]
+    scheduler = Scheduler(manager, max_workers=8)
+    for system in systems:
+        scheduler.add_system(system)
+    assert len(scheduler.stages) == 1
+    scheduler.run()
+    scheduler.shutdown()
+
+    query = systems[0].query
+    assert all(system.query is query for system in systems)
+    assert manager._queries_by_type[Transform2D] == [query]
+    assert manager._queries_by_type[Vector2D] == [query]
+    assert set(query) == {entity.id}
+
+    # The shared query is the one kept up to date
+    added = manager.spawn(1, [Transform2D(0, 0)])[0]
+    manager.add_component(added, Vector2D(0, 0))
+    assert set(query) == {entity.id, added.id}
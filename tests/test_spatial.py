@@ -0,0 +1,37 @@
+import pytest
+from ecs.Components.Primitives import Box2D, Circle2D
+from ecs.Manager import ECSManager
+from ecs.Systems.Spatial import SpatialIndexSystem
+
+
+@pytest.fixture(params=["dict", "archetype"])
+def manager(request):
+    return ECSManager(storage=request.param)
+
+
+def test_recycled_id_with_another_primitive_type_stays_indexed(manager):
+    spatial = SpatialIndexSystem()
+    circle = manager.spawn(1, [Circle2D((0, 0), 5)])[0]
+    spatial.update(manager)
+    manager.clear_changes()
+
+    manager.despawn([circle])
+    box = manager.spawn(1, [Box2D((100, 100), (110, 110))])[0]
+    assert box.id == circle.id
+    spatial.update(manager)
+
+    assert box.id in spatial.index
+    assert spatial.query_point(105, 105) == [box.id]
+    assert spatial.query_point(0, 0) == []
+
+
+def test_removed_primitive_leaves_the_index(manager):
+    spatial = SpatialIndexSystem()
+    entity = manager.spawn(1, [Circle2D((0, 0), 5)])[0]
+    spatial.update(manager)
+    manager.clear_changes()
+
+    manager.despawn([entity])
+    spatial.update(manager)
+
+    assert entity.id not in spatial.index
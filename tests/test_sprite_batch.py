@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from ecs.Components.Color import pack_rgba, WHITE
+from ecs.Components.Sprite import Sprite
+from ecs.Components.Transform import Transform2D
+from ecs.Manager import ECSManager
+from graphics.SpriteBatch import SpriteBatch, VERTEX_SIZE, pack_sprite_vertices
+
+RED = pack_rgba(255, 0, 0, 128)
+
+
+def pack(transforms, uvs, colors):
+    matrices = Transform2D.get_transformation_matrices(transforms, affine=True)
+    sizes = [(t.width, t.height) for t in transforms]
+    return pack_sprite_vertices(matrices, sizes, uvs, colors)
+
+
+def test_pack_sprite_vertices():
+    transforms = [
+        # Plain sprite: corners offset by the position
+        Transform2D(10, 20, width=4, height=2),
+        # Rotated by 90 degrees around its top-left corner, scaled (2, 3)
+        Transform2D(100, 50, width=10, height=20, rotation=90, scale_x=2, scale_y=3, pivot_x=0, pivot_y=0),
+    ]
+    uvs = [(0.0, 0.0, 1.0, 1.0), (0.25, 0.5, 0.75, 1.0)]
+    vertices = pack(transforms, uvs, [WHITE, RED])
+
+    assert vertices.shape == (8, VERTEX_SIZE)
+    assert vertices.dtype == np.float32
+    np.testing.assert_allclose(vertices[:, :4], [
+        [10, 20, 0.0, 0.0],
+        [14, 20, 1.0, 0.0],
+        [14, 22, 1.0, 1.0],
+        [10, 22, 0.0, 1.0],
+        [100, 50, 0.25, 0.5],
+        [100, 70, 0.75, 0.5],
+        [40, 70, 0.75, 1.0],
+        [40, 50, 0.25, 1.0],
+    ], atol=1e-4)
+    np.testing.assert_array_equal(vertices.view(np.uint32)[:, 4], [WHITE] * 4 + [RED] * 4)
+    assert vertices.view(np.uint8).reshape(8, VERTEX_SIZE * 4)[4, 16:].tolist() == [255, 0, 0, 128]
+
+
+def test_pack_sprite_vertices_accepts_full_matrices_and_out():
+    transforms = [Transform2D(0, 0, width=8, height=8, rotation=180)]
+    out = np.zeros((4, VERTEX_SIZE), dtype=np.float32)
+    vertices = pack_sprite_vertices(
+        Transform2D.get_transformation_matrices(transforms), [(8, 8)], [(0, 0, 1, 1)], [WHITE], out=out
+    )
+
+    assert np.shares_memory(vertices, out)
+    # Half a turn around the center maps each corner to the opposite one
+    np.testing.assert_allclose(vertices[:, :2], [[8, 8], [0, 8], [0, 0], [8, 0]], atol=1e-4)
+
+
+@pytest.mark.parametrize("storage", ["dict", "archetype"])
+def test_collect_packs_the_same_vertices(storage):
+    manager = ECSManager(storage=storage)
+    manager.spawn(1, [
+        Transform2D(100, 50, width=10, height=20, rotation=90, scale_x=2, scale_y=3, pivot_x=0, pivot_y=0),
+        Sprite(uv=(0.25, 0.5, 0.75, 1.0)),
+    ])
+    batch = SpriteBatch()
+
+    assert batch.collect(manager) == 1
+    np.testing.assert_allclose(batch.vertices[:4, :2], [[100, 50], [100, 70], [40, 70], [40, 50]], atol=1e-4)
+    np.testing.assert_allclose(batch.vertices[:4, 2:4], [[0.25, 0.5], [0.75, 0.5], [0.75, 1.0], [0.25, 1.0]])
+    np.testing.assert_array_equal(batch.vertices[:4].view(np.uint32)[:, 4], [WHITE] * 4)